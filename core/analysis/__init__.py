@@ -0,0 +1,65 @@
+"""
+Analysis package - Project scanning and analysis helpers used by the AI generator
+"""
+
+from .walker import ProjectWalker, DEFAULT_EXCLUDED_DIRS, DEFAULT_PARALLEL_MIN_DIRS
+from .ignore_rules import IgnoreRules, IgnoreFile, load_ignore_file
+from .project_index import ProjectIndex, ProjectIndexCache
+from .analysis_memo import AnalysisMemo
+from .budget import AnalysisBudget, extrapolate_file_count, mark_truncated
+from .language_detector import LanguageDetector, LANGUAGE_MAP, FILENAME_MAP
+from .manifest_parser import ManifestCache, parse_manifest, manifest_kind, MANIFEST_ECOSYSTEMS
+from .line_counter import LineCounter
+from .project_stats import ProjectStats, CompactPathList, DEFAULT_SAMPLE_SIZE, DATA_LANGUAGES
+from .project_watcher import ProjectWatcher
+from .workspaces import detect_packages, PACKAGE_MANIFESTS
+from .structure_summary import StructureSummary
+from .git_index import GitIndexReader, parse_git_index, find_git_dir
+from .symbol_extractor import SymbolExtractor, summarize_symbols, SYMBOL_LANGUAGES
+from .glob_suggester import GlobSuggester, glob_to_regex, split_glob
+from .fingerprint import FingerprintBuilder, FingerprintCache, project_fingerprint
+from .project_analyzer import ProjectAnalyzer
+
+__all__ = [
+    'ProjectWalker',
+    'DEFAULT_EXCLUDED_DIRS',
+    'DEFAULT_PARALLEL_MIN_DIRS',
+    'IgnoreRules',
+    'IgnoreFile',
+    'load_ignore_file',
+    'ProjectIndex',
+    'ProjectIndexCache',
+    'AnalysisMemo',
+    'ProjectStats',
+    'CompactPathList',
+    'LanguageDetector',
+    'LANGUAGE_MAP',
+    'FILENAME_MAP',
+    'ManifestCache',
+    'parse_manifest',
+    'manifest_kind',
+    'MANIFEST_ECOSYSTEMS',
+    'DEFAULT_SAMPLE_SIZE',
+    'DATA_LANGUAGES',
+    'LineCounter',
+    'AnalysisBudget',
+    'extrapolate_file_count',
+    'mark_truncated',
+    'ProjectWatcher',
+    'detect_packages',
+    'PACKAGE_MANIFESTS',
+    'StructureSummary',
+    'GitIndexReader',
+    'parse_git_index',
+    'find_git_dir',
+    'SymbolExtractor',
+    'summarize_symbols',
+    'SYMBOL_LANGUAGES',
+    'GlobSuggester',
+    'glob_to_regex',
+    'split_glob',
+    'FingerprintBuilder',
+    'FingerprintCache',
+    'project_fingerprint',
+    'ProjectAnalyzer'
+]
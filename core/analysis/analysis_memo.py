@@ -0,0 +1,54 @@
+"""
+Analysis Memo Module - Reuse project analysis between generations
+Keeps the last analysis per project and reuses it while the project's fingerprint is unchanged
+"""
+
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class AnalysisMemo:
+    """
+    Last analysis per (project path, settings) key together with its fingerprint
+    
+    The fingerprint hashes the paths, sizes and mtimes of the files the
+    analysis covers (see ProjectAnalyzer.project_fingerprint), so added,
+    removed and edited files all make the memoized analysis stale.
+    """
+    
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[Optional[str], Dict, Optional[int]]] = {}
+    
+    def get(self, key: Hashable, fingerprint: Optional[str] = None,
+            version: Optional[int] = None) -> Optional[Dict]:
+        """
+        Return the memoized analysis if the project has not changed since it was made
+        
+        When a live watcher's version is given and matches the one stored with
+        the analysis, no fingerprint is needed. Otherwise the project's current
+        fingerprint must match the stored one; a mismatch drops the entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_fingerprint, project_info, stored_version = entry
+        if version is not None and version == stored_version:
+            return project_info
+        if fingerprint is None:
+            return None
+        if fingerprint != stored_fingerprint:
+            del self._entries[key]
+            return None
+        return project_info
+    
+    def put(self, key: Hashable, project_info: Dict, fingerprint: Optional[str],
+            version: Optional[int] = None):
+        """Remember an analysis and the fingerprint of the files it was computed from"""
+        self._entries.pop(key, None)
+        self._entries[key] = (fingerprint, project_info, version)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+    
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,68 @@
+"""
+Budget Module - Wall-clock and file-count limits for project analysis
+"""
+
+import time
+from typing import Dict, Optional
+
+
+class AnalysisBudget:
+    """Tracks elapsed time and reported files against optional limits"""
+    
+    def __init__(self, max_seconds: Optional[float] = None, max_files: Optional[int] = None):
+        # Zero or negative limits mean "unlimited", matching the settings dialog convention
+        self.max_seconds = max_seconds if max_seconds and max_seconds > 0 else None
+        self.max_files = max_files if max_files and max_files > 0 else None
+        self.started = time.monotonic()
+        self.files = 0
+        self.reason: Optional[str] = None
+    
+    @property
+    def is_limited(self) -> bool:
+        return self.max_seconds is not None or self.max_files is not None
+    
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    def expired(self) -> bool:
+        """
+        Check the limits; the first limit that runs out is remembered in reason
+        
+        The file limit only runs out once a file beyond max_files was charged,
+        so a tree with exactly max_files files is still analyzed completely.
+        """
+        if self.reason is not None:
+            return True
+        if self.max_files is not None and self.files > self.max_files:
+            self.reason = 'max_files'
+        elif self.max_seconds is not None and self.elapsed >= self.max_seconds:
+            self.reason = 'max_seconds'
+        return self.reason is not None
+    
+    def charge_file(self) -> bool:
+        """Count one file before using it; returns False if it is over the budget"""
+        self.files += 1
+        return not self.expired()
+
+
+def extrapolate_file_count(file_count: int, visited_dirs: int, pending_dirs: int) -> int:
+    """
+    Estimate the total file count of a walk that stopped early
+    
+    Assumes the unvisited directories hold as many files on average as the
+    visited ones. Pending directories can hide whole subtrees, so this leans
+    towards underestimating.
+    """
+    if visited_dirs <= 0:
+        return file_count
+    return int(round(file_count * (visited_dirs + pending_dirs) / visited_dirs))
+
+
+def mark_truncated(project_info: Dict, budget: AnalysisBudget, visited_dirs: int, pending_dirs: int):
+    """Flag a partial analysis and add the extrapolated file count"""
+    project_info['truncated'] = True
+    project_info['truncated_reason'] = budget.reason
+    project_info['estimated_file_count'] = extrapolate_file_count(
+        project_info.get('file_count', 0), visited_dirs, pending_dirs
+    )
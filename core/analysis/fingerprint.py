@@ -0,0 +1,140 @@
+"""
+Fingerprint Module - Merkle hash of a project tree
+Hashes file names, sizes and mtimes per directory and combines the directory hashes bottom-up
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .project_index import current_stat
+from .walker import ProjectWalker
+
+
+class FingerprintCache:
+    """
+    Per-directory digests of the last fingerprint of one tree
+    
+    A directory whose files have the same names, sizes and mtimes as last
+    time reuses its files digest instead of hashing them again.
+    """
+    
+    def __init__(self):
+        self._files: Dict[str, Tuple[Tuple[Tuple[str, int, int], ...], bytes]] = {}
+        self.digests: Dict[str, str] = {}
+        self.rehashed = 0
+        self.reused = 0
+    
+    def files_digest(self, rel_dir: str, files: Tuple[Tuple[str, int, int], ...]) -> bytes:
+        cached = self._files.get(rel_dir)
+        if cached is not None and cached[0] == files:
+            self.reused += 1
+            return cached[1]
+        
+        digest = hashlib.sha1()
+        for name, size, mtime_ns in files:
+            digest.update(f"f{name}\0{size}\0{mtime_ns}\n".encode('utf-8', 'surrogateescape'))
+        result = digest.digest()
+        self._files[rel_dir] = (files, result)
+        self.rehashed += 1
+        return result
+    
+    def retain(self, rel_dirs):
+        """Forget directories that are no longer part of the tree"""
+        self._files = {rel_dir: entry for rel_dir, entry in self._files.items() if rel_dir in rel_dirs}
+
+
+class FingerprintBuilder:
+    """
+    Collects the files of a walk as they are reported, for project_fingerprint
+    and for analyses that fingerprint the files they see in the same pass
+    """
+    
+    def __init__(self):
+        self.files_by_dir: Dict[str, List[Tuple[str, int, int]]] = {}
+    
+    def add_file(self, rel_path: str, entry):
+        """Record a file's name, size and mtime (from a fresh stat, index entries may be stale)"""
+        try:
+            stat = current_stat(entry)
+        except OSError:
+            return
+        rel_dir, _, name = rel_path.rpartition('/')
+        self.files_by_dir.setdefault(rel_dir, []).append((name, stat.st_size, stat.st_mtime_ns))
+    
+    def digest(self, rel_dirs: Iterable[str], cache: Optional[FingerprintCache] = None,
+               start_dir: str = '') -> str:
+        """
+        Merkle hash of the recorded files
+        
+        Each directory hashes its files (name, size, mtime) and the hashes of
+        its subdirectories; the result is the hash of the start directory.
+        
+        Args:
+            rel_dirs (iterable): Directories the walk visited
+            cache (FingerprintCache): Digests of the previous run of the same tree, updated in place
+            start_dir (str): '/' separated directory the walk started at
+        """
+        if cache is None:
+            cache = FingerprintCache()
+        
+        # Deepest directories first, so children are done before their parents
+        rel_dirs = sorted(
+            set(rel_dirs) | set(self.files_by_dir),
+            key=lambda rel_dir: -rel_dir.count('/') - bool(rel_dir)
+        )
+        children: Dict[str, List[Tuple[str, str]]] = {}
+        digests: Dict[str, str] = {}
+        for rel_dir in rel_dirs:
+            files = tuple(sorted(self.files_by_dir.get(rel_dir, ())))
+            subdirs = sorted(children.get(rel_dir, ()))
+            if not files and not subdirs:
+                continue
+            
+            digest = hashlib.sha1(cache.files_digest(rel_dir, files))
+            for name, subdir_digest in subdirs:
+                digest.update(f"d{name}\0{subdir_digest}\n".encode('utf-8', 'surrogateescape'))
+            digests[rel_dir] = digest.hexdigest()
+            
+            if rel_dir != start_dir:
+                parent, _, name = rel_dir.rpartition('/')
+                children.setdefault(parent, []).append((name, digests[rel_dir]))
+        
+        cache.retain(digests)
+        cache.digests = digests
+        # An empty tree still has a well-defined fingerprint
+        return digests.get(start_dir, hashlib.sha1(b'').hexdigest())
+
+
+def project_fingerprint(walker: ProjectWalker, cache: Optional[FingerprintCache] = None,
+                        should_stop: Optional[Callable[[], bool]] = None,
+                        start_dir: str = '', tracked: Optional[Tuple] = None) -> Optional[str]:
+    """
+    Merkle hash of the files a walker reports
+    
+    Directories without any reported file below them do not contribute, so
+    only changes the analysis could see change the fingerprint. File contents
+    are not read.
+    
+    Args:
+        walker (ProjectWalker): Walker configured like the analysis (exclusions, ignore files)
+        cache (FingerprintCache): Digests of the previous run of the same tree, updated in place
+        should_stop (callable): Passed to the walk; an interrupted walk gives no fingerprint
+        start_dir (str): '/' separated subdirectory to fingerprint instead of the whole tree
+        tracked (tuple): Git index listing to walk with walk_tracked instead of walking the tree
+    
+    Returns:
+        str: Hex digest, or None if the walk did not complete
+    """
+    builder = FingerprintBuilder()
+    if tracked is not None:
+        walk = walker.walk_tracked(tracked, should_stop=should_stop, start_dir=start_dir)
+    else:
+        walk = walker.walk(should_stop=should_stop, start_dir=start_dir)
+    try:
+        for rel_path, entry in walk:
+            builder.add_file(rel_path, entry)
+    finally:
+        walk.close()
+    if not walker.completed:
+        return None
+    return builder.digest(walker.visited_dirs, cache, start_dir)
@@ -0,0 +1,213 @@
+"""
+Git Index Module - Tracked file listing read straight from .git/index
+Parses the index file in pure Python so git repositories can be listed without a tree walk
+"""
+
+import bisect
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+INDEX_SIGNATURE = b'DIRC'
+SUPPORTED_VERSIONS = (2, 3, 4)
+
+# ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size
+_ENTRY_HEADER = struct.Struct('>10I')
+
+_MODE_TYPE_MASK = 0o170000
+_MODE_REGULAR = 0o100000
+_MODE_TREE = 0o040000
+
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE_MASK = 0x3000
+_FLAG_NAME_MASK = 0x0FFF
+_EXTENDED_SKIP_WORKTREE = 0x4000
+
+
+def find_git_dir(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Find the repository containing a directory
+    
+    Follows 'gitdir:' files, as used by linked worktrees and submodules.
+    
+    Returns:
+        tuple: (git_dir, worktree_root), or None outside a repository
+    """
+    current = os.path.abspath(path)
+    while True:
+        dot_git = os.path.join(current, '.git')
+        if os.path.isdir(dot_git):
+            return dot_git, current
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git, 'r', encoding='utf-8') as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if line.startswith('gitdir:'):
+                git_dir = os.path.join(current, line[len('gitdir:'):].strip())
+                return os.path.normpath(git_dir), current
+            return None
+        
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _object_hash_size(git_dir: str) -> int:
+    """Length of object ids in the index: 32 bytes for sha256 repositories, 20 otherwise"""
+    config_dirs = [git_dir]
+    try:
+        with open(os.path.join(git_dir, 'commondir'), 'r', encoding='utf-8') as f:
+            config_dirs.append(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        pass
+    
+    for config_dir in config_dirs:
+        try:
+            with open(os.path.join(config_dir, 'config'), 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    key, _, value = line.partition('=')
+                    if key.strip().lower() == 'objectformat' and value.strip().lower() == 'sha256':
+                        return 32
+        except OSError:
+            continue
+    return 20
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Git's offset varint (index v4 path compression)"""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def parse_git_index(data: bytes, hash_size: int = 20) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse the entries of a git index file
+    
+    Only regular files are returned. Submodules and symlinks are skipped, as
+    are skip-worktree entries (not checked out in a sparse checkout) and the
+    extra stages of conflicted paths.
+    
+    Args:
+        data (bytes): Content of .git/index
+        hash_size (int): Object id length in bytes
+    
+    Returns:
+        list: (path, size, mtime_ns, inode) tuples in index order (sorted by path)
+    
+    Raises:
+        ValueError: If the file is not a supported index, or is a sparse index
+    """
+    if len(data) < 12 or data[:4] != INDEX_SIGNATURE:
+        raise ValueError("not a git index")
+    version, count = struct.unpack_from('>II', data, 4)
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"unsupported git index version {version}")
+    
+    entries = []
+    pos = 12
+    previous = b''
+    kept = None
+    try:
+        for _ in range(count):
+            start = pos
+            (_, _, mtime_s, mtime_ns, _, inode, mode, _, _, size) = _ENTRY_HEADER.unpack_from(data, pos)
+            pos += _ENTRY_HEADER.size + hash_size
+            flags = (data[pos] << 8) | data[pos + 1]
+            pos += 2
+            extended = 0
+            if flags & _FLAG_EXTENDED and version >= 3:
+                extended = (data[pos] << 8) | data[pos + 1]
+                pos += 2
+            
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                end = data.index(b'\0', pos)
+                path = previous[:len(previous) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                name_length = flags & _FLAG_NAME_MASK
+                if name_length < _FLAG_NAME_MASK:
+                    end = pos + name_length
+                else:
+                    end = data.index(b'\0', pos)
+                path = data[pos:end]
+                # Entries are NUL padded to a multiple of eight bytes
+                entry_length = (end - start) + 8 - ((end - start) % 8)
+                pos = start + entry_length
+            previous = path
+            
+            mode_type = mode & _MODE_TYPE_MASK
+            if mode_type == _MODE_TREE:
+                raise ValueError("sparse git index")
+            if mode_type != _MODE_REGULAR or extended & _EXTENDED_SKIP_WORKTREE:
+                continue
+            # Conflicted paths appear once per stage, one listing is enough
+            if flags & _FLAG_STAGE_MASK and path == kept:
+                continue
+            kept = path
+            
+            entries.append((
+                path.decode('utf-8', 'surrogateescape'), size, mtime_s * 10**9 + mtime_ns, inode
+            ))
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"truncated git index: {e}")
+    
+    return entries
+
+
+class GitIndexReader:
+    """Reads tracked files of repositories, reparsing an index only when it changes"""
+    
+    def __init__(self, max_cached: int = 4):
+        self.max_cached = max_cached
+        self._cache: Dict[str, Tuple[int, int, List[Tuple[str, int, int, int]]]] = {}
+        self.parsed = 0
+    
+    def tracked_files(self, root: str) -> Optional[Tuple[str, str, List[Tuple[str, int, int, int]]]]:
+        """
+        Tracked files of the repository containing root
+        
+        Returns:
+            tuple: (index_path, prefix, entries) where prefix is root relative to the
+                   worktree ('' or ending in '/'), or None if root is not in a
+                   repository, its index cannot be used or it tracks nothing below root
+        """
+        found = find_git_dir(root)
+        if found is None:
+            return None
+        git_dir, worktree = found
+        index_path = os.path.join(git_dir, 'index')
+        
+        try:
+            stat = os.stat(index_path)
+            cached = self._cache.get(index_path)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                entries = cached[2]
+            else:
+                with open(index_path, 'rb') as f:
+                    data = f.read()
+                entries = parse_git_index(data, _object_hash_size(git_dir))
+                self.parsed += 1
+                if len(self._cache) >= self.max_cached:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[index_path] = (stat.st_mtime_ns, stat.st_size, entries)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read git index, walking instead: {e}")
+            return None
+        
+        prefix = os.path.relpath(os.path.abspath(root), worktree).replace(os.sep, '/')
+        prefix = '' if prefix == '.' else prefix + '/'
+        # A folder the enclosing repository does not track has to be walked
+        first = bisect.bisect_left(entries, (prefix,))
+        if first == len(entries) or not entries[first][0].startswith(prefix):
+            return None
+        return index_path, prefix, entries
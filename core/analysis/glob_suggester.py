@@ -0,0 +1,446 @@
+"""
+Glob Suggester Module - Glob patterns for rules, computed from the project's file list
+Covers the files of a category or language with a few patterns that match little else
+"""
+
+import bisect
+import itertools
+import posixpath
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .language_detector import FILENAME_MAP, LANGUAGE_MAP
+from .structure_summary import file_kind
+
+DEFAULT_MAX_PATTERNS = 4
+
+# Patterns are anchored at most this many directories deep
+MAX_PATTERN_DEPTH = 4
+
+# Each file a pattern matches outside the relevant set costs as much as this many missed files
+OVER_MATCH_WEIGHT = 2.0
+
+# Patterns after the first must cover at least this share of the relevant files
+MIN_EXTRA_SHARE = 0.05
+
+# Directory names and file name patterns per rule category; other categories match their own name
+CATEGORY_HINTS = {
+    'UI': (('components', 'ui', 'views', 'pages', 'screens', 'widgets', 'layouts', 'templates', 'styles'),
+           r'\.(tsx|jsx|vue|svelte|css|scss|sass|less|html)$'),
+    'Database': (('db', 'database', 'models', 'migrations', 'schema', 'schemas', 'repositories', 'entities'),
+                 r'model|schema|migration|repositor|\.(sql|prisma)$'),
+    'Logic': (('services', 'domain', 'core', 'lib', 'logic', 'usecases'), r'service|manager|engine'),
+    'Security': (('security', 'auth', 'crypto', 'permissions'), r'secur|crypt|auth|sanitiz'),
+    'Performance': (('cache', 'perf', 'benchmarks', 'bench'), r'cache|perf|bench'),
+    'Testing': (('test', 'tests', '__tests__', 'spec', 'specs', 'e2e'),
+                r'^test_|_test\.|\.test\.|\.spec\.|_spec\.|^conftest\.py$'),
+    'Documentation': (('docs', 'doc', 'documentation'), r'^readme|^changelog|\.(md|mdx|rst)$'),
+    'API': (('api', 'routes', 'controllers', 'handlers', 'endpoints', 'graphql'),
+            r'route|controller|handler|endpoint|api|\.(graphql|proto)$'),
+    'Configuration': (('config', 'configs', 'settings', 'conf'),
+                      r'^\.env|config|settings|\.(toml|ini|cfg|yaml|yml)$'),
+    'Deployment': (('deploy', 'deployment', 'k8s', 'helm', 'infra', 'terraform', '.github'),
+                   r'^dockerfile|^docker-compose|^procfile|\.tf$'),
+    'Validation': (('validators', 'validation'), r'valid'),
+    'Error Handling': (('errors', 'exceptions'), r'error|exception'),
+    'Logging': (('logging', 'logs', 'logger'), r'^log|logg'),
+    'Authentication': (('auth', 'authentication', 'login', 'session'), r'auth|login|session|token'),
+    'Authorization': (('authorization', 'permissions', 'policies', 'roles', 'guards'),
+                      r'permission|policy|role|guard|acl')
+}
+
+_AFFIX_RE = re.compile(r'[A-Za-z]{2,12}')
+_WILDCARDS = '*?[{'
+
+
+def file_language(name: str) -> Optional[str]:
+    """Language of a file from its name alone (no content sniffing)"""
+    language = FILENAME_MAP.get(name.lower())
+    if language is None:
+        language = LANGUAGE_MAP.get(posixpath.splitext(name)[1].lower())
+    return language
+
+
+def file_shapes(name: str) -> List[str]:
+    """
+    Name patterns a file belongs to, most general first
+    
+    'App.test.tsx' gives ['*.tsx', '*.test.tsx'], 'test_api.py' gives
+    ['*.py', 'test_*.py'] and 'Dockerfile' gives ['Dockerfile'].
+    """
+    kind = file_kind(name)
+    shapes = [kind]
+    if not kind.startswith('*'):
+        return shapes
+    extension = kind[1:]
+    stem = name[:len(name) - len(extension)]
+    
+    dot = stem.rfind('.')
+    if dot > 0 and _AFFIX_RE.fullmatch(stem[dot + 1:]):
+        shapes.append('*' + stem[dot:].lower() + extension)
+    underscore = stem.find('_')
+    if underscore > 0 and _AFFIX_RE.fullmatch(stem[:underscore]):
+        shapes.append(stem[:underscore + 1] + '*' + extension)
+    underscore = stem.rfind('_')
+    if underscore > 0 and _AFFIX_RE.fullmatch(stem[underscore + 1:]):
+        shapes.append('*' + stem[underscore:] + extension)
+    return shapes
+
+
+def split_glob(glob: str) -> List[str]:
+    """
+    Split a glob field into its comma separated patterns
+    
+    Commas inside '{a,b}' alternatives belong to their pattern, so
+    'src/*.{ts,tsx},docs/**' gives ['src/*.{ts,tsx}', 'docs/**']. Parts are
+    not stripped; an unclosed brace runs to the end of the field.
+    """
+    parts = []
+    start = 0
+    depth = 0
+    for position, char in enumerate(glob):
+        if char == '{':
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+        elif char == ',' and not depth:
+            parts.append(glob[start:position])
+            start = position + 1
+    parts.append(glob[start:])
+    return parts
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Translate a rule glob into a regex body for '/' separated relative paths
+    
+    '**/' matches zero or more directories, '*' and '?' stay within one path
+    segment and '{a,b}' alternatives are supported.
+    """
+    pattern = pattern.strip()
+    while pattern.startswith('./'):
+        pattern = pattern[2:]
+    pattern = pattern.lstrip('/')
+    
+    parts = []
+    i = 0
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+            continue
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        elif char == '{':
+            parts.append('(?:')
+            depth += 1
+        elif char == '}' and depth:
+            parts.append(')')
+            depth -= 1
+        elif char == ',' and depth:
+            parts.append('|')
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts) + ')' * depth
+
+
+def _pattern_text(anchor: str, shape: str) -> str:
+    if shape == '**':
+        return anchor + '/**' if anchor else '**'
+    return f"{anchor}/**/{shape}" if anchor else '**/' + shape
+
+
+class _Directory:
+    """Pattern anchors and lowered names of one directory, shared by its files"""
+    
+    __slots__ = ('anchors', 'lowered_parts')
+    
+    def __init__(self, directory: str):
+        parts = directory.split('/') if directory else []
+        self.anchors = tuple([''] + ['/'.join(parts[:depth])
+                                     for depth in range(1, min(len(parts), MAX_PATTERN_DEPTH) + 1)])
+        self.lowered_parts = frozenset(part.lower() for part in parts)
+
+
+class _IndexedFile:
+    __slots__ = ('path', 'directory', 'name', 'shapes', 'language')
+    
+    def __init__(self, rel_path: str, directory: _Directory, name: str):
+        self.path = rel_path
+        self.directory = directory
+        self.name = name
+        self.shapes = file_shapes(name) + ['**']
+        self.language = file_language(name)
+    
+    def matches(self, key: Tuple[str, str]) -> bool:
+        return key[0] in self.directory.anchors and key[1] in self.shapes
+
+
+class GlobSuggester:
+    """
+    Glob suggestions over a fixed file list
+    
+    Candidate patterns are every 'dir/**/shape' with a directory up to
+    MAX_PATTERN_DEPTH deep and a shape from file_shapes (or '**'). How many
+    files each candidate matches is counted once up front; a query then only
+    counts its relevant files and picks patterns greedily by files newly
+    covered minus OVER_MATCH_WEIGHT per file matched outside the set. Query
+    results are cached, so completing as the user types stays cheap.
+    """
+    
+    def __init__(self, paths: Iterable[str], max_patterns: int = DEFAULT_MAX_PATTERNS):
+        self.max_patterns = max_patterns
+        self.files: List[_IndexedFile] = []
+        directories: Dict[str, _Directory] = {}
+        for rel_path in paths:
+            slash = rel_path.rfind('/')
+            directory_path = rel_path[:slash] if slash >= 0 else ''
+            directory = directories.get(directory_path)
+            if directory is None:
+                directory = directories[directory_path] = _Directory(directory_path)
+            self.files.append(_IndexedFile(rel_path, directory, rel_path[slash + 1:]))
+        self.totals = self._count(range(len(self.files)))
+        
+        # Every ancestor too, for completion
+        all_directories = set()
+        for directory_path in directories:
+            while directory_path and directory_path not in all_directories:
+                all_directories.add(directory_path)
+                directory_path = posixpath.dirname(directory_path)
+        self.directories = sorted(all_directories)
+        self._queries: Dict[Tuple[Optional[str], Optional[str]], Tuple[frozenset, Dict, List[Dict]]] = {}
+    
+    def _count(self, indices: Iterable[int]) -> Dict[Tuple[str, str], int]:
+        """Files per candidate (anchor, shape), counted per directory and then spread to the anchors"""
+        by_directory: Dict[_Directory, Counter] = {}
+        for index in indices:
+            indexed = self.files[index]
+            shape_counts = by_directory.get(indexed.directory)
+            if shape_counts is None:
+                shape_counts = by_directory[indexed.directory] = Counter()
+            shape_counts.update(indexed.shapes)
+        
+        counts: Dict[Tuple[str, str], int] = {}
+        for directory, shape_counts in by_directory.items():
+            for key in itertools.product(directory.anchors, shape_counts):
+                counts[key] = counts.get(key, 0) + shape_counts[key[1]]
+        return counts
+    
+    def _is_relevant(self, indexed: _IndexedFile, language: Optional[str], category: Optional[str],
+                     category_dirs: frozenset, category_re) -> bool:
+        if language and indexed.language != language:
+            return False
+        if category:
+            return bool(category_dirs & indexed.directory.lowered_parts) or bool(category_re.search(indexed.name.lower()))
+        return True
+    
+    def _query(self, language: Optional[str], category: Optional[str]) -> Tuple[frozenset, Dict, List[Dict]]:
+        key = (language or None, category or None)
+        cached = self._queries.get(key)
+        if cached is not None:
+            return cached
+        
+        category_dirs = frozenset()
+        category_re = None
+        if category:
+            dir_names, name_pattern = CATEGORY_HINTS.get(category, ((), None))
+            own_name = category.lower()
+            category_dirs = frozenset(dir_names) | {own_name, own_name.replace(' ', '_'), own_name.replace(' ', '-')}
+            category_re = re.compile(name_pattern or re.escape(own_name.replace(' ', '')))
+        
+        relevant = frozenset(
+            index for index, indexed in enumerate(self.files)
+            if self._is_relevant(indexed, language, category, category_dirs, category_re)
+        )
+        relevant_counts = self._count(relevant)
+        
+        result = (relevant, relevant_counts, self._cover(relevant, relevant_counts))
+        self._queries[key] = result
+        return result
+    
+    def _rank(self, candidate: Tuple[str, str], new: int, relevant: int) -> Tuple:
+        """Files newly covered minus the over-match penalty; ties go to shallower, then to specific shapes"""
+        anchor, shape = candidate
+        score = new - OVER_MATCH_WEIGHT * (self.totals[candidate] - relevant)
+        return (score, -anchor.count('/') - bool(anchor), shape != '**', -len(shape), shape, anchor)
+    
+    def _cover(self, relevant: frozenset, relevant_counts: Dict[Tuple[str, str], int]) -> List[Dict]:
+        """Greedy weighted set cover of the relevant files"""
+        uncovered = set(relevant)
+        chosen = []
+        new_counts = relevant_counts
+        while uncovered and len(chosen) < self.max_patterns:
+            if chosen:
+                new_counts = self._count(uncovered)
+            
+            minimum = max(1, MIN_EXTRA_SHARE * len(relevant)) if chosen else 1
+            best = None
+            best_rank = None
+            for candidate, new in new_counts.items():
+                if new < minimum:
+                    continue
+                rank = self._rank(candidate, new, relevant_counts[candidate])
+                if rank[0] > 0 and (best_rank is None or rank > best_rank):
+                    best, best_rank = candidate, rank
+            if best is None:
+                break
+            
+            anchor, shape = best
+            covered = {index for index in uncovered if self.files[index].matches(best)}
+            uncovered -= covered
+            chosen.append({
+                'pattern': _pattern_text(anchor, shape),
+                'matches': self.totals[best],
+                'relevant': relevant_counts[best],
+                'new': len(covered)
+            })
+        return chosen
+    
+    def prepare(self, categories: Iterable[str], should_stop: Optional[Callable[[], bool]] = None):
+        """
+        Run the queries of the given rule categories ahead of time
+        
+        The first query of a category scans every file, so a worker thread
+        calls this before handing the suggester to the GUI; suggest,
+        complete and count_matches then answer those categories from the cache.
+        """
+        for category in categories:
+            if should_stop is not None and should_stop():
+                return
+            self._query(None, category)
+    
+    def suggest(self, language: Optional[str] = None, category: Optional[str] = None) -> Dict:
+        """
+        Patterns covering the files of a language and/or rule category
+        
+        Args:
+            language (str): Language name as reported by the analysis, e.g. 'TypeScript'
+            category (str): Rule category, e.g. 'Testing'
+        
+        Returns:
+            dict: patterns (list of dicts with pattern, matches, relevant and new),
+                  glob (the patterns joined for a rule's glob field), relevant
+                  (number of relevant files), covered and over_matched
+        """
+        relevant, _, patterns = self._query(language, category)
+        covered = sum(pattern['new'] for pattern in patterns)
+        glob = ','.join(pattern['pattern'] for pattern in patterns)
+        matches, _ = self.count_matches(glob, language, category) if patterns else (0, 0)
+        return {
+            'patterns': patterns,
+            'glob': glob,
+            'relevant': len(relevant),
+            'covered': covered,
+            'over_matched': matches - covered
+        }
+    
+    def complete(self, text: str, language: Optional[str] = None, category: Optional[str] = None,
+                 limit: int = 8) -> List[str]:
+        """
+        Completions for a glob field as typed so far
+        
+        Only the last comma separated pattern is completed. Suggested patterns
+        starting with it come first, then directories starting with it, each
+        with the pattern that best covers its relevant files.
+        
+        Returns:
+            list: Full field texts, best first
+        """
+        parts = split_glob(text)
+        head = text[:len(text) - len(parts[-1])]
+        segment = parts[-1].lstrip()
+        existing = {part.strip() for part in parts[:-1] if part.strip()}
+        _, relevant_counts, patterns = self._query(language, category)
+        
+        completions: List[str] = []
+        
+        def add(pattern):
+            if pattern not in existing and head + pattern not in completions and pattern != segment:
+                completions.append(head + pattern)
+        
+        if not segment and not head and len(patterns) > 1:
+            completions.append(','.join(pattern['pattern'] for pattern in patterns))
+        lowered = segment.lower()
+        for pattern in patterns:
+            if pattern['pattern'].lower().startswith(lowered):
+                add(pattern['pattern'])
+        
+        literal = segment
+        for position, char in enumerate(segment):
+            if char in _WILDCARDS:
+                literal = segment[:position]
+                break
+        if literal and literal == segment:
+            literal = literal.rstrip('/')
+            start = bisect.bisect_left(self.directories, literal)
+            candidates = []
+            for directory in self.directories[start:]:
+                if not directory.startswith(literal):
+                    break
+                candidates.append(directory)
+            # Directories holding the most relevant files first
+            candidates.sort(key=lambda directory: -relevant_counts.get((directory, '**'), 0))
+            for directory in candidates:
+                if len(completions) >= limit:
+                    break
+                add(self._best_pattern_in(directory, relevant_counts))
+        return completions[:limit]
+    
+    def _best_pattern_in(self, directory: str, relevant_counts: Dict[Tuple[str, str], int]) -> str:
+        if directory.count('/') >= MAX_PATTERN_DEPTH:
+            return directory + '/**'
+        best = (directory, '**')
+        best_rank = None
+        for candidate, relevant in relevant_counts.items():
+            if candidate[0] != directory:
+                continue
+            rank = self._rank(candidate, relevant, relevant)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = candidate, rank
+        return _pattern_text(*best)
+    
+    def count_matches(self, glob: str, language: Optional[str] = None,
+                      category: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Count the files a glob field matches
+        
+        Returns:
+            tuple: (matches, relevant) where relevant counts matched files of
+                   the language and/or category
+        """
+        patterns = [pattern for pattern in (part.strip() for part in split_glob(glob)) if pattern]
+        if not patterns:
+            return 0, 0
+        try:
+            regex = re.compile('|'.join(f"(?:{glob_to_regex(pattern)})" for pattern in patterns))
+        except re.error:
+            return 0, 0
+        
+        relevant = self._query(language, category)[0]
+        matches = 0
+        relevant_matches = 0
+        for index, indexed in enumerate(self.files):
+            if regex.fullmatch(indexed.path):
+                matches += 1
+                relevant_matches += index in relevant
+        return matches, relevant_matches
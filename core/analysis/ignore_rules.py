@@ -0,0 +1,199 @@
+"""
+Ignore Rules Module - .gitignore / .windsurfignore support
+Compiles ignore files into regular expressions that the walker checks while it descends
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Ignore files honored in every directory, lowest precedence first
+IGNORE_FILENAMES = ('.gitignore', '.windsurfignore')
+
+# Compiled ignore files keyed by path, with the (mtime_ns, size) they were compiled at;
+# an entry is replaced when its file changes and dropped when the file goes away
+_compiled_cache: Dict[str, Tuple[int, int, 'IgnoreFile']] = {}
+
+
+def _translate_pattern(pattern: str) -> str:
+    """Translate a single gitignore glob into a regular expression body"""
+    result = []
+    i = 0
+    length = len(pattern)
+    
+    while i < length:
+        char = pattern[i]
+        if char == '*':
+            if pattern.startswith('**', i):
+                at_start = i == 0 or pattern[i - 1] == '/'
+                at_end = i + 2 == length
+                if at_start and at_end:
+                    result.append('.*')
+                    i += 2
+                    continue
+                if at_start and pattern.startswith('**/', i):
+                    result.append('(?:.*/)?')
+                    i += 3
+                    continue
+            result.append('[^/]*')
+            while i + 1 < length and pattern[i + 1] == '*':
+                i += 1
+        elif char == '?':
+            result.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                result.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                result.append('[' + body + ']')
+                i = end
+        elif char == '\\' and i + 1 < length:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(char))
+        i += 1
+    
+    return ''.join(result)
+
+
+def parse_ignore_line(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Parse one line of an ignore file
+    
+    Args:
+        line (str): Raw line
+    
+    Returns:
+        tuple: (regex, negated, dir_only) or None for blank lines and comments
+    """
+    line = line.rstrip('\n').rstrip('\r')
+    
+    # Trailing spaces are ignored unless escaped
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    
+    if not line or line.startswith('#'):
+        return None
+    
+    negated = False
+    if line.startswith('!'):
+        negated = True
+        line = line[1:]
+    elif line.startswith('\\!') or line.startswith('\\#'):
+        line = line[1:]
+    
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory
+    anchored = '/' in line
+    line = line.lstrip('/')
+    
+    body = _translate_pattern(line)
+    if not anchored:
+        body = '(?:.*/)?' + body
+    
+    return body, negated, dir_only
+
+
+class IgnoreFile:
+    """Compiled patterns of a single ignore file"""
+    
+    def __init__(self, base: str, lines: Sequence[str]):
+        self.base = base
+        self.patterns: List[Tuple['re.Pattern', bool, bool]] = []
+        
+        bodies = []
+        for line in lines:
+            parsed = parse_ignore_line(line)
+            if parsed is None:
+                continue
+            body, negated, dir_only = parsed
+            self.patterns.append((re.compile(body + r'\Z'), negated, dir_only))
+            bodies.append(body)
+        
+        # One alternation rejects the common "nothing matches" case in a single regex call
+        self._any = re.compile('(?:' + '|'.join(bodies) + r')\Z') if bodies else None
+    
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Match a path relative to this file's directory
+        
+        Returns:
+            bool: True if ignored, False if re-included, None if no pattern applies
+        """
+        if self._any is None or not self._any.match(rel_path):
+            return None
+        
+        for regex, negated, dir_only in reversed(self.patterns):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                return not negated
+        return None
+
+
+def load_ignore_file(file_path: str, base: str) -> Optional[IgnoreFile]:
+    """
+    Load and compile an ignore file, reusing the compiled form while it is unchanged
+    
+    Args:
+        file_path (str): Absolute path to the ignore file
+        base (str): Directory of the file relative to the project root ('' for the root)
+    
+    Returns:
+        IgnoreFile: Compiled file, or None if it cannot be read
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        _compiled_cache.pop(file_path, None)
+        return None
+    
+    cached = _compiled_cache.get(file_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size) and cached[2].base == base:
+        return cached[2]
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            compiled = IgnoreFile(base, f.readlines())
+    except OSError:
+        _compiled_cache.pop(file_path, None)
+        return None
+    
+    _compiled_cache[file_path] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+
+class IgnoreRules:
+    """Chain of ignore files that apply to one directory, outermost first"""
+    
+    def __init__(self, files: Tuple[IgnoreFile, ...] = ()):
+        self.files = files
+    
+    def __bool__(self) -> bool:
+        return bool(self.files)
+    
+    def extend(self, ignore_file: IgnoreFile) -> 'IgnoreRules':
+        """Return a new chain with a deeper ignore file appended"""
+        return IgnoreRules(self.files + (ignore_file,))
+    
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check a root-relative path; deeper ignore files take precedence"""
+        for ignore_file in reversed(self.files):
+            if ignore_file.base:
+                sub_path = rel_path[len(ignore_file.base) + 1:]
+            else:
+                sub_path = rel_path
+            decision = ignore_file.match(sub_path, is_dir)
+            if decision is not None:
+                return decision
+        return False
@@ -0,0 +1,162 @@
+"""
+Language Detector Module - Suffix, file name and content based language detection
+Sniffs only the first few KB of files whose suffix is missing or ambiguous
+"""
+
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+from .project_index import entry_stat
+
+# Common file extensions and their languages
+LANGUAGE_MAP = {
+    '.py': 'Python', '.pyw': 'Python', '.pyi': 'Python',
+    '.js': 'JavaScript', '.mjs': 'JavaScript', '.cjs': 'JavaScript', '.jsx': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    '.java': 'Java', '.kt': 'Kotlin', '.swift': 'Swift',
+    '.cpp': 'C++', '.cc': 'C++', '.cxx': 'C++', '.hpp': 'C++', '.hh': 'C++',
+    '.c': 'C', '.cs': 'C#', '.m': 'Objective-C',
+    '.php': 'PHP', '.rb': 'Ruby', '.go': 'Go', '.rs': 'Rust',
+    '.sh': 'Shell', '.bash': 'Shell', '.zsh': 'Shell',
+    '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.vue': 'Vue',
+    '.json': 'JSON', '.xml': 'XML', '.yaml': 'YAML', '.yml': 'YAML'
+}
+
+# Files recognised by their full name
+FILENAME_MAP = {
+    'makefile': 'Makefile', 'gnumakefile': 'Makefile',
+    'dockerfile': 'Dockerfile',
+    'rakefile': 'Ruby', 'gemfile': 'Ruby', 'vagrantfile': 'Ruby',
+    'sconstruct': 'Python', 'sconscript': 'Python'
+}
+
+# Template suffixes that wrap another file type (e.g. settings.py.j2)
+TEMPLATE_SUFFIXES = frozenset(('.j2', '.jinja', '.jinja2', '.tmpl', '.tpl', '.template', '.in', '.erb', '.mustache'))
+
+# Suffixes shared by several languages, resolved from content
+AMBIGUOUS_SUFFIXES = frozenset(('.h',))
+
+# Interpreter names from shebang lines (version digits are stripped first)
+INTERPRETER_MAP = {
+    'python': 'Python', 'pypy': 'Python',
+    'node': 'JavaScript', 'nodejs': 'JavaScript', 'bun': 'JavaScript',
+    'deno': 'TypeScript', 'ts-node': 'TypeScript', 'tsx': 'TypeScript',
+    'sh': 'Shell', 'bash': 'Shell', 'zsh': 'Shell', 'dash': 'Shell', 'ksh': 'Shell',
+    'ruby': 'Ruby', 'perl': 'Perl', 'php': 'PHP', 'lua': 'Lua', 'rscript': 'R'
+}
+
+# Editor mode names from vim/emacs modelines
+MODE_MAP = {
+    'python': 'Python', 'javascript': 'JavaScript', 'js': 'JavaScript',
+    'typescript': 'TypeScript', 'sh': 'Shell', 'bash': 'Shell', 'shell-script': 'Shell',
+    'ruby': 'Ruby', 'perl': 'Perl', 'php': 'PHP', 'c': 'C', 'cpp': 'C++', 'c++': 'C++',
+    'java': 'Java', 'go': 'Go', 'rust': 'Rust', 'lua': 'Lua',
+    'yaml': 'YAML', 'json': 'JSON', 'html': 'HTML', 'css': 'CSS', 'xml': 'XML'
+}
+
+DEFAULT_SNIFF_BYTES = 4096
+
+_SHEBANG_RE = re.compile(rb'^#!\s*(\S+)(?:[ \t]+(?:-\S+[ \t]+)*(\S+))?')
+_EMACS_MODE_RE = re.compile(rb'-\*-\s*(?:.*?mode:\s*)?([\w+-]+)[\s;]*(?:.*?)-\*-', re.IGNORECASE)
+_VIM_MODE_RE = re.compile(rb'\b(?:vi|vim|ex):.*?\b(?:ft|filetype|syntax)=([\w+-]+)')
+_CPP_HEADER_RE = re.compile(rb'\b(?:class|namespace|template\s*<|public:|private:|std::)|#include\s*<(?:iostream|string|vector|memory)>')
+_OBJC_HEADER_RE = re.compile(rb'@(?:interface|protocol|end)\b|#import\b')
+
+
+class LanguageDetector:
+    """Detect a file's language, reading at most sniff_bytes of content when needed"""
+    
+    def __init__(self, sniff_bytes: int = DEFAULT_SNIFF_BYTES, max_cache_entries: int = 200000):
+        self.sniff_bytes = sniff_bytes
+        self.max_cache_entries = max_cache_entries
+        # Reused for every read to avoid allocating per file
+        self._buffer = bytearray(sniff_bytes)
+        # Sniffed results keyed by (inode, mtime_ns)
+        self._cache: Dict[Tuple[int, int], Optional[str]] = {}
+        self.sniffed = 0
+    
+    def detect(self, entry) -> Optional[str]:
+        """
+        Detect the language of a walker entry (os.DirEntry or IndexedEntry)
+        
+        Returns:
+            str: Language name, or None if unknown
+        """
+        name = entry.name
+        lower_name = name.lower()
+        base, suffix = os.path.splitext(lower_name)
+        
+        if suffix in TEMPLATE_SUFFIXES:
+            base, suffix = os.path.splitext(base)
+        
+        if suffix and suffix not in AMBIGUOUS_SUFFIXES:
+            return LANGUAGE_MAP.get(suffix)
+        
+        if not suffix:
+            language = FILENAME_MAP.get(base)
+            if language is not None:
+                return language
+        
+        return self._sniff_cached(entry, suffix)
+    
+    def _sniff_cached(self, entry, suffix: str) -> Optional[str]:
+        try:
+            stat = entry_stat(entry)
+            key = (entry.inode(), stat.st_mtime_ns)
+        except OSError:
+            return None
+        
+        if key in self._cache:
+            return self._cache[key]
+        
+        language = self._sniff(entry.path, suffix)
+        if len(self._cache) >= self.max_cache_entries:
+            self._cache.clear()
+        self._cache[key] = language
+        return language
+    
+    def _sniff(self, path: str, suffix: str) -> Optional[str]:
+        """Read the head of a file into the shared buffer and inspect it"""
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                size = f.readinto(self._buffer)
+        except OSError:
+            return None
+        
+        self.sniffed += 1
+        head = memoryview(self._buffer)[:size].tobytes()
+        
+        if suffix == '.h':
+            if _OBJC_HEADER_RE.search(head):
+                return 'Objective-C'
+            if _CPP_HEADER_RE.search(head):
+                return 'C++'
+            return 'C'
+        
+        if b'\0' in head:
+            return None
+        
+        return self.language_from_head(head)
+    
+    @staticmethod
+    def language_from_head(head: bytes) -> Optional[str]:
+        """Detect a language from a shebang line or an editor modeline"""
+        if head.startswith(b'#!'):
+            match = _SHEBANG_RE.match(head)
+            if match:
+                interpreter = os.path.basename(match.group(1).decode('latin-1'))
+                if interpreter == 'env' and match.group(2):
+                    interpreter = match.group(2).decode('latin-1')
+                interpreter = interpreter.lower().rstrip('0123456789.')
+                if interpreter in INTERPRETER_MAP:
+                    return INTERPRETER_MAP[interpreter]
+        
+        for regex in (_EMACS_MODE_RE, _VIM_MODE_RE):
+            match = regex.search(head)
+            if match:
+                mode = match.group(1).decode('latin-1').lower()
+                if mode in MODE_MAP:
+                    return MODE_MAP[mode]
+        
+        return None
@@ -0,0 +1,130 @@
+"""
+Line Counter Module - Cheap newline counting for per-language statistics
+Small files are read into a reused buffer, large ones are mapped with mmap;
+newlines are counted in C with bytes.count
+"""
+
+import mmap
+from typing import Dict, List, Optional, Tuple
+
+from .project_index import entry_stat
+
+# Files up to this size are read into the shared buffer instead of mapped
+SMALL_FILE_BYTES = 1024 * 1024
+
+# Window used to count newlines across a mapping
+MMAP_CHUNK_BYTES = 8 * 1024 * 1024
+
+DEFAULT_MAX_LINE_COUNT_BYTES = 16 * 1024 * 1024
+
+# Bytes inspected for NUL characters to recognise binary files
+BINARY_SNIFF_BYTES = 8192
+
+
+class LineCountStore:
+    """
+    Line counts of one project by relative path, for persisting with its ProjectIndex
+    
+    Counts are looked up in the records of the previous run and every count
+    used by this run, reused or new, is collected in counts.
+    """
+    
+    def __init__(self, previous: Optional[Dict[str, List[int]]] = None):
+        self.previous = previous or {}
+        # Relative path -> [size, mtime_ns, lines], lines -1 for files that were not counted
+        self.counts: Dict[str, List[int]] = {}
+        self.changed = 0
+    
+    def get(self, rel_path: str, size: int, mtime_ns: int) -> Tuple[bool, Optional[int]]:
+        """(found, lines) for a file with the given size and mtime"""
+        record = self.previous.get(rel_path)
+        if record is None or record[0] != size or record[1] != mtime_ns:
+            return False, None
+        self.counts[rel_path] = record
+        return True, record[2] if record[2] >= 0 else None
+    
+    def put(self, rel_path: str, size: int, mtime_ns: int, lines: Optional[int]):
+        self.counts[rel_path] = [size, mtime_ns, -1 if lines is None else lines]
+        self.changed += 1
+
+
+class LineCounter:
+    """Count lines of text files, skipping binaries and files over max_bytes"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_LINE_COUNT_BYTES, max_cache_entries: int = 500000):
+        self.max_bytes = max_bytes
+        self.max_cache_entries = max_cache_entries
+        self._buffer = bytearray(SMALL_FILE_BYTES)
+        # Line counts keyed by (inode, mtime_ns, size); None marks skipped files
+        self._cache: Dict[Tuple[int, int, int], Optional[int]] = {}
+        self.files_read = 0
+    
+    def count(self, entry, store: Optional[LineCountStore] = None, rel_path: str = '') -> Optional[int]:
+        """
+        Count the lines of a walker entry
+        
+        Args:
+            entry: os.DirEntry or IndexedEntry of the file
+            store (LineCountStore): Persisted counts of the project, looked up by rel_path
+            rel_path (str): Path of the file in the store
+        
+        Returns:
+            int: Number of lines (a final line without newline counts), or None
+                 for binary files, files over max_bytes and unreadable files
+        """
+        try:
+            stat = entry_stat(entry)
+            key = (entry.inode(), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+        
+        if store is not None:
+            found, lines = store.get(rel_path, stat.st_size, stat.st_mtime_ns)
+            if found:
+                return lines
+        
+        if key in self._cache:
+            lines = self._cache[key]
+        else:
+            lines = self._count_uncached(entry, stat.st_size, key)
+        if store is not None:
+            store.put(rel_path, stat.st_size, stat.st_mtime_ns, lines)
+        return lines
+    
+    def _count_uncached(self, entry, size: int, key: Tuple[int, int, int]) -> Optional[int]:
+        if size == 0:
+            lines = 0
+        elif size > self.max_bytes:
+            lines = None
+        else:
+            lines = self._count_file(entry.path, size)
+        
+        if len(self._cache) >= self.max_cache_entries:
+            self._cache.clear()
+        self._cache[key] = lines
+        return lines
+    
+    def _count_file(self, path: str, size: int) -> Optional[int]:
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                self.files_read += 1
+                if size <= SMALL_FILE_BYTES:
+                    length = f.readinto(self._buffer)
+                    if self._buffer.find(b'\0', 0, min(length, BINARY_SNIFF_BYTES)) != -1:
+                        return None
+                    lines = self._buffer.count(b'\n', 0, length)
+                    last = self._buffer[length - 1] if length else 10
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if mapped.find(b'\0', 0, BINARY_SNIFF_BYTES) != -1:
+                            return None
+                        length = len(mapped)
+                        lines = 0
+                        for start in range(0, length, MMAP_CHUNK_BYTES):
+                            lines += mapped[start:start + MMAP_CHUNK_BYTES].count(b'\n')
+                        last = mapped[length - 1]
+        except (OSError, ValueError):
+            return None
+        
+        # A trailing line without a newline still counts as a line
+        return lines + (1 if last != 10 else 0)
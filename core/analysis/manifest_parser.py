@@ -0,0 +1,334 @@
+"""
+Manifest Parser Module - Framework detection from dependency manifests
+Parses package.json, Python requirements/pyproject, Cargo.toml, go.mod, pom.xml,
+composer.json and Gemfile, caching parsed results by content hash
+"""
+
+import hashlib
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+from .project_index import entry_stat
+
+try:
+    import tomllib
+except ImportError:
+    # Python < 3.11 falls back to the small subset parser below
+    tomllib = None
+
+# Manifests are small; anything bigger is generated and not worth reading
+MAX_MANIFEST_BYTES = 2 * 1024 * 1024
+
+# Ecosystem reported for each manifest (keys are lower case file names)
+MANIFEST_ECOSYSTEMS = {
+    'package.json': 'Node.js',
+    'requirements.txt': 'Python',
+    'pyproject.toml': 'Python',
+    'pipfile': 'Python',
+    'cargo.toml': 'Rust',
+    'go.mod': 'Go',
+    'go.work': 'Go',
+    'pnpm-workspace.yaml': 'Node.js',
+    'pom.xml': 'Java/Maven',
+    'build.gradle': 'Java/Gradle',
+    'build.gradle.kts': 'Java/Gradle',
+    'composer.json': 'PHP',
+    'gemfile': 'Ruby'
+}
+
+# Dependency name -> framework, checked per ecosystem
+KNOWN_FRAMEWORKS = {
+    'Node.js': {
+        'react': 'React', 'next': 'Next.js', 'vue': 'Vue', 'nuxt': 'Nuxt',
+        '@angular/core': 'Angular', 'svelte': 'Svelte', '@sveltejs/kit': 'SvelteKit',
+        'express': 'Express', '@nestjs/core': 'NestJS', 'fastify': 'Fastify', 'koa': 'Koa',
+        'electron': 'Electron', 'react-native': 'React Native', 'jest': 'Jest',
+        'vitest': 'Vitest', 'tailwindcss': 'Tailwind CSS', 'vite': 'Vite', 'webpack': 'webpack'
+    },
+    'Python': {
+        'django': 'Django', 'flask': 'Flask', 'fastapi': 'FastAPI', 'pyqt6': 'PyQt6',
+        'pyqt5': 'PyQt5', 'pyside6': 'PySide6', 'pytest': 'pytest', 'sqlalchemy': 'SQLAlchemy',
+        'pandas': 'pandas', 'numpy': 'NumPy', 'torch': 'PyTorch', 'tensorflow': 'TensorFlow',
+        'celery': 'Celery', 'streamlit': 'Streamlit', 'pydantic': 'Pydantic',
+        'google-generativeai': 'Google Generative AI'
+    },
+    'Rust': {
+        'tokio': 'Tokio', 'actix-web': 'Actix Web', 'axum': 'Axum', 'rocket': 'Rocket',
+        'serde': 'Serde', 'bevy': 'Bevy', 'tauri': 'Tauri', 'diesel': 'Diesel'
+    },
+    'Go': {
+        'github.com/gin-gonic/gin': 'Gin', 'github.com/labstack/echo/v4': 'Echo',
+        'github.com/gofiber/fiber/v2': 'Fiber', 'gorm.io/gorm': 'GORM',
+        'github.com/spf13/cobra': 'Cobra', 'google.golang.org/grpc': 'gRPC'
+    },
+    'Java/Maven': {
+        'org.springframework.boot': 'Spring Boot', 'io.quarkus': 'Quarkus',
+        'junit': 'JUnit', 'org.junit.jupiter': 'JUnit', 'org.hibernate': 'Hibernate'
+    },
+    'PHP': {
+        'laravel/framework': 'Laravel', 'symfony/framework-bundle': 'Symfony',
+        'phpunit/phpunit': 'PHPUnit'
+    },
+    'Ruby': {
+        'rails': 'Ruby on Rails', 'sinatra': 'Sinatra', 'rspec': 'RSpec'
+    }
+}
+
+_REQUIREMENT_NAME_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+_GEM_RE = re.compile(r'''^\s*gem\s+['"]([^'"]+)['"]''', re.MULTILINE)
+_GO_REQUIRE_RE = re.compile(r'^\s*(?:require\s+)?([\w.\-]+\.[\w.\-]+/[^\s]+)\s+v[\w.\-+]+', re.MULTILINE)
+_GO_MODULE_RE = re.compile(r'^\s*module\s+(\S+)', re.MULTILINE)
+_GO_USE_RE = re.compile(r'^\s*(?:use\s+)?(\.{1,2}/[^\s)]*|\.)\s*$', re.MULTILINE)
+_YAML_ITEM_RE = re.compile(r'''^\s*-\s*['"]?([^'"#\s]+)['"]?''')
+_GRADLE_DEP_RE = re.compile(r'''['"]([\w.\-]+):([\w.\-]+)(?::[^'"]*)?['"]''')
+
+
+def manifest_kind(filename: str) -> Optional[str]:
+    """Return the manifest key for a file name, or None if it is not a manifest"""
+    lower = filename.lower()
+    if lower in MANIFEST_ECOSYSTEMS:
+        return lower
+    if lower.startswith('requirements') and lower.endswith('.txt'):
+        return 'requirements.txt'
+    return None
+
+
+def _parse_toml_subset(text: str) -> Dict:
+    """Very small TOML reader for tables, strings and string arrays (pre-3.11 fallback)"""
+    root: Dict = {}
+    table = root
+    pending_key = None
+    pending_items: List[str] = []
+    
+    for raw_line in text.splitlines():
+        line = raw_line.split('#', 1)[0].strip() if '"' not in raw_line else raw_line.strip()
+        if not line:
+            continue
+        
+        if pending_key is not None:
+            pending_items.extend(re.findall(r'"([^"]*)"|\'([^\']*)\'', line))
+            if line.endswith(']'):
+                table[pending_key] = [a or b for a, b in pending_items]
+                pending_key = None
+            continue
+        
+        if line.startswith('['):
+            name = line.strip('[]').strip()
+            table = root
+            for part in name.split('.'):
+                table = table.setdefault(part.strip().strip('"'), {})
+            continue
+        
+        if '=' not in line:
+            continue
+        key, value = [part.strip() for part in line.split('=', 1)]
+        key = key.strip('"')
+        if value.startswith('[') and not value.endswith(']'):
+            pending_key = key
+            pending_items = re.findall(r'"([^"]*)"|\'([^\']*)\'', value)
+        elif value.startswith('['):
+            table[key] = [a or b for a, b in re.findall(r'"([^"]*)"|\'([^\']*)\'', value)]
+        else:
+            table[key] = value.strip('"\'')
+    
+    return root
+
+
+def _load_toml(text: str) -> Dict:
+    if tomllib is not None:
+        return tomllib.loads(text)
+    return _parse_toml_subset(text)
+
+
+def _requirement_names(lines) -> List[str]:
+    names = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(('#', '-')):
+            continue
+        match = _REQUIREMENT_NAME_RE.match(line)
+        if match:
+            names.append(match.group(1))
+    return names
+
+
+def _parse_package_json(text: str, result: Dict):
+    data = json.loads(text)
+    result['name'] = data.get('name')
+    for section in ('dependencies', 'devDependencies', 'peerDependencies'):
+        result['dependencies'].extend((data.get(section) or {}).keys())
+    workspaces = data.get('workspaces')
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get('packages')
+    if isinstance(workspaces, list):
+        result['workspaces'] = [str(pattern) for pattern in workspaces]
+
+
+def _parse_pyproject(text: str, result: Dict):
+    data = _load_toml(text)
+    project = data.get('project') or {}
+    result['name'] = project.get('name')
+    result['dependencies'].extend(_requirement_names(project.get('dependencies') or []))
+    for extra in (project.get('optional-dependencies') or {}).values():
+        result['dependencies'].extend(_requirement_names(extra or []))
+    
+    poetry = (data.get('tool') or {}).get('poetry') or {}
+    result['name'] = result['name'] or poetry.get('name')
+    result['dependencies'].extend(
+        name for name in (poetry.get('dependencies') or {}) if name.lower() != 'python'
+    )
+
+
+def _parse_cargo(text: str, result: Dict):
+    data = _load_toml(text)
+    result['name'] = (data.get('package') or {}).get('name')
+    for section in ('dependencies', 'dev-dependencies', 'build-dependencies'):
+        result['dependencies'].extend((data.get(section) or {}).keys())
+    workspace = data.get('workspace') or {}
+    result['dependencies'].extend((workspace.get('dependencies') or {}).keys())
+    if workspace.get('members'):
+        result['workspaces'] = list(workspace['members'])
+
+
+def _parse_pnpm_workspace(text: str, result: Dict):
+    """Read the 'packages' list of pnpm-workspace.yaml"""
+    in_packages = False
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if not line[0].isspace() and not line.startswith('-'):
+            in_packages = line.split(':', 1)[0].strip() == 'packages'
+            continue
+        item = _YAML_ITEM_RE.match(line)
+        if in_packages and item:
+            result['workspaces'].append(item.group(1))
+
+
+def _parse_pom(text: str, result: Dict):
+    root = ET.fromstring(text)
+    namespace = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+    artifact = root.find(f'{namespace}artifactId')
+    result['name'] = artifact.text if artifact is not None else None
+    
+    for tag in ('parent', 'dependencies/dependency', 'dependencyManagement/dependencies/dependency'):
+        for node in root.findall(f'{namespace}' + f'/{namespace}'.join(tag.split('/'))):
+            group = node.findtext(f'{namespace}groupId') or ''
+            artifact_id = node.findtext(f'{namespace}artifactId') or ''
+            result['dependencies'].extend(name for name in (group, artifact_id) if name)
+    
+    modules = [node.text for node in root.findall(f'{namespace}modules/{namespace}module') if node.text]
+    if modules:
+        result['workspaces'] = modules
+
+
+def parse_manifest(kind: str, text: str) -> Dict:
+    """
+    Parse manifest text
+    
+    Args:
+        kind (str): Manifest key as returned by manifest_kind()
+        text (str): File content
+    
+    Returns:
+        dict: ecosystem, name, dependencies, workspaces and detected frameworks
+    """
+    ecosystem = MANIFEST_ECOSYSTEMS[kind]
+    result = {'ecosystem': ecosystem, 'name': None, 'dependencies': [], 'workspaces': [], 'frameworks': []}
+    
+    try:
+        if kind in ('package.json', 'composer.json'):
+            if kind == 'package.json':
+                _parse_package_json(text, result)
+            else:
+                data = json.loads(text)
+                result['name'] = data.get('name')
+                for section in ('require', 'require-dev'):
+                    result['dependencies'].extend((data.get(section) or {}).keys())
+        elif kind == 'requirements.txt':
+            result['dependencies'] = _requirement_names(text.splitlines())
+        elif kind == 'pyproject.toml':
+            _parse_pyproject(text, result)
+        elif kind == 'pipfile':
+            data = _load_toml(text)
+            for section in ('packages', 'dev-packages'):
+                result['dependencies'].extend((data.get(section) or {}).keys())
+        elif kind == 'cargo.toml':
+            _parse_cargo(text, result)
+        elif kind == 'go.mod':
+            module = _GO_MODULE_RE.search(text)
+            result['name'] = module.group(1) if module else None
+            result['dependencies'] = _GO_REQUIRE_RE.findall(text)
+        elif kind == 'go.work':
+            result['workspaces'] = [path.rstrip('/') for path in _GO_USE_RE.findall(text)]
+        elif kind == 'pnpm-workspace.yaml':
+            _parse_pnpm_workspace(text, result)
+        elif kind == 'pom.xml':
+            _parse_pom(text, result)
+        elif kind in ('build.gradle', 'build.gradle.kts'):
+            result['dependencies'] = [name for pair in _GRADLE_DEP_RE.findall(text) for name in pair]
+        elif kind == 'gemfile':
+            result['dependencies'] = _GEM_RE.findall(text)
+    except (ValueError, ET.ParseError, AttributeError, TypeError) as e:
+        # Broken manifests still tell us the ecosystem
+        print(f"Warning: could not parse {kind}: {e}")
+    
+    known = KNOWN_FRAMEWORKS.get('Java/Maven' if ecosystem == 'Java/Gradle' else ecosystem, {})
+    frameworks = {ecosystem}
+    for dependency in result['dependencies']:
+        lower = dependency.lower()
+        if lower in known:
+            frameworks.add(known[lower])
+        elif ecosystem.startswith('Java') and lower.startswith('spring-boot'):
+            frameworks.add('Spring Boot')
+    result['frameworks'] = sorted(frameworks)
+    return result
+
+
+class ManifestCache:
+    """Parsed manifests keyed by content hash, with a stat-based shortcut that avoids re-reading"""
+    
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._by_hash: Dict[str, Dict] = {}
+        self._by_stat: Dict[Tuple[str, int, int], str] = {}
+        self.parsed = 0
+    
+    def get(self, entry, kind: str) -> Optional[Dict]:
+        """
+        Parse a manifest walker entry, reusing earlier results for identical content
+        
+        Returns:
+            dict: Parsed manifest, or None if the file cannot be read or is too large
+        """
+        try:
+            stat = entry_stat(entry)
+        except OSError:
+            return None
+        if stat.st_size > MAX_MANIFEST_BYTES:
+            return None
+        
+        stat_key = (entry.path, stat.st_mtime_ns, stat.st_size)
+        digest = self._by_stat.get(stat_key)
+        if digest is not None and digest in self._by_hash:
+            return self._by_hash[digest]
+        
+        try:
+            with open(entry.path, 'rb') as f:
+                content = f.read(MAX_MANIFEST_BYTES + 1)
+        except OSError:
+            return None
+        
+        digest = hashlib.sha1(kind.encode('utf-8') + b'\0' + content).hexdigest()
+        result = self._by_hash.get(digest)
+        if result is None:
+            result = parse_manifest(kind, content.decode('utf-8', errors='replace'))
+            self.parsed += 1
+            if len(self._by_hash) >= self.max_entries:
+                self._by_hash.clear()
+                self._by_stat.clear()
+            self._by_hash[digest] = result
+        
+        self._by_stat[stat_key] = digest
+        return result
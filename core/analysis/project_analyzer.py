@@ -0,0 +1,555 @@
+"""
+Project Analyzer Module - Project analysis with its caches and live watchers
+Runs analyses on the calling thread or, optionally, in a separate worker process
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.utils import CancellationToken, OperationCancelled
+
+from .walker import ProjectWalker, DEFAULT_EXCLUDED_DIRS, DEFAULT_PARALLEL_MIN_DIRS
+from .project_index import ProjectIndex, ProjectIndexCache
+from .analysis_memo import AnalysisMemo
+from .budget import AnalysisBudget, mark_truncated
+from .language_detector import LanguageDetector
+from .manifest_parser import ManifestCache
+from .line_counter import LineCountStore, LineCounter
+from .project_stats import ProjectStats, DEFAULT_SAMPLE_SIZE
+from .structure_summary import StructureSummary, DEFAULT_MAX_DEPTH, DEFAULT_MAX_CHILDREN, DEFAULT_MAX_CHARS
+from .project_watcher import ProjectWatcher
+from .git_index import GitIndexReader
+from .symbol_extractor import SymbolExtractor, summarize_symbols, DEFAULT_MAX_SYMBOL_FILES
+from .glob_suggester import GlobSuggester
+from .fingerprint import FingerprintCache, project_fingerprint
+
+# Seconds between cancellation checks while waiting on the worker process
+PROCESS_POLL_INTERVAL = 0.05
+
+# Analyzer and cancellation flag of a worker process, set by its initializer
+_worker_analyzer = None
+_worker_cancel_event = None
+
+
+def _init_worker(analysis_settings: Dict, cancel_event):
+    """Process pool initializer: build the analyzer the worker keeps for its lifetime"""
+    global _worker_analyzer, _worker_cancel_event
+    settings = dict(analysis_settings)
+    settings['use_process_pool'] = False
+    _worker_analyzer = ProjectAnalyzer(settings)
+    _worker_cancel_event = cancel_event
+
+
+def _analyze_in_worker(project_path: str, excluded_dirs: Optional[List[str]], include_files: bool,
+                       max_seconds: Optional[float], max_files: Optional[int],
+                       package_path: str) -> Tuple[Dict, bool]:
+    """Process pool task: run one analysis and return its picklable summary"""
+    return _worker_analyzer._analyze_here(
+        project_path, excluded_dirs, include_files, max_seconds, max_files,
+        CancellationToken(_worker_cancel_event), package_path
+    )
+
+
+def _fingerprint_in_worker(project_path: str, package_path: str) -> Optional[str]:
+    """Process pool task: fingerprint a project with the worker's caches"""
+    return _worker_analyzer._fingerprint_here(project_path, CancellationToken(_worker_cancel_event), package_path)
+
+
+class ProjectAnalyzer:
+    """
+    Walks projects and summarizes them for the prompts
+    
+    Detection caches, the index cache and the analysis memo live as long as the
+    analyzer, so repeated analyses of the same tree are cheap. With the
+    'use_process_pool' setting the walk runs in a single long-lived worker
+    process, keeping it off the GUI process's interpreter lock; only the
+    compact summary (aggregates and a bounded path sample) is sent back.
+    """
+    
+    def __init__(self, analysis_settings: Optional[Dict] = None):
+        # Mirrors the 'analysis_settings' section of the configuration
+        self.analysis_settings = dict(analysis_settings or {})
+        self.index_cache = None
+        self.analysis_memo = AnalysisMemo()
+        # Kept across runs so sniffed languages are cached per (inode, mtime)
+        self.language_detector = LanguageDetector()
+        # Parsed manifests keyed by content hash, shared by every analysis
+        self.manifest_cache = ManifestCache()
+        self.line_counter = None
+        if self.analysis_settings.get('count_lines', True):
+            self.line_counter = LineCounter(
+                max_bytes=int(self.analysis_settings.get('max_line_count_mb', 16)) * 1024 * 1024
+            )
+        # Live watchers keyed by absolute project root
+        self.project_watchers: Dict[str, ProjectWatcher] = {}
+        
+        if self.analysis_settings.get('use_index_cache', True):
+            self.index_cache = ProjectIndexCache(
+                cache_dir=self.analysis_settings.get('index_cache_dir') or None,
+                max_bytes=int(self.analysis_settings.get('index_cache_max_mb', 64)) * 1024 * 1024
+            )
+        
+        # Tracked files of git repositories are listed from .git/index instead of walking
+        self.git_index_reader = None
+        if self.analysis_settings.get('use_git_index', True):
+            self.git_index_reader = GitIndexReader()
+        
+        # Definitions and imports per content hash, optional
+        self.symbol_extractor = None
+        if self.analysis_settings.get('extract_symbols', True):
+            self.symbol_extractor = SymbolExtractor(workers=int(self.analysis_settings.get('symbol_workers', 4)))
+        
+        # Analyses share the detection caches, so concurrent callers take turns
+        self._analysis_lock = threading.RLock()
+        self.use_process_pool = bool(self.analysis_settings.get('use_process_pool', False))
+        self._process_pool = None
+        self._process_cancel = None
+        self._process_future = None
+        # Suggesters are tied to the analysis they were built from
+        self._glob_suggesters: Dict[str, Tuple[Dict, GlobSuggester]] = {}
+        self._fingerprint_caches: Dict[Tuple[str, str], FingerprintCache] = {}
+    
+    def analyze_project(self, project_path: str, excluded_dirs: Optional[List[str]] = None,
+                        include_files: bool = False, max_seconds: Optional[float] = None,
+                        max_files: Optional[int] = None,
+                        cancel_token: Optional[CancellationToken] = None,
+                        package_path: str = '') -> Dict[str, any]:
+        """
+        Analyze project structure and files (hidden, excluded and ignored paths are never entered)
+        
+        Only aggregates and a bounded sample of paths are kept. With include_files
+        the complete path list is returned in 'files' as a CompactPathList.
+        When max_seconds or max_files runs out the walk stops early and the result
+        is flagged 'truncated' with an 'estimated_file_count'. Budgets default to
+        the analysis settings; 0 means unlimited.
+        
+        With package_path ('/' separated, relative to project_path) only that
+        package of a monorepo is analyzed. Paths in the result stay relative to
+        project_path and ignore files of the enclosing directories still apply.
+        Detected sub-packages are listed in 'packages'.
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled during the walk
+        """
+        with self._analysis_lock:
+            return self._analyze(
+                project_path, excluded_dirs, include_files, max_seconds, max_files, cancel_token, package_path
+            )[0]
+    
+    def get_project_analysis(self, project_path: str,
+                             cancel_token: Optional[CancellationToken] = None,
+                             package_path: str = '', include_files: bool = False) -> Dict[str, any]:
+        """
+        Get the analysis of a project or one of its packages, reused while its files are unchanged
+        
+        Reuse is checked with the project's current fingerprint, so every call
+        walks the project and stats its files unless a live watcher reports no
+        change. The analysis carries that fingerprint in 'fingerprint'.
+        """
+        excluded_dirs = self.analysis_settings.get('excluded_dirs', DEFAULT_EXCLUDED_DIRS)
+        key = (
+            os.path.abspath(project_path),
+            tuple(excluded_dirs),
+            bool(self.analysis_settings.get('use_ignore_files', True)),
+            bool(self.analysis_settings.get('follow_symlinks', False)),
+            bool(self.analysis_settings.get('one_filesystem', False)),
+            package_path,
+            include_files
+        )
+        
+        with self._analysis_lock:
+            watcher = self.project_watchers.get(key[0])
+            version = None
+            if watcher is not None and watcher.is_live:
+                watcher.flush()
+                version = watcher.version
+            
+            project_info = self.analysis_memo.get(key, version=version)
+            if project_info is not None:
+                return project_info
+            
+            fingerprint = self.project_fingerprint(project_path, cancel_token, package_path)
+            project_info = self.analysis_memo.get(key, fingerprint, version)
+            if project_info is not None:
+                return project_info
+            
+            project_info, completed = self._analyze(
+                project_path, include_files=include_files, cancel_token=cancel_token, package_path=package_path
+            )
+            project_info['fingerprint'] = fingerprint
+            # Partial results are not reused, the next run may get further
+            if completed and not project_info.get('truncated'):
+                self.analysis_memo.put(key, project_info, fingerprint, version)
+            return project_info
+    
+    def get_glob_suggester(self, project_path: str,
+                           cancel_token: Optional[CancellationToken] = None) -> GlobSuggester:
+        """Glob suggestions over the complete file list of a project, rebuilt only when its files change"""
+        with self._analysis_lock:
+            project_info = self.get_project_analysis(project_path, cancel_token, include_files=True)
+            root = os.path.abspath(project_path)
+            cached = self._glob_suggesters.get(root)
+            if cached is not None and cached[0] is project_info:
+                return cached[1]
+            suggester = GlobSuggester(project_info.get('files', []))
+            self._glob_suggesters[root] = (project_info, suggester)
+            return suggester
+    
+    def project_fingerprint(self, project_path: str,
+                            cancel_token: Optional[CancellationToken] = None,
+                            package_path: str = '') -> Optional[str]:
+        """
+        Merkle hash of the files an analysis would see, from their paths, sizes and mtimes
+        
+        Every call walks the project like the analysis does (the tracked and
+        untracked files in git index mode) and stats the files again, so
+        in-place edits change it too. Directory listings come from the project
+        index and unchanged directories reuse their digests from the last call.
+        Equal fingerprints mean the analysis would see the same files, so
+        regenerating is unlikely to be worth it. The walk gets the analysis
+        time budget and runs in the worker process when the analysis does.
+        
+        Returns:
+            str: Hex digest, or None if the project does not exist or the walk
+                 ran out of time
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled during the walk
+        """
+        if not os.path.isdir(project_path):
+            return None
+        package_path = package_path.strip('/')
+        with self._analysis_lock:
+            if self.use_process_pool and os.path.abspath(project_path) not in self.project_watchers:
+                ok, fingerprint = self._run_in_process(
+                    _fingerprint_in_worker, (str(project_path), package_path), cancel_token
+                )
+                if ok:
+                    return fingerprint
+            return self._fingerprint_here(project_path, cancel_token, package_path)
+    
+    def _fingerprint_here(self, project_path: str, cancel_token: Optional[CancellationToken],
+                          package_path: str) -> Optional[str]:
+        """Fingerprint a project on the calling thread"""
+        with self._analysis_lock:
+            walker, tracked, index = self._new_walker(project_path)
+            budget = AnalysisBudget(max_seconds=self.analysis_settings.get('max_seconds', 30))
+            
+            def should_stop():
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    return True
+                return budget.is_limited and budget.expired()
+            
+            fingerprint = project_fingerprint(
+                walker, self._fingerprint_cache(walker.root, package_path), should_stop, package_path, tracked
+            )
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            if index is not None and self.index_cache is not None and index.rescanned:
+                self.index_cache.save(index)
+            return fingerprint
+    
+    def _fingerprint_cache(self, root: str, package_path: str) -> FingerprintCache:
+        """Per-directory digests of the last fingerprint of a project or package"""
+        cache = self._fingerprint_caches.get((root, package_path))
+        if cache is None:
+            if len(self._fingerprint_caches) >= 4:
+                self._fingerprint_caches.pop(next(iter(self._fingerprint_caches)))
+            cache = self._fingerprint_caches[(root, package_path)] = FingerprintCache()
+        return cache
+    
+    def _new_walker(self, project_path: str, excluded_dirs: Optional[List[str]] = None
+                    ) -> Tuple[ProjectWalker, Optional[Tuple], Optional[ProjectIndex]]:
+        """
+        Walker configured by the analysis settings
+        
+        Returns:
+            tuple: (walker, tracked, index) where tracked is the git index listing
+            to pass to walk_tracked (None to walk the tree) and index is the
+            directory index the walker reuses listings from, if any (in git
+            index mode too, for the names in tracked directories and line counts)
+        """
+        if excluded_dirs is None:
+            excluded_dirs = self.analysis_settings.get('excluded_dirs', DEFAULT_EXCLUDED_DIRS)
+        
+        tracked = None
+        if self.git_index_reader is not None:
+            tracked = self.git_index_reader.tracked_files(project_path)
+        
+        watcher = self.project_watchers.get(os.path.abspath(project_path))
+        if watcher is not None and watcher.is_live:
+            # The watcher's index is kept current in the background
+            watcher.flush()
+            index = watcher.index
+        elif self.index_cache is not None:
+            index = self.index_cache.load(project_path)
+        else:
+            index = None
+        walker = ProjectWalker(
+            project_path,
+            excluded_dirs=excluded_dirs,
+            use_ignore_files=self.analysis_settings.get('use_ignore_files', True),
+            index=index,
+            follow_symlinks=bool(self.analysis_settings.get('follow_symlinks', False)),
+            one_filesystem=bool(self.analysis_settings.get('one_filesystem', False))
+        )
+        return walker, tracked, index
+    
+    def _analyze(self, project_path: str, excluded_dirs: Optional[List[str]] = None,
+                 include_files: bool = False, max_seconds: Optional[float] = None,
+                 max_files: Optional[int] = None,
+                 cancel_token: Optional[CancellationToken] = None,
+                 package_path: str = '') -> Tuple[Dict[str, any], bool]:
+        """
+        Run the analysis where the settings ask for it
+        
+        Returns:
+            tuple: (project_info, completed) where completed is False if the walk failed
+        """
+        # A watched project's index lives in this process and is already current
+        if self.use_process_pool and os.path.abspath(project_path) not in self.project_watchers:
+            ok, result = self._run_in_process(
+                _analyze_in_worker,
+                (str(project_path), excluded_dirs, include_files, max_seconds, max_files, package_path),
+                cancel_token
+            )
+            if ok:
+                return result
+        return self._analyze_here(
+            project_path, excluded_dirs, include_files, max_seconds, max_files, cancel_token, package_path
+        )
+    
+    def _analyze_here(self, project_path: str, excluded_dirs: Optional[List[str]] = None,
+                      include_files: bool = False, max_seconds: Optional[float] = None,
+                      max_files: Optional[int] = None,
+                      cancel_token: Optional[CancellationToken] = None,
+                      package_path: str = '') -> Tuple[Dict[str, any], bool]:
+        """Run the analysis on the calling thread"""
+        completed = False
+        package_path = package_path.strip('/')
+        project_info = {
+            'path': os.path.join(project_path, *package_path.split('/')) if package_path else project_path,
+            'package_path': package_path,
+            'files': [],
+            'sample_files': [],
+            'files_sampled': not include_files,
+            'structure': {},
+            'languages': [],
+            'frameworks': [],
+            'file_count': 0,
+            'truncated': False
+        }
+        
+        try:
+            project_path = Path(project_path)
+            if not project_path.exists():
+                return project_info, False
+            
+            walker, tracked, index = self._new_walker(str(project_path), excluded_dirs)
+            line_counts = None
+            if index is not None and self.line_counter is not None:
+                line_counts = LineCountStore(index.line_counts)
+            stats = ProjectStats(
+                sample_size=int(self.analysis_settings.get('sample_size', DEFAULT_SAMPLE_SIZE)),
+                keep_all_paths=include_files,
+                detector=self.language_detector,
+                manifest_cache=self.manifest_cache,
+                line_counter=self.line_counter,
+                base_dir=package_path,
+                structure=self._new_structure_summary(),
+                symbol_sample_size=int(
+                    self.analysis_settings.get('symbol_max_files', DEFAULT_MAX_SYMBOL_FILES)
+                ) if self.symbol_extractor is not None else 0,
+                line_counts=line_counts
+            )
+            
+            budget = AnalysisBudget(
+                max_seconds=self.analysis_settings.get('max_seconds', 30) if max_seconds is None else max_seconds,
+                max_files=self.analysis_settings.get('max_files', 0) if max_files is None else max_files
+            )
+            
+            def should_stop():
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    return True
+                return budget.is_limited and budget.expired()
+            
+            if tracked is not None:
+                files = walker.walk_tracked(tracked, should_stop=should_stop, start_dir=package_path)
+            else:
+                files = walker.walk(
+                    workers=int(self.analysis_settings.get('parallel_workers', 8)),
+                    parallel_min_dirs=int(self.analysis_settings.get('parallel_min_dirs', DEFAULT_PARALLEL_MIN_DIRS)),
+                    should_stop=should_stop,
+                    start_dir=package_path
+                )
+            project_info['source'] = 'git-index' if tracked is not None else 'walk'
+            
+            try:
+                for relative_path, entry in files:
+                    if budget.is_limited and not budget.charge_file():
+                        break
+                    stats.add_file(relative_path, entry)
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        break
+            finally:
+                files.close()
+            
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            
+            stats.update_project_info(project_info)
+            project_info['skipped_links'] = walker.skip_report()
+            if stats.symbol_files:
+                results = self.symbol_extractor.extract_many(stats.symbol_files, should_stop)
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                go_modules = tuple(
+                    manifest['name'] for rel_path, manifest in stats.manifests
+                    if rel_path.rpartition('/')[2] == 'go.mod' and manifest.get('name')
+                )
+                project_info['symbols'] = summarize_symbols(
+                    [(rel_path, language) for rel_path, _, language in stats.symbol_files], results, go_modules
+                )
+            if budget.reason is not None and not walker.completed:
+                mark_truncated(project_info, budget, *walker.progress())
+            
+            if line_counts is not None:
+                # A complete walk of the whole tree saw every file that still has a count
+                if walker.completed and not package_path:
+                    index.line_counts = line_counts.counts
+                else:
+                    index.line_counts.update(line_counts.counts)
+            if index is not None and self.index_cache is not None and (
+                    index.rescanned or (line_counts is not None and line_counts.changed)):
+                self.index_cache.save(index)
+            completed = True
+        
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            print(f"Error analyzing project: {e}")
+            completed = False
+        
+        return project_info, completed
+    
+    def _new_structure_summary(self) -> Optional[StructureSummary]:
+        """Structure accumulator for one analysis, or None when structure_max_chars is 0"""
+        max_chars = int(self.analysis_settings.get('structure_max_chars', DEFAULT_MAX_CHARS))
+        if max_chars <= 0:
+            return None
+        return StructureSummary(
+            max_depth=int(self.analysis_settings.get('structure_max_depth', DEFAULT_MAX_DEPTH)),
+            max_children=int(self.analysis_settings.get('structure_max_children', DEFAULT_MAX_CHILDREN)),
+            max_chars=max_chars
+        )
+    
+    def _run_in_process(self, task: Callable, args: Tuple,
+                        cancel_token: Optional[CancellationToken]) -> Tuple[bool, Any]:
+        """
+        Run a task in the worker process and wait for its result
+        
+        Returns:
+            tuple: (True, result), or (False, None) if the worker process is unusable
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled while waiting
+        """
+        try:
+            pool = self._get_process_pool()
+            # A cancelled run may still be winding down; it must not see the flag cleared
+            if self._process_future is not None:
+                concurrent.futures.wait([self._process_future])
+            self._process_cancel.clear()
+            future = pool.submit(task, *args)
+            self._process_future = future
+            
+            while True:
+                try:
+                    return True, future.result(timeout=PROCESS_POLL_INTERVAL)
+                except concurrent.futures.TimeoutError:
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        self._process_cancel.set()
+                        future.cancel()
+                        raise OperationCancelled()
+        except OperationCancelled:
+            raise
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"Error running analysis process: {e}")
+            self._shutdown_process_pool()
+            self.use_process_pool = False
+            return False, None
+    
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Start the worker process on first use"""
+        if self._process_pool is None:
+            # Forking a process that runs Qt threads is unsafe, always start fresh interpreters
+            context = multiprocessing.get_context('spawn')
+            self._process_cancel = context.Event()
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.analysis_settings, self._process_cancel)
+            )
+        return self._process_pool
+    
+    def _shutdown_process_pool(self):
+        if self._process_pool is not None:
+            self._process_cancel.set()
+            self._process_pool.shutdown(wait=False)
+        self._process_pool = None
+        self._process_future = None
+    
+    def watch_project(self, project_path: str) -> ProjectWatcher:
+        """
+        Keep a live index of a project so later analyses skip the walk
+        
+        Any other watched project is released first. Uses inotify on Linux and
+        periodic rescans elsewhere or when the watch limit is reached.
+        """
+        root = os.path.abspath(project_path)
+        watcher = self.project_watchers.get(root)
+        if watcher is not None:
+            return watcher
+        
+        self.stop_watching()
+        watcher = ProjectWatcher(
+            root,
+            index=self.index_cache.load(root) if self.index_cache else None,
+            excluded_dirs=self.analysis_settings.get('excluded_dirs', DEFAULT_EXCLUDED_DIRS),
+            use_ignore_files=self.analysis_settings.get('use_ignore_files', True),
+            rescan_interval=float(self.analysis_settings.get('watch_rescan_interval', 60)),
+            follow_symlinks=bool(self.analysis_settings.get('follow_symlinks', False)),
+            one_filesystem=bool(self.analysis_settings.get('one_filesystem', False))
+        )
+        watcher.start()
+        self.project_watchers[root] = watcher
+        return watcher
+    
+    def stop_watching(self, project_path: Optional[str] = None):
+        """Stop the watcher of a project, or all watchers when no path is given"""
+        if project_path is None:
+            roots = list(self.project_watchers)
+        else:
+            roots = [os.path.abspath(project_path)]
+        for root in roots:
+            watcher = self.project_watchers.pop(root, None)
+            if watcher is not None:
+                watcher.stop()
+    
+    def invalidate_project_index(self, project_path: Optional[str] = None):
+        """Drop the cached index of a project, or of all projects when no path is given"""
+        self.analysis_memo.clear()
+        self._glob_suggesters.clear()
+        if self.index_cache is not None:
+            self.index_cache.invalidate(project_path)
+    
+    def shutdown(self):
+        """Stop all watchers and the worker process"""
+        self.stop_watching()
+        self._shutdown_process_pool()
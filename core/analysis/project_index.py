@@ -0,0 +1,363 @@
+"""
+Project Index Module - Persistent incremental directory index
+Remembers directory listings per project so unchanged directories are not rescanned
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+INDEX_VERSION = 4
+
+# Default location of persisted indexes
+DEFAULT_INDEX_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.windforge', 'cache', 'index')
+
+# Directories modified this recently are rescanned next time, since a change
+# within the same timestamp tick would otherwise go unnoticed
+RACY_WINDOW_NS = 2 * 10**9
+
+
+class IndexedStat:
+    """Subset of os.stat_result recorded in the index"""
+    
+    __slots__ = ('st_size', 'st_mtime_ns')
+    
+    def __init__(self, size: int, mtime_ns: int):
+        self.st_size = size
+        self.st_mtime_ns = mtime_ns
+    
+    @property
+    def st_mtime(self) -> float:
+        return self.st_mtime_ns / 1e9
+
+
+class IndexedEntry:
+    """os.DirEntry stand-in served from the index"""
+    
+    __slots__ = ('name', 'path', '_is_dir', '_stat', '_inode', '_is_link', '_trusted', '_current')
+    
+    def __init__(self, name: str, path: str, is_dir: bool, stat: Optional[IndexedStat] = None,
+                 inode: int = 0, is_link: bool = False, trusted: bool = False):
+        self.name = name
+        self.path = path
+        self._is_dir = is_dir
+        self._stat = stat
+        self._inode = inode
+        # Only symlinks to directories are indexed as links
+        self._is_link = is_link
+        # Set for git index entries that are not racy, see entry_stat()
+        self._trusted = trusted
+        self._current = None
+    
+    def inode(self) -> int:
+        return self._inode
+    
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir and (follow_symlinks or not self._is_link)
+    
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return not self._is_dir
+    
+    def is_symlink(self) -> bool:
+        return self._is_link
+    
+    def stat(self, follow_symlinks: bool = True) -> IndexedStat:
+        return self._stat
+    
+    def current_stat(self) -> os.stat_result:
+        """Stat of the file as it is now, taken once"""
+        if self._current is None:
+            self._current = os.stat(self.path)
+        return self._current
+
+
+def current_stat(entry) -> os.stat_result:
+    """
+    Stat of the file a walker entry stands for, as it is now
+    
+    os.DirEntry stats are taken during the current walk. Index entries carry
+    the metadata recorded when their directory was listed, which lags behind
+    in-place edits, so anything cached by content must use this instead.
+    
+    Raises:
+        OSError: If the file is gone
+    """
+    if isinstance(entry, IndexedEntry):
+        return entry.current_stat()
+    return entry.stat()
+
+
+def entry_stat(entry):
+    """
+    Stat to key per-file caches (line counts, sniffed languages, parsed files) by
+    
+    Git index entries whose mtime is older than the index file are trusted
+    like git trusts them: their recorded size and mtime are returned without
+    touching the file. Racy git entries, directory index entries and
+    os.DirEntry objects get current_stat().
+    
+    Raises:
+        OSError: If the file is gone
+    """
+    if isinstance(entry, IndexedEntry) and entry._trusted:
+        return entry._stat
+    return current_stat(entry)
+
+
+class ProjectIndex:
+    """
+    Directory listings of one project keyed by relative directory path
+    (safe to share between the walker's listing threads)
+    
+    Each record holds the directory mtime, its files as name -> [size, mtime_ns, inode],
+    its subdirectory names and the names of its symlinks to directories. A record is reused as long as the directory's
+    own mtime is unchanged, i.e. no entry was added, removed or renamed.
+    File metadata of reused records can lag behind in-place content edits.
+    
+    Line counts are kept alongside as relative path -> [size, mtime_ns, lines]
+    (lines -1 for files that were not counted), so they survive restarts.
+    
+    A live watcher can mark the index as trusted: records are then reused
+    without stat-ing the directory, unless the watcher marked it dirty.
+    """
+    
+    def __init__(self, root: str, dirs: Optional[Dict[str, Dict]] = None,
+                 line_counts: Optional[Dict[str, List[int]]] = None):
+        self.root = os.path.abspath(root)
+        self.dirs = dirs or {}
+        self.line_counts: Dict[str, List[int]] = line_counts or {}
+        self.visited = set()
+        self.rescanned = 0
+        self.reused = 0
+        self.trusted = False
+        self.dirty = set()
+        self._lock = threading.Lock()
+        # Held for a whole walk so a watcher's rescans never interleave with an analysis
+        self.walk_lock = threading.Lock()
+    
+    def list_directory(self, dir_path: str, rel_dir: str) -> List[IndexedEntry]:
+        """
+        List a directory, rescanning it only if its mtime changed
+        
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        record = self._record(dir_path, rel_dir)
+        entries = [
+            IndexedEntry(name, os.path.join(dir_path, name), True)
+            for name in record['subdirs']
+        ]
+        entries.extend(
+            IndexedEntry(name, os.path.join(dir_path, name), True, is_link=True)
+            for name in record['links']
+        )
+        entries.extend(
+            IndexedEntry(name, os.path.join(dir_path, name), False, IndexedStat(size, file_mtime), inode)
+            for name, (size, file_mtime, inode) in record['files'].items()
+        )
+        return entries
+    
+    def list_names(self, dir_path: str, rel_dir: str) -> Set[str]:
+        """
+        Names of the files, subdirectories and directory links in a directory,
+        rescanning it only if its mtime changed
+        
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        record = self._record(dir_path, rel_dir)
+        names = set(record['files'])
+        names.update(record['subdirs'])
+        names.update(record['links'])
+        return names
+    
+    def _record(self, dir_path: str, rel_dir: str) -> Dict:
+        """Index record of a directory, rescanned if it changed"""
+        with self._lock:
+            record = self.dirs.get(rel_dir)
+            forced = rel_dir in self.dirty
+            self.dirty.discard(rel_dir)
+        
+        if record is not None and self.trusted and not forced:
+            mtime_ns = record['mtime']
+        else:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        
+        if record is None or forced or record['mtime'] != mtime_ns:
+            record = self._scan(dir_path, mtime_ns)
+            with self._lock:
+                self.dirs[rel_dir] = record
+                self.visited.add(rel_dir)
+                self.rescanned += 1
+        else:
+            with self._lock:
+                self.visited.add(rel_dir)
+                self.reused += 1
+        return record
+    
+    def _scan(self, dir_path: str, mtime_ns: int) -> Dict:
+        """Read a directory from disk into an index record"""
+        files = {}
+        subdirs = []
+        links = []
+        
+        with os.scandir(dir_path) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files[entry.name] = [stat.st_size, stat.st_mtime_ns, entry.inode()]
+                    elif entry.is_symlink() and entry.is_dir():
+                        links.append(entry.name)
+                except OSError:
+                    continue
+        
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            mtime_ns = -1
+        
+        return {'mtime': mtime_ns, 'files': files, 'subdirs': subdirs, 'links': links}
+    
+    def mark_dirty(self, rel_dirs):
+        """Force the given directories to be rescanned by the next walk"""
+        with self._lock:
+            self.dirty.update(rel_dirs)
+    
+    def mark_all_dirty(self):
+        """Force every known directory to be rescanned by the next walk"""
+        with self._lock:
+            self.dirty.update(self.dirs)
+    
+    def begin_walk(self):
+        """Reset per-walk bookkeeping"""
+        with self._lock:
+            self.visited = set()
+            self.rescanned = 0
+            self.reused = 0
+    
+    def prune_unvisited(self):
+        """Drop records of directories that were not reached by the last complete walk"""
+        self.dirs = {rel_dir: record for rel_dir, record in self.dirs.items() if rel_dir in self.visited}
+    
+    def to_dict(self) -> Dict:
+        return {'version': INDEX_VERSION, 'root': self.root, 'dirs': self.dirs, 'lines': self.line_counts}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ProjectIndex':
+        return cls(data['root'], data.get('dirs', {}), data.get('lines', {}))
+
+
+class ProjectIndexCache:
+    """On-disk store of project indexes with size-bounded LRU eviction across projects"""
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024,
+                 max_loaded: int = 4):
+        self.cache_dir = cache_dir or DEFAULT_INDEX_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.max_loaded = max_loaded
+        self._loaded: 'OrderedDict[str, ProjectIndex]' = OrderedDict()
+    
+    def _index_path(self, root: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def load(self, root: str) -> ProjectIndex:
+        """Get the index for a project root, empty if none was saved"""
+        root = os.path.abspath(root)
+        index = self._loaded.get(root)
+        if index is not None:
+            self._loaded.move_to_end(root)
+            return index
+        
+        index = None
+        path = self._index_path(root)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION and data.get('root') == root:
+                index = ProjectIndex.from_dict(data)
+            # Touch the file so eviction sees it as recently used
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        if index is None:
+            index = ProjectIndex(root)
+        self._remember(index)
+        return index
+    
+    def save(self, index: ProjectIndex) -> bool:
+        """Persist an index and evict the least recently used ones over the size limit"""
+        self._remember(index)
+        path = self._index_path(index.root)
+        temp_path = path + '.tmp'
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # A watcher may be refreshing the index; wait for its walk to finish
+            with index.walk_lock, open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(index.to_dict(), f, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error saving project index: {e}")
+            return False
+        
+        self.evict(keep=path)
+        return True
+    
+    def invalidate(self, root: Optional[str] = None):
+        """Forget the index of one project, or of every project when root is None"""
+        if root is None:
+            self._loaded.clear()
+            paths = self._cache_files()
+        else:
+            self._loaded.pop(os.path.abspath(root), None)
+            paths = [self._index_path(root)]
+        
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def evict(self, keep: Optional[str] = None):
+        """Delete least recently used index files until the cache fits in max_bytes"""
+        files = []
+        total = 0
+        for path in self._cache_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def _cache_files(self) -> List[str]:
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names if name.endswith('.json')]
+    
+    def _remember(self, index: ProjectIndex):
+        self._loaded[index.root] = index
+        self._loaded.move_to_end(index.root)
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
@@ -0,0 +1,220 @@
+"""
+Project Stats Module - Bounded-memory project statistics
+Aggregates walker output into counts and sets without keeping every path around
+"""
+
+import hashlib
+import heapq
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .language_detector import LanguageDetector
+from .line_counter import LineCountStore, LineCounter
+from .manifest_parser import MANIFEST_ECOSYSTEMS, ManifestCache, manifest_kind
+from .project_index import entry_stat
+from .workspaces import detect_packages
+from .structure_summary import StructureSummary
+from .symbol_extractor import SYMBOL_LANGUAGES
+
+DEFAULT_SAMPLE_SIZE = 200
+
+# Data formats are reported but left out of the language shares, a single
+# lock file or fixture would otherwise dwarf the actual code
+DATA_LANGUAGES = frozenset(('JSON', 'XML', 'YAML'))
+
+
+class CompactPathList:
+    """
+    Append-only list of paths stored with front coding
+    
+    Each path is stored as the length of the prefix it shares with the previous
+    path plus the remaining suffix, packed into a single bytearray. Walk order
+    keeps siblings together, so most of every path is shared.
+    """
+    
+    def __init__(self):
+        self._data = bytearray()
+        self._previous = ''
+        self._count = 0
+    
+    @staticmethod
+    def _write_varint(buffer: bytearray, value: int):
+        while value >= 0x80:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+    
+    @staticmethod
+    def _read_varint(data: bytearray, pos: int):
+        result = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+    
+    def append(self, path: str):
+        previous = self._previous
+        limit = min(len(previous), len(path))
+        shared = 0
+        while shared < limit and previous[shared] == path[shared]:
+            shared += 1
+        
+        suffix = path[shared:].encode('utf-8', 'surrogateescape')
+        self._write_varint(self._data, shared)
+        self._write_varint(self._data, len(suffix))
+        self._data += suffix
+        self._previous = path
+        self._count += 1
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[str]:
+        data = self._data
+        pos = 0
+        previous = ''
+        while pos < len(data):
+            shared, pos = self._read_varint(data, pos)
+            length, pos = self._read_varint(data, pos)
+            previous = previous[:shared] + data[pos:pos + length].decode('utf-8', 'surrogateescape')
+            pos += length
+            yield previous
+    
+    def to_list(self) -> List[str]:
+        return list(self)
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the encoded paths"""
+        return len(self._data)
+
+
+class ProjectStats:
+    """Streaming accumulator for analyze_project"""
+    
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, keep_all_paths: bool = False,
+                 seed: Optional[int] = None, detector: Optional[LanguageDetector] = None,
+                 manifest_cache: Optional[ManifestCache] = None,
+                 line_counter: Optional[LineCounter] = None, base_dir: str = '',
+                 structure: Optional[StructureSummary] = None, symbol_sample_size: int = 0,
+                 line_counts: Optional[LineCountStore] = None):
+        self.file_count = 0
+        # Directory the walk started from, packages are looked for below it
+        self.base_dir = base_dir
+        self._base_prefix = base_dir + '/' if base_dir else ''
+        # Directory outline built in the same pass; None skips it
+        self.structure = structure
+        # Per-language totals, languages are ranked by bytes rather than by presence
+        self.language_bytes: Dict[str, int] = {}
+        self.language_files: Dict[str, int] = {}
+        self.language_lines: Dict[str, int] = {}
+        # Line counting is optional; None skips it entirely
+        self.line_counter = line_counter
+        # Persisted counts of the project, so unchanged files are not read again
+        self.line_counts = line_counts
+        self.frameworks = set()
+        self.detector = detector or LanguageDetector()
+        self.manifest_cache = manifest_cache or ManifestCache()
+        # (relative path, parsed manifest) for every manifest seen
+        self.manifests: List[Tuple[str, Dict]] = []
+        self.sample_size = sample_size
+        self.sample: List[str] = []
+        # Source files for symbol extraction: the ones with the lowest path hashes, so
+        # every run (in any walk order) picks the same files and builds the same prompt
+        self.symbol_sample_size = symbol_sample_size
+        self._symbol_heap: List[Tuple[int, str, object, str]] = []
+        self.all_paths = CompactPathList() if keep_all_paths else None
+        self._random = random.Random(seed)
+    
+    def add_file(self, rel_path: str, entry):
+        """Account for one reported file (os.DirEntry or IndexedEntry)"""
+        self.file_count += 1
+        
+        # Reservoir sampling keeps a uniform sample of every path seen so far
+        if len(self.sample) < self.sample_size:
+            self.sample.append(rel_path)
+        else:
+            slot = self._random.randrange(self.file_count)
+            if slot < self.sample_size:
+                self.sample[slot] = rel_path
+        
+        if self.all_paths is not None:
+            self.all_paths.append(rel_path)
+        
+        if self.structure is not None:
+            self.structure.add_file(rel_path[len(self._base_prefix):])
+        
+        # Detect language
+        language = self.detector.detect(entry)
+        if language is not None:
+            try:
+                size = entry_stat(entry).st_size
+            except OSError:
+                size = 0
+            self.language_bytes[language] = self.language_bytes.get(language, 0) + size
+            self.language_files[language] = self.language_files.get(language, 0) + 1
+            if self.symbol_sample_size and language in SYMBOL_LANGUAGES:
+                self._sample_symbol_file(rel_path, entry, language)
+            if self.line_counter is not None:
+                lines = self.line_counter.count(entry, self.line_counts, rel_path)
+                if lines:
+                    self.language_lines[language] = self.language_lines.get(language, 0) + lines
+        
+        # Detect frameworks from manifest contents
+        kind = manifest_kind(entry.name)
+        if kind is not None:
+            manifest = self.manifest_cache.get(entry, kind)
+            if manifest is not None:
+                self.manifests.append((rel_path, manifest))
+                self.frameworks.update(manifest['frameworks'])
+            else:
+                self.frameworks.add(MANIFEST_ECOSYSTEMS[kind])
+    
+    def _sample_symbol_file(self, rel_path: str, entry, language: str):
+        digest = hashlib.blake2b(rel_path.encode('utf-8', 'surrogateescape'), digest_size=8).digest()
+        # Max-heap on the hash: the root is the file to drop first
+        item = (-int.from_bytes(digest, 'big'), rel_path, entry, language)
+        if len(self._symbol_heap) < self.symbol_sample_size:
+            heapq.heappush(self._symbol_heap, item)
+        elif item[0] > self._symbol_heap[0][0]:
+            heapq.heapreplace(self._symbol_heap, item)
+    
+    @property
+    def symbol_files(self) -> List[Tuple[str, object, str]]:
+        """Sampled source files as (path, entry, language), in path order"""
+        return sorted((rel_path, entry, language) for _, rel_path, entry, language in self._symbol_heap)
+    
+    def update_project_info(self, project_info: Dict):
+        """Write the aggregates into a project_info dictionary"""
+        project_info['file_count'] = self.file_count
+        ranked = sorted(
+            self.language_bytes,
+            key=lambda language: (-self.language_bytes[language], -self.language_files[language], language)
+        )
+        project_info['languages'] = ranked
+        project_info['language_bytes'] = {language: self.language_bytes[language] for language in ranked}
+        project_info['language_files'] = {language: self.language_files[language] for language in ranked}
+        project_info['language_lines'] = {
+            language: self.language_lines[language] for language in ranked if language in self.language_lines
+        }
+        
+        code_bytes = sum(self.language_bytes[language] for language in ranked if language not in DATA_LANGUAGES)
+        project_info['language_share'] = {
+            language: round(100.0 * self.language_bytes[language] / code_bytes, 1)
+            for language in ranked
+            if language not in DATA_LANGUAGES and code_bytes > 0
+        }
+        project_info['frameworks'] = sorted(self.frameworks)
+        project_info['manifests'] = [rel_path for rel_path, _ in self.manifests]
+        project_info['manifest_count'] = len(self.manifests)
+        packages, declared = detect_packages(self.manifests, self.base_dir)
+        project_info['packages'] = packages
+        project_info['monorepo'] = declared or len(packages) > 1
+        project_info['structure'] = self.structure.to_dict() if self.structure is not None else {}
+        project_info['sample_files'] = sorted(self.sample)
+        project_info['files'] = self.all_paths if self.all_paths is not None else project_info['sample_files']
+        project_info['files_sampled'] = self.all_paths is None
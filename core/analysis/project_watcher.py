@@ -0,0 +1,283 @@
+"""
+Project Watcher Module - Keep a project index current in the background
+Uses inotify on Linux and falls back to periodic rescans elsewhere or when the
+inotify watch limit is reached
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from .project_index import ProjectIndex
+from .walker import ProjectWalker
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """Return libc if it provides inotify, otherwise None"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class WatchLimitReached(Exception):
+    """Raised when the kernel refuses more inotify watches"""
+    pass
+
+
+class ProjectWatcher:
+    """
+    Background thread that keeps a ProjectIndex of one tree up to date
+    
+    In 'inotify' mode every watched directory that sees an event is marked
+    dirty in the index; bursts (e.g. a git checkout) are coalesced until the
+    tree has been quiet for coalesce_delay seconds. While live, the index is
+    trusted, so an analysis reads it without touching the disk except for
+    dirty directories. In 'polling' mode the tree is rescanned every
+    rescan_interval seconds and the index is verified by mtimes as usual.
+    """
+    
+    def __init__(self, root: str, index: Optional[ProjectIndex] = None,
+                 excluded_dirs: Optional[Iterable[str]] = None, use_ignore_files: bool = True,
+                 coalesce_delay: float = 0.3, max_coalesce_delay: float = 2.0,
+                 rescan_interval: float = 60.0, follow_symlinks: bool = False,
+                 one_filesystem: bool = False):
+        self.root = os.path.abspath(root)
+        self.index = index if index is not None else ProjectIndex(self.root)
+        self.walker = ProjectWalker(self.root, excluded_dirs=excluded_dirs,
+                                    use_ignore_files=use_ignore_files, index=self.index,
+                                    follow_symlinks=follow_symlinks, one_filesystem=one_filesystem)
+        self.coalesce_delay = coalesce_delay
+        self.max_coalesce_delay = max_coalesce_delay
+        self.rescan_interval = rescan_interval
+        
+        self.mode = 'stopped'
+        # Incremented whenever a batch of changes has been applied to the index
+        self.version = 0
+        
+        self._libc = _load_inotify()
+        self._fd = -1
+        self._watches: Dict[int, str] = {}
+        self._pending: Set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_read, self._wake_write = os.pipe()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_live(self) -> bool:
+        """True while inotify events keep the index current"""
+        return self.mode == 'inotify'
+    
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='windforge-watcher', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop watching and release the inotify descriptor"""
+        self._stop_event.set()
+        try:
+            os.write(self._wake_write, b'x')
+        except OSError:
+            pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        self._close_inotify()
+        self.index.trusted = False
+        self.mode = 'stopped'
+        for fd in (self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_read = self._wake_write = -1
+    
+    def flush(self):
+        """Apply coalesced events right away (called before an analysis)"""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = set()
+            if pending:
+                self.index.mark_dirty(pending)
+                self.version += 1
+    
+    def _run(self):
+        # Populate the index before events are trusted
+        self._rescan()
+        
+        if self._libc is not None:
+            try:
+                self._start_inotify()
+                # Catch anything that changed between the first scan and the watches
+                self._rescan()
+                self.index.trusted = True
+                self.mode = 'inotify'
+                self._event_loop()
+                return
+            except WatchLimitReached:
+                print("Watch limit reached - falling back to periodic rescans")
+            except OSError as e:
+                print(f"inotify unavailable - falling back to periodic rescans: {e}")
+            self._close_inotify()
+            self.index.trusted = False
+            self.flush()
+        
+        self.mode = 'polling'
+        while not self._stop_event.wait(self.rescan_interval):
+            self._rescan()
+    
+    def _rescan(self):
+        """Walk the tree through the index, refreshing changed directories"""
+        changed = False
+        try:
+            for _ in self.walker.walk(should_stop=self._stop_event.is_set):
+                pass
+            changed = self.index.rescanned > 0
+        except Exception as e:
+            print(f"Error rescanning project: {e}")
+        if changed:
+            with self._pending_lock:
+                self.version += 1
+    
+    def _start_inotify(self):
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        for rel_dir in sorted(self.index.dirs):
+            self._add_watch(rel_dir)
+    
+    def _add_watch(self, rel_dir: str):
+        path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise WatchLimitReached()
+            # The directory vanished or is unreadable, the next walk will notice
+            return
+        self._watches[wd] = rel_dir
+    
+    def _add_watch_tree(self, rel_dir: str):
+        """Watch a newly created directory and everything below it"""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            self._add_watch(current)
+            try:
+                with os.scandir(os.path.join(self.root, current)) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and not self.walker.is_excluded(entry.name, True):
+                            stack.append(f"{current}/{entry.name}")
+            except OSError:
+                continue
+    
+    def _close_inotify(self):
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = -1
+        self._watches = {}
+    
+    def _event_loop(self):
+        first_event = None
+        last_event = None
+        
+        while not self._stop_event.is_set():
+            if last_event is None:
+                timeout = None
+            else:
+                deadline = min(last_event + self.coalesce_delay, first_event + self.max_coalesce_delay)
+                timeout = max(0.0, deadline - time.monotonic())
+            
+            readable, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+            if self._stop_event.is_set():
+                return
+            
+            if self._fd in readable:
+                if self._read_events():
+                    last_event = time.monotonic()
+                    if first_event is None:
+                        first_event = last_event
+            elif last_event is not None:
+                # Quiet long enough (or the burst ran too long): publish the batch
+                self.flush()
+                first_event = last_event = None
+    
+    def _read_events(self) -> bool:
+        """Read queued events into the pending set; returns True if anything was queued"""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        
+        dirty = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                self.index.mark_all_dirty()
+                dirty.add('')
+                continue
+            
+            rel_dir = self._watches.get(wd)
+            if rel_dir is None:
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            
+            dirty.add(rel_dir)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and not self.walker.is_excluded(name, True):
+                child = f"{rel_dir}/{name}" if rel_dir else name
+                # WatchLimitReached propagates to _run, which switches to polling
+                self._add_watch_tree(child)
+        
+        if dirty:
+            with self._pending_lock:
+                self._pending.update(dirty)
+        return bool(dirty)
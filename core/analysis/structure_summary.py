@@ -0,0 +1,159 @@
+"""
+Structure Summary Module - Budgeted directory tree summary
+Builds a compact outline of a project while it is walked, for use in prompts
+"""
+
+from typing import Dict, List
+
+DEFAULT_MAX_DEPTH = 4
+DEFAULT_MAX_CHILDREN = 8
+DEFAULT_MAX_CHARS = 2000
+
+# Directories are not tracked beyond this many nodes; deeper files count towards their ancestor
+DEFAULT_MAX_NODES = 4096
+
+# A subtree whose files are at least this share of one kind is shown as a single pattern
+REPEAT_SHARE = 0.9
+REPEAT_MIN_FILES = 10
+
+ROOT_FILE_NAMES = 12
+
+
+def file_kind(name: str) -> str:
+    """Glob fragment grouping a file with its siblings: '*.tsx', or the name when there is no extension"""
+    dot = name.rfind('.')
+    if dot <= 0:
+        return name
+    return '*' + name[dot:].lower()
+
+
+def _files(count: int) -> str:
+    return f"{count:,} file" if count == 1 else f"{count:,} files"
+
+
+def _dominant_kind(node: '_DirNode'):
+    return max(node.kinds.items(), key=lambda item: (item[1], item[0]))
+
+
+def _format_kinds(kinds: Dict[str, int], limit: int = 3) -> str:
+    ranked = sorted(kinds.items(), key=lambda item: (-item[1], item[0]))
+    parts = [f"{kind} ×{count:,}" for kind, count in ranked[:limit]]
+    rest = sum(count for _, count in ranked[limit:])
+    if rest:
+        parts.append(f"+{rest:,} other")
+    return ', '.join(parts)
+
+
+class _DirNode:
+    """Counts of one directory and everything below it"""
+    
+    __slots__ = ('children', 'total', 'kinds', 'direct_kinds')
+    
+    def __init__(self):
+        self.children: Dict[str, '_DirNode'] = {}
+        self.total = 0
+        self.kinds: Dict[str, int] = {}
+        # Files not counted in any tracked child (too deep, or over the node limit)
+        self.direct_kinds: Dict[str, int] = {}
+
+
+class StructureSummary:
+    """
+    Streaming directory tree with per-subtree file counts by kind
+    
+    Only counts are kept, so memory depends on the number of tracked
+    directories (at most max_nodes), not on the number of files. Rendering
+    trims the outline to the depth, fan-out and character budgets, and a
+    subtree made almost entirely of one kind of file collapses into a
+    single line such as 'src/components/**/*.tsx ×1,240'.
+    """
+    
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, max_children: int = DEFAULT_MAX_CHILDREN,
+                 max_chars: int = DEFAULT_MAX_CHARS, max_nodes: int = DEFAULT_MAX_NODES):
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.max_chars = max_chars
+        self.max_nodes = max_nodes
+        self.root = _DirNode()
+        self.node_count = 1
+        self.root_files: List[str] = []
+    
+    def add_file(self, rel_path: str):
+        """Account for one file ('/' separated path relative to the summarized directory)"""
+        parts = rel_path.split('/')
+        kind = file_kind(parts[-1])
+        
+        node = self.root
+        node.total += 1
+        node.kinds[kind] = node.kinds.get(kind, 0) + 1
+        # Nodes go deeper than the render depth so single-child chains can be followed
+        for name in parts[:-1][:self.max_depth * 2]:
+            child = node.children.get(name)
+            if child is None:
+                if self.node_count >= self.max_nodes:
+                    break
+                child = node.children[name] = _DirNode()
+                self.node_count += 1
+            node = child
+            node.total += 1
+            node.kinds[kind] = node.kinds.get(kind, 0) + 1
+        
+        node.direct_kinds[kind] = node.direct_kinds.get(kind, 0) + 1
+        if len(parts) == 1 and len(self.root_files) < ROOT_FILE_NAMES:
+            self.root_files.append(parts[0])
+    
+    def render(self) -> str:
+        """Outline within the budgets, shallower outlines are tried until one fits"""
+        text = ''
+        for depth in range(max(1, self.max_depth), 0, -1):
+            lines: List[str] = []
+            self._render_children(self.root, depth, '', lines)
+            text = '\n'.join(lines)
+            if len(text) <= self.max_chars:
+                return text
+        return text[:max(0, self.max_chars - 1)].rsplit('\n', 1)[0] + '\n…'
+    
+    def _render_children(self, node: _DirNode, depth: int, indent: str, lines: List[str]):
+        ranked = sorted(node.children.items(), key=lambda item: (-item[1].total, item[0]))
+        for name, child in ranked[:self.max_children]:
+            self._render_node(child, name + '/', depth, indent, lines)
+        hidden = ranked[self.max_children:]
+        if hidden:
+            hidden_files = sum(child.total for _, child in hidden)
+            lines.append(f"{indent}… +{len(hidden):,} dirs ({_files(hidden_files)})")
+        
+        if node is self.root:
+            if self.root_files:
+                more = sum(node.direct_kinds.values()) - len(self.root_files)
+                lines.append(', '.join(sorted(self.root_files)) + (f" (+{_files(more)})" if more > 0 else ''))
+        elif node.direct_kinds:
+            lines.append(f"{indent}{_format_kinds(node.direct_kinds)}")
+    
+    def _render_node(self, node: _DirNode, label: str, depth: int, indent: str, lines: List[str]):
+        # Directories holding nothing but one subdirectory are shown as one path (com/example/app/)
+        while len(node.children) == 1 and not node.direct_kinds:
+            name, node = next(iter(node.children.items()))
+            label += name + '/'
+        
+        kind, count = _dominant_kind(node)
+        repetitive = count >= REPEAT_MIN_FILES and count >= REPEAT_SHARE * node.total
+        # With depth to spare, only collapse when every subdirectory holds the same kind of file
+        if repetitive and depth > 1:
+            repetitive = all(_dominant_kind(child)[0] == kind for child in node.children.values())
+        if repetitive:
+            pattern = f"{label}{'**/' if node.children else ''}{kind} ×{count:,}"
+            rest = node.total - count
+            lines.append(f"{indent}{pattern}" + (f" (+{rest:,} other)" if rest else ''))
+        elif depth <= 1 or not node.children:
+            lines.append(f"{indent}{label} ({_files(node.total)}: {_format_kinds(node.kinds)})")
+        else:
+            lines.append(f"{indent}{label} ({_files(node.total)})")
+            self._render_children(node, depth - 1, indent + '  ', lines)
+    
+    def to_dict(self) -> Dict:
+        """Structure entry for project_info"""
+        return {
+            'summary': self.render(),
+            'top_level': {name: child.total for name, child in self.root.children.items()},
+            'directories': self.node_count - 1
+        }
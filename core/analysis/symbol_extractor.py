@@ -0,0 +1,290 @@
+"""
+Symbol Extractor Module - Top-level definitions and imports of source files
+Parses Python with ast and scans JavaScript, TypeScript and Go with regular expressions
+"""
+
+import ast
+import hashlib
+import posixpath
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .project_index import entry_stat
+
+# Languages with an extractor
+SYMBOL_LANGUAGES = frozenset(('Python', 'JavaScript', 'TypeScript', 'Go'))
+
+# Larger files are mostly generated or vendored, and slow to parse
+MAX_SYMBOL_FILE_BYTES = 512 * 1024
+
+DEFAULT_MAX_SYMBOL_FILES = 400
+
+_PYTHON_STDLIB = frozenset(getattr(sys, 'stdlib_module_names', ()))
+
+_JS_IMPORT_RE = re.compile(
+    r'''(?:^|[;\n])\s*(?:import|export)\s[^'"`;]*?\bfrom\s*['"]([^'"]+)['"]'''
+    r'''|(?:^|[;\n])\s*import\s*['"]([^'"]+)['"]'''
+    r'''|\brequire\(\s*['"]([^'"]+)['"]\s*\)'''
+    r'''|\bimport\(\s*['"]([^'"]+)['"]\s*\)'''
+)
+_JS_DEFINITION_RE = re.compile(
+    r'^(?:export\s+(?:default\s+)?)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?'
+    r'(?:function\*?|class|interface|type|enum|const|let|var)\s+([A-Za-z_$][\w$]*)',
+    re.MULTILINE
+)
+_GO_IMPORT_BLOCK_RE = re.compile(r'^import\s*\(([^)]*)\)', re.MULTILINE)
+_GO_IMPORT_RE = re.compile(r'^import\s+(?:[\w.]+\s+)?"([^"]+)"', re.MULTILINE)
+_GO_BLOCK_ITEM_RE = re.compile(r'^\s*(?:[\w.]+\s+)?"([^"]+)"', re.MULTILINE)
+_GO_DEFINITION_RE = re.compile(
+    r'^(?:func\s+(?:\([^)]*\)\s*)?|type\s+)([A-Za-z_]\w*)',
+    re.MULTILINE
+)
+
+
+def _public(names: List[str]) -> List[str]:
+    return [name for name in names if not name.startswith('_')]
+
+
+def extract_python(text: str) -> Dict[str, List[str]]:
+    """Public top-level classes and functions, and imported modules ('.x' for relative ones)"""
+    result = {'definitions': [], 'imports': []}
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return result
+    
+    result['definitions'] = _public([
+        node.name for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    ])
+    
+    # Imports inside functions and conditionals count too
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            result['imports'].extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            result['imports'].append('.' * node.level + (node.module or ''))
+    return result
+
+
+def extract_javascript(text: str) -> Dict[str, List[str]]:
+    """Top-level declarations and imported specifiers of JavaScript or TypeScript code"""
+    imports = []
+    for match in _JS_IMPORT_RE.finditer(text):
+        imports.append(next(group for group in match.groups() if group))
+    return {'definitions': _public(_JS_DEFINITION_RE.findall(text)), 'imports': imports}
+
+
+def extract_go(text: str) -> Dict[str, List[str]]:
+    """Top-level functions, methods and types, and imported package paths of Go code"""
+    imports = _GO_IMPORT_RE.findall(text)
+    for block in _GO_IMPORT_BLOCK_RE.findall(text):
+        imports.extend(_GO_BLOCK_ITEM_RE.findall(block))
+    return {'definitions': _public(_GO_DEFINITION_RE.findall(text)), 'imports': imports}
+
+
+_EXTRACTORS = {
+    'Python': extract_python,
+    'JavaScript': extract_javascript,
+    'TypeScript': extract_javascript,
+    'Go': extract_go
+}
+
+
+def _strip_source_suffix(path: str) -> str:
+    for suffix in ('/index.tsx', '/index.ts', '/index.jsx', '/index.js', '/__init__.py',
+                   '.tsx', '.ts', '.jsx', '.mjs', '.cjs', '.js', '.py'):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def classify_import(language: str, specifier: str, rel_path: str,
+                    local_roots: frozenset = frozenset(), go_modules: Tuple[str, ...] = ()) -> Optional[Tuple[str, bool]]:
+    """
+    Reduce an import to the package or project module it names
+    
+    Args:
+        language (str): Language of the importing file
+        specifier (str): Imported module as written
+        rel_path (str): Importing file, relative to the project root
+        local_roots (frozenset): Top-level Python packages that live in the project
+        go_modules (tuple): Module paths declared by the project's go.mod files
+    
+    Returns:
+        tuple: (name, internal) where internal names are '/' separated project
+               paths, or None for standard library imports
+    """
+    directory = posixpath.dirname(rel_path)
+    if language == 'Python':
+        if specifier.startswith('.'):
+            level = len(specifier) - len(specifier.lstrip('.'))
+            base = directory.split('/') if directory else []
+            base = base[:len(base) - (level - 1)] if level > 1 else base
+            module = specifier[level:].replace('.', '/')
+            return '/'.join(part for part in base + [module] if part), True
+        top = specifier.split('.', 1)[0]
+        if top in local_roots:
+            return specifier.replace('.', '/'), True
+        if top in _PYTHON_STDLIB:
+            return None
+        return top, False
+    if language == 'Go':
+        for module in go_modules:
+            if specifier == module or specifier.startswith(module + '/'):
+                return specifier[len(module):].lstrip('/') or '.', True
+        if '.' not in specifier.split('/', 1)[0]:
+            return None
+        return specifier, False
+    # JavaScript and TypeScript
+    if specifier.startswith('.'):
+        return _strip_source_suffix(posixpath.normpath(posixpath.join(directory, specifier))), True
+    if specifier.startswith(('/', '~/', '@/', '#')):
+        return specifier, True
+    if specifier.startswith('node:'):
+        return None
+    parts = specifier.split('/')
+    return ('/'.join(parts[:2]) if specifier.startswith('@') else parts[0]), False
+
+
+class SymbolExtractor:
+    """
+    Extracts definitions and imports on a thread pool, caching results per content hash
+    
+    A (path, mtime, size) shortcut skips reading files that did not change
+    since the last run; identical content anywhere in any project is parsed once.
+    The caches are shared by the pool threads, so they are only touched under a lock.
+    """
+    
+    def __init__(self, workers: int = 4, max_entries: int = 20000):
+        self.workers = workers
+        self.max_entries = max_entries
+        self._by_hash: Dict[str, Dict[str, List[str]]] = {}
+        self._by_stat: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self.parsed = 0
+    
+    def extract(self, entry, language: str) -> Optional[Dict[str, List[str]]]:
+        """Definitions and imports of one walker entry, or None if it cannot be read"""
+        extractor = _EXTRACTORS.get(language)
+        if extractor is None:
+            return None
+        try:
+            stat = entry_stat(entry)
+        except OSError:
+            return None
+        if stat.st_size > MAX_SYMBOL_FILE_BYTES:
+            return None
+        
+        stat_key = (entry.path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._by_stat.get(stat_key)
+            result = self._by_hash.get(digest) if digest is not None else None
+        if result is not None:
+            return result
+        
+        try:
+            with open(entry.path, 'rb') as f:
+                content = f.read(MAX_SYMBOL_FILE_BYTES + 1)
+        except OSError:
+            return None
+        
+        digest = hashlib.sha1(language.encode('utf-8') + b'\0' + content).hexdigest()
+        with self._lock:
+            result = self._by_hash.get(digest)
+        if result is None:
+            # Parse outside the lock; two threads racing on the same content both parse it
+            result = extractor(content.decode('utf-8', errors='replace'))
+        
+        with self._lock:
+            if digest not in self._by_hash:
+                self.parsed += 1
+                if len(self._by_hash) >= self.max_entries:
+                    self._by_hash.clear()
+                    self._by_stat.clear()
+                self._by_hash[digest] = result
+            self._by_stat[stat_key] = digest
+        return result
+    
+    def extract_many(self, files: List[Tuple[str, object, str]],
+                     should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Extract a batch of (relative_path, entry, language) files on the worker pool
+        
+        Files not yet started when should_stop returns True are skipped.
+        
+        Returns:
+            dict: relative_path -> {'definitions', 'imports'} for every file that was read
+        """
+        def work(item):
+            if should_stop is not None and should_stop():
+                return item[0], None
+            return item[0], self.extract(item[1], item[2])
+        
+        if self.workers <= 1 or len(files) < 2:
+            pairs = map(work, files)
+            return {rel_path: result for rel_path, result in pairs if result is not None}
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='windforge-symbols') as executor:
+            return {rel_path: result for rel_path, result in executor.map(work, files) if result is not None}
+
+
+def summarize_symbols(files: List[Tuple[str, str]], results: Dict[str, Dict[str, List[str]]],
+                      go_modules: Tuple[str, ...] = (), max_modules: int = 12, max_imports: int = 20) -> Dict:
+    """
+    Condense per-file results into what the prompts cite
+    
+    Args:
+        files (list): (relative_path, language) of the extracted files
+        results (dict): Output of SymbolExtractor.extract_many
+        go_modules (tuple): Module paths of the project's go.mod files
+    
+    Returns:
+        dict: files_parsed, modules (files with the most definitions, with their
+              first definitions), external_imports (packages) and internal_imports
+              (project modules) as [name, count] pairs, most imported first
+    """
+    # Top-level Python packages of the project, including those under src/
+    local_roots = set()
+    for rel_path, language in files:
+        if language == 'Python':
+            parts = rel_path.split('/')
+            local_roots.add(_strip_source_suffix(parts[0]))
+            if parts[0] == 'src' and len(parts) > 1:
+                local_roots.add(_strip_source_suffix(parts[1]))
+    local_roots = frozenset(local_roots)
+    
+    modules = []
+    external: Dict[str, int] = {}
+    internal: Dict[str, int] = {}
+    for rel_path, language in files:
+        result = results.get(rel_path)
+        if result is None:
+            continue
+        if result['definitions']:
+            modules.append((len(result['definitions']), rel_path, language, result['definitions']))
+        for specifier in set(result['imports']):
+            classified = classify_import(language, specifier, rel_path, local_roots, go_modules)
+            if classified is None:
+                continue
+            name, is_internal = classified
+            counts = internal if is_internal else external
+            counts[name] = counts.get(name, 0) + 1
+    
+    modules.sort(key=lambda module: (-module[0], module[1]))
+    
+    def ranked(counts, limit):
+        return [[name, count] for name, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]]
+    
+    return {
+        'files_parsed': len(results),
+        'modules': [
+            {'path': rel_path, 'language': language, 'definitions': definitions[:8]}
+            for _, rel_path, language, definitions in modules[:max_modules]
+        ],
+        'external_imports': ranked(external, max_imports),
+        'internal_imports': ranked(internal, max_imports // 2)
+    }
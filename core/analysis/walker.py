@@ -0,0 +1,529 @@
+"""
+Project Walker Module - Fast project tree traversal
+Walks a project with os.scandir and prunes excluded directories before descending
+"""
+
+import bisect
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .ignore_rules import IGNORE_FILENAMES, IgnoreRules, load_ignore_file
+from .project_index import ProjectIndex, IndexedEntry, IndexedStat
+
+# Directories that never contain files worth reporting to the AI model
+DEFAULT_EXCLUDED_DIRS = ('node_modules', 'dist', 'build', '__pycache__', 'target')
+
+# Trees with fewer directories than this are always walked serially
+DEFAULT_PARALLEL_MIN_DIRS = 64
+
+# Skipped links and directories listed in a walk's report; the rest are only counted
+MAX_REPORTED_SKIPS = 100
+
+# Seconds between should_stop checks while waiting for another walk of the same index
+LOCK_POLL_SECONDS = 0.05
+
+# Reasons a directory is not descended into
+SKIP_SYMLINK = 'symlink'
+SKIP_VISITED = 'already visited'
+SKIP_OTHER_FILESYSTEM = 'other filesystem'
+
+
+class ProjectWalker:
+    """
+    Walk a project tree without descending into hidden, excluded or ignored directories
+    
+    Every directory is entered at most once per walk, keyed by (device, inode),
+    so bind mounts and followed symlinks can neither loop nor list a tree twice.
+    Symlinked directories are only followed with follow_symlinks, and with
+    one_filesystem directories on another device than the start are skipped.
+    """
+    
+    def __init__(self, root: str, excluded_dirs: Optional[Iterable[str]] = None,
+                 include_hidden: bool = False, use_ignore_files: bool = True,
+                 index: Optional[ProjectIndex] = None, follow_symlinks: bool = False,
+                 one_filesystem: bool = False):
+        self.root = os.path.abspath(root)
+        self.excluded_dirs = frozenset(DEFAULT_EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs)
+        self.include_hidden = include_hidden
+        self.use_ignore_files = use_ignore_files
+        self.index = index
+        self.follow_symlinks = follow_symlinks
+        self.one_filesystem = one_filesystem
+        # Directories not descended into during the last walk, as (relative_path, reason)
+        self.skipped_dirs: List[Tuple[str, str]] = []
+        self.skipped_count = 0
+        self._seen_dirs: Set[Tuple[int, int]] = set()
+        self._start_device: Optional[int] = None
+        self._skip_lock = threading.Lock()
+        # Filled during walk() so callers can cheaply detect later changes
+        self.visited_dirs: List[str] = []
+        self.ignore_files: List[str] = []
+        # Directories still queued (kept current while files are yielded) and whether the walk ran to the end
+        self.pending_dirs = 0
+        self.completed = False
+        # Files besides ignore files whose changes invalidate the result (the git index)
+        self.state_files: List[str] = []
+        # Index entries consumed and left by walk_tracked(), used instead of directory counts
+        self.tracked_done = 0
+        self.tracked_pending = 0
+    
+    def is_excluded(self, name: str, is_dir: bool) -> bool:
+        """Check whether an entry should be skipped (directories are pruned)"""
+        if not self.include_hidden and name.startswith('.'):
+            return True
+        return is_dir and name in self.excluded_dirs
+    
+    def root_ignore_rules(self) -> IgnoreRules:
+        """Ignore rules that apply above the root's own ignore files (.git/info/exclude)"""
+        rules = IgnoreRules()
+        if self.use_ignore_files:
+            exclude_path = os.path.join(self.root, '.git', 'info', 'exclude')
+            exclude = load_ignore_file(exclude_path, '')
+            self.ignore_files.append(exclude_path)
+            if exclude is not None:
+                rules = rules.extend(exclude)
+        return rules
+    
+    def ignore_rules_for(self, rel_dir: str) -> IgnoreRules:
+        """Ignore rules inherited by a directory from the root and its ancestors"""
+        rules = self.root_ignore_rules()
+        if not self.use_ignore_files or not rel_dir:
+            return rules
+        
+        parts = rel_dir.split('/')
+        for depth in range(len(parts)):
+            ancestor = '/'.join(parts[:depth])
+            ancestor_path = os.path.join(self.root, *parts[:depth])
+            for ignore_name in IGNORE_FILENAMES:
+                ignore_path = os.path.join(ancestor_path, ignore_name)
+                # Recorded even when missing, so creating one later is noticed
+                self.ignore_files.append(ignore_path)
+                ignore_file = load_ignore_file(ignore_path, ancestor)
+                if ignore_file is not None:
+                    rules = rules.extend(ignore_file)
+        return rules
+    
+    def scan_directory(self, dir_path: str, rel_dir: str,
+                       ignore_rules: IgnoreRules) -> Tuple[List[Tuple[str, os.DirEntry]], List[Tuple[str, str, IgnoreRules]]]:
+        """
+        List a single directory
+        
+        Args:
+            dir_path (str): Absolute path of the directory
+            rel_dir (str): Path of the directory relative to the root ('' for the root)
+            ignore_rules (IgnoreRules): Rules inherited from parent directories
+        
+        Returns:
+            tuple: (files, subdirs) where files are (relative_path, entry) pairs
+                   and subdirs are (absolute_path, relative_path, ignore_rules) triples
+        """
+        files = []
+        subdirs = []
+        prefix = rel_dir + '/' if rel_dir else ''
+        
+        if not self._enter_directory(dir_path, rel_dir):
+            return files, subdirs
+        
+        try:
+            if self.index is not None:
+                entries = self.index.list_directory(dir_path, rel_dir)
+            else:
+                with os.scandir(dir_path) as iterator:
+                    entries = list(iterator)
+        except OSError:
+            # Unreadable directories are skipped, like rglob does
+            return files, subdirs
+        
+        if self.use_ignore_files:
+            names = {entry.name for entry in entries}
+            for ignore_name in IGNORE_FILENAMES:
+                if ignore_name in names:
+                    ignore_path = os.path.join(dir_path, ignore_name)
+                    self.ignore_files.append(ignore_path)
+                    ignore_file = load_ignore_file(ignore_path, rel_dir)
+                    if ignore_file is not None:
+                        ignore_rules = ignore_rules.extend(ignore_file)
+        
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_link = not is_dir and entry.is_symlink() and entry.is_dir()
+                if self.is_excluded(entry.name, is_dir or is_link):
+                    continue
+                rel_path = prefix + entry.name
+                if ignore_rules and ignore_rules.is_ignored(rel_path, is_dir or is_link):
+                    continue
+                if is_link and not self.follow_symlinks:
+                    self._skip(rel_path, SKIP_SYMLINK)
+                elif is_dir or is_link:
+                    subdirs.append((entry.path, rel_path, ignore_rules))
+                elif entry.is_file():
+                    files.append((rel_path, entry))
+            except OSError:
+                continue
+        
+        return files, subdirs
+    
+    def _enter_directory(self, dir_path: str, rel_dir: str) -> bool:
+        """Claim a directory for this walk, False if it was entered before or is on another device"""
+        try:
+            stat = os.stat(dir_path)
+        except OSError:
+            return False
+        if self._start_device is None:
+            self._start_device = stat.st_dev
+        elif self.one_filesystem and stat.st_dev != self._start_device:
+            self._skip(rel_dir, SKIP_OTHER_FILESYSTEM)
+            return False
+        
+        # Some filesystems report no inode numbers, their directories cannot be told apart
+        if not stat.st_ino:
+            return True
+        key = (stat.st_dev, stat.st_ino)
+        with self._skip_lock:
+            seen = key in self._seen_dirs
+            self._seen_dirs.add(key)
+        if seen:
+            self._skip(rel_dir, SKIP_VISITED)
+        return not seen
+    
+    def _skip(self, rel_path: str, reason: str):
+        with self._skip_lock:
+            self.skipped_count += 1
+            if len(self.skipped_dirs) < MAX_REPORTED_SKIPS:
+                self.skipped_dirs.append((rel_path, reason))
+    
+    def skip_report(self) -> Dict:
+        """Skipped directories of the last walk for the analysis result"""
+        return {
+            'count': self.skipped_count,
+            'paths': [{'path': rel_path, 'reason': reason} for rel_path, reason in self.skipped_dirs]
+        }
+    
+    def walk(self, workers: int = 1, parallel_min_dirs: int = DEFAULT_PARALLEL_MIN_DIRS,
+             should_stop: Optional[Callable[[], bool]] = None,
+             start_dir: str = '') -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Yield every reported file in the tree, or in the subtree at start_dir
+        
+        The walk starts serially. When workers > 1 and the tree turns out to have
+        at least parallel_min_dirs directories, the remaining directories are
+        listed by a thread pool, which mostly helps on high-latency network mounts.
+        Files are always yielded from the calling thread, so consumers can
+        aggregate without locks; the order is not deterministic in parallel mode.
+        
+        Args:
+            workers (int): Maximum number of listing threads (1 or less walks serially)
+            parallel_min_dirs (int): Directories to visit before switching to parallel mode
+            should_stop (callable): Checked before each directory; returning True ends
+                the walk early with completed left False
+            start_dir (str): '/' separated directory below the root to walk instead of
+                the whole tree; ignore files above it still apply
+        
+        Yields:
+            tuple: (relative_path, entry) with '/' separated relative paths
+        """
+        start_path = os.path.join(self.root, *start_dir.split('/')) if start_dir else self.root
+        if not os.path.isdir(start_path):
+            return
+        
+        if self.index is None:
+            yield from self._walk_tree(workers, parallel_min_dirs, should_stop, start_dir)
+            return
+        
+        # A watcher rescan can hold the index for a long time; keep honouring should_stop meanwhile
+        while not self.index.walk_lock.acquire(timeout=LOCK_POLL_SECONDS):
+            if should_stop is not None and should_stop():
+                return
+        try:
+            yield from self._walk_tree(workers, parallel_min_dirs, should_stop, start_dir)
+        finally:
+            self.index.walk_lock.release()
+    
+    def _walk_tree(self, workers: int, parallel_min_dirs: int,
+                   should_stop: Optional[Callable[[], bool]],
+                   start_dir: str = '') -> Iterator[Tuple[str, os.DirEntry]]:
+        """Body of walk(), run with the index's walk lock held"""
+        if self.index is not None:
+            self.index.begin_walk()
+        self.visited_dirs = []
+        self.ignore_files = []
+        self.state_files = []
+        self.pending_dirs = 0
+        self.completed = False
+        self.skipped_dirs = []
+        self.skipped_count = 0
+        self._seen_dirs = set()
+        self._start_device = None
+        
+        start_path = os.path.join(self.root, *start_dir.split('/')) if start_dir else self.root
+        stack = [(start_path, start_dir, self.ignore_rules_for(start_dir))]
+        while stack:
+            if should_stop is not None and should_stop():
+                return
+            
+            if workers > 1 and len(self.visited_dirs) >= parallel_min_dirs:
+                if not (yield from self._walk_parallel(stack, workers, should_stop)):
+                    return
+                break
+            
+            dir_path, rel_dir, ignore_rules = stack.pop()
+            self.visited_dirs.append(rel_dir)
+            files, subdirs = self.scan_directory(dir_path, rel_dir, ignore_rules)
+            # Reverse so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+            self.pending_dirs = len(stack)
+            yield from files
+        
+        self.completed = True
+        # A subtree walk says nothing about directories outside it
+        if self.index is not None and not start_dir:
+            self.index.prune_unvisited()
+    
+    def walk_tracked(self, tracked: Tuple[str, str, List[Tuple[str, int, int, int]]],
+                     should_stop: Optional[Callable[[], bool]] = None,
+                     start_dir: str = '') -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Yield the files of a git repository from its index instead of walking the tree
+        
+        Listing comes from the parsed index (see GitIndexReader.tracked_files).
+        The names in every tracked directory are still needed, so that tracked
+        files deleted since are dropped and untracked files are found; with a
+        directory index they come from its records, which cost one stat per
+        directory while the directory is unchanged. Only directories with
+        untracked names are scanned like walk() does. Hidden, excluded and
+        ignored paths are filtered as in walk(); inside tracked directories only
+        tracked ignore files are honoured.
+        
+        Entries older than the index file are marked trusted (see entry_stat),
+        newer ones are racy and get stat-ed by whoever needs their metadata.
+        
+        Args:
+            tracked (tuple): (index_path, prefix, entries) from GitIndexReader.tracked_files
+            should_stop (callable): Checked periodically; returning True ends the walk early
+            start_dir (str): '/' separated directory below the root to list instead of the whole tree
+        
+        Yields:
+            tuple: (relative_path, entry) with '/' separated relative paths
+        """
+        if self.index is None:
+            yield from self._walk_tracked(tracked, should_stop, start_dir)
+            return
+        
+        while not self.index.walk_lock.acquire(timeout=LOCK_POLL_SECONDS):
+            if should_stop is not None and should_stop():
+                return
+        try:
+            yield from self._walk_tracked(tracked, should_stop, start_dir)
+        finally:
+            self.index.walk_lock.release()
+    
+    def _walk_tracked(self, tracked: Tuple[str, str, List[Tuple[str, int, int, int]]],
+                      should_stop: Optional[Callable[[], bool]],
+                      start_dir: str = '') -> Iterator[Tuple[str, os.DirEntry]]:
+        """Body of walk_tracked(), run with the index's walk lock held"""
+        index_path, prefix, entries = tracked
+        if self.index is not None:
+            self.index.begin_walk()
+        self.visited_dirs = []
+        self.ignore_files = []
+        self.state_files = [index_path]
+        self.pending_dirs = 0
+        self.completed = False
+        self.skipped_dirs = []
+        self.skipped_count = 0
+        self._seen_dirs = set()
+        self._start_device = None
+        
+        base = prefix + (start_dir + '/' if start_dir else '')
+        strip = len(prefix)
+        first = bisect.bisect_left(entries, (base,))
+        last = first
+        tracked_ignore_files = set()
+        # Names of the tracked files and directories in each tracked directory
+        tracked_names: Dict[str, Set[str]] = {start_dir: set()}
+        while last < len(entries) and entries[last][0].startswith(base):
+            rel_path = entries[last][0][strip:]
+            rel_dir, _, name = rel_path.rpartition('/')
+            if name in IGNORE_FILENAMES:
+                tracked_ignore_files.add(rel_path)
+            names = tracked_names.get(rel_dir)
+            if names is None:
+                names = tracked_names[rel_dir] = set()
+                child = rel_dir
+                while child != start_dir:
+                    parent, _, child_name = child.rpartition('/')
+                    parent_names = tracked_names.get(parent)
+                    if parent_names is not None:
+                        parent_names.add(child_name)
+                        break
+                    tracked_names[parent] = {child_name}
+                    child = parent
+            names.add(name)
+            last += 1
+        self.tracked_done = 0
+        self.tracked_pending = last - first
+        
+        # Git's racy rule: an entry stat-ed in the same tick the index was written may be stale
+        try:
+            index_mtime_ns = os.stat(index_path).st_mtime_ns
+        except OSError:
+            index_mtime_ns = 0
+        
+        inherited_rules = self.ignore_rules_for(start_dir)
+        start_rules = inherited_rules
+        if self.use_ignore_files:
+            start_path = os.path.join(self.root, *start_dir.split('/')) if start_dir else self.root
+            for ignore_name in IGNORE_FILENAMES:
+                ignore_path = os.path.join(start_path, ignore_name)
+                self.ignore_files.append(ignore_path)
+                ignore_file = load_ignore_file(ignore_path, start_dir)
+                if ignore_file is not None:
+                    start_rules = start_rules.extend(ignore_file)
+        # Rules per directory, None for pruned directories
+        dir_rules = {start_dir: start_rules}
+        
+        def rules_for(rel_dir: str) -> Optional[IgnoreRules]:
+            rules = dir_rules.get(rel_dir, False)
+            if rules is not False:
+                return rules
+            parent, _, name = rel_dir.rpartition('/')
+            rules = rules_for(parent)
+            if rules is not None and (self.is_excluded(name, True) or (rules and rules.is_ignored(rel_dir, True))):
+                rules = None
+            if rules is not None and self.use_ignore_files:
+                for ignore_name in IGNORE_FILENAMES:
+                    ignore_rel = f"{rel_dir}/{ignore_name}"
+                    if ignore_rel in tracked_ignore_files:
+                        ignore_path = os.path.join(self.root, *ignore_rel.split('/'))
+                        self.ignore_files.append(ignore_path)
+                        ignore_file = load_ignore_file(ignore_path, rel_dir)
+                        if ignore_file is not None:
+                            rules = rules.extend(ignore_file)
+            dir_rules[rel_dir] = rules
+            return rules
+        
+        root_prefix = os.path.join(self.root, '')
+        
+        def dir_path_of(rel_dir: str) -> str:
+            return root_prefix + (rel_dir if os.sep == '/' else rel_dir.replace('/', os.sep))
+        
+        # Names on disk of each listed directory, empty if it is gone
+        listings: Dict[str, Set[str]] = {}
+        
+        def listing(rel_dir: str) -> Set[str]:
+            names = listings.get(rel_dir)
+            if names is None:
+                try:
+                    if self.index is not None:
+                        names = self.index.list_names(dir_path_of(rel_dir), rel_dir)
+                    else:
+                        names = set(os.listdir(dir_path_of(rel_dir)))
+                except OSError:
+                    names = set()
+                listings[rel_dir] = names
+                self.visited_dirs.append(rel_dir)
+            return names
+        
+        for position in range(first, last):
+            if position % 512 == 0 and should_stop is not None and should_stop():
+                return
+            self.tracked_done += 1
+            self.tracked_pending -= 1
+            
+            path, size, mtime_ns, inode = entries[position]
+            rel_path = path[strip:]
+            rel_dir, _, name = rel_path.rpartition('/')
+            rules = rules_for(rel_dir)
+            if rules is None or self.is_excluded(name, False):
+                continue
+            if rules and rules.is_ignored(rel_path, False):
+                continue
+            # Deleted since it was added to the index
+            if name not in listing(rel_dir):
+                continue
+            yield rel_path, IndexedEntry(
+                name, dir_path_of(rel_path), False, IndexedStat(size, mtime_ns), inode,
+                trusted=mtime_ns < index_mtime_ns
+            )
+        
+        # Untracked files next to tracked ones, and untracked directories walked whole
+        stack = []
+        for rel_dir in sorted(tracked_names):
+            if should_stop is not None and should_stop():
+                return
+            if rules_for(rel_dir) is None:
+                continue
+            untracked = listing(rel_dir) - tracked_names[rel_dir]
+            if not untracked:
+                continue
+            parent_rules = rules_for(rel_dir.rpartition('/')[0]) if rel_dir != start_dir else inherited_rules
+            files, subdirs = self.scan_directory(dir_path_of(rel_dir), rel_dir, parent_rules)
+            for rel_path, entry in files:
+                if entry.name in untracked:
+                    yield rel_path, entry
+            stack.extend(subdir for subdir in subdirs if subdir[1].rpartition('/')[2] in untracked)
+        
+        stack.reverse()
+        while stack:
+            if should_stop is not None and should_stop():
+                return
+            dir_path, rel_dir, ignore_rules = stack.pop()
+            self.visited_dirs.append(rel_dir)
+            files, subdirs = self.scan_directory(dir_path, rel_dir, ignore_rules)
+            stack.extend(reversed(subdirs))
+            self.pending_dirs = len(stack)
+            yield from files
+        
+        self.completed = True
+        if self.index is not None and not start_dir:
+            self.index.prune_unvisited()
+    
+    def progress(self) -> Tuple[int, int]:
+        """(done, remaining) units of the last walk for extrapolating a stopped one"""
+        if self.state_files:
+            return self.tracked_done, self.tracked_pending
+        return len(self.visited_dirs), self.pending_dirs
+    
+    def _walk_parallel(self, pending: List[Tuple[str, str, IgnoreRules]], workers: int,
+                       should_stop: Optional[Callable[[], bool]]) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        List the pending directories and everything below them on a thread pool
+        
+        Returns:
+            bool: False if should_stop ended the walk early
+        """
+        results = queue.Queue()
+        outstanding = set()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='windforge-walk')
+        
+        def submit(item):
+            future = executor.submit(self.scan_directory, *item)
+            outstanding.add(future)
+            future.add_done_callback(lambda done, rel_dir=item[1]: results.put((done, rel_dir)))
+        
+        try:
+            for item in pending:
+                submit(item)
+            
+            while outstanding:
+                if should_stop is not None and should_stop():
+                    return False
+                
+                future, rel_dir = results.get()
+                outstanding.discard(future)
+                self.visited_dirs.append(rel_dir)
+                files, subdirs = future.result()
+                for item in subdirs:
+                    submit(item)
+                self.pending_dirs = len(outstanding)
+                yield from files
+            return True
+        finally:
+            # Stop queued listings if the consumer abandons the walk early
+            for future in outstanding:
+                future.cancel()
+            executor.shutdown(wait=True)
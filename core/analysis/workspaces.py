@@ -0,0 +1,119 @@
+"""
+Workspaces Module - Monorepo package detection
+Finds the sub-projects of a tree from the manifests collected during a walk
+"""
+
+import posixpath
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .manifest_parser import manifest_kind
+
+# Manifests that make their directory a package of its own
+PACKAGE_MANIFESTS = ('package.json', 'pyproject.toml', 'cargo.toml', 'go.mod', 'pom.xml')
+
+# Manifests whose 'workspaces' list declares member packages, and the ecosystem they declare
+WORKSPACE_MANIFESTS = {
+    'package.json': 'Node.js',
+    'pnpm-workspace.yaml': 'Node.js',
+    'cargo.toml': 'Rust',
+    'go.work': 'Go',
+    'pom.xml': 'Java/Maven'
+}
+
+
+def _member_regex(pattern: str, base_dir: str) -> Optional[str]:
+    """Translate a workspace member glob ('packages/*', 'apps/**', './api') into a regex body"""
+    pattern = pattern.strip().rstrip('/')
+    while pattern.startswith('./'):
+        pattern = pattern[2:]
+    if not pattern or pattern == '.' or pattern.startswith('../') or pattern.startswith('/'):
+        return None
+    if base_dir:
+        pattern = f"{base_dir}/{pattern}"
+    
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(parts)
+
+
+def detect_packages(manifests: List[Tuple[str, Dict]], base_dir: str = '') -> Tuple[List[Dict], bool]:
+    """
+    Find the packages below base_dir
+    
+    Every directory below base_dir holding a package manifest is a package.
+    When manifests in base_dir declare workspace members for an ecosystem,
+    packages of that ecosystem outside the declared members are dropped, so
+    fixtures and examples do not show up as packages.
+    
+    Args:
+        manifests (list): (relative path, parsed manifest) pairs from ProjectStats
+        base_dir (str): Directory the analysis covered ('' for the root)
+    
+    Returns:
+        tuple: (packages, declared) where packages are dicts with path, name,
+               ecosystems and declared, sorted by path, and declared tells
+               whether base_dir declares workspace members
+    """
+    includes: Dict[str, List[str]] = {}
+    excludes: Dict[str, List[str]] = {}
+    packages: Dict[str, Dict] = {}
+    
+    for rel_path, manifest in manifests:
+        rel_dir, filename = posixpath.split(rel_path)
+        kind = manifest_kind(filename)
+        
+        if rel_dir == base_dir:
+            ecosystem = WORKSPACE_MANIFESTS.get(kind)
+            patterns = (manifest.get('workspaces') or []) if ecosystem is not None else []
+            for pattern in patterns:
+                negated = pattern.startswith('!')
+                regex = _member_regex(pattern[1:] if negated else pattern, base_dir)
+                if regex is not None:
+                    (excludes if negated else includes).setdefault(ecosystem, []).append(regex)
+            continue
+        
+        if kind not in PACKAGE_MANIFESTS:
+            continue
+        package = packages.setdefault(rel_dir, {
+            'path': rel_dir,
+            'name': None,
+            'ecosystems': [],
+            'declared': False
+        })
+        package['name'] = package['name'] or manifest.get('name')
+        if manifest['ecosystem'] not in package['ecosystems']:
+            package['ecosystems'].append(manifest['ecosystem'])
+    
+    include_res = {ecosystem: re.compile('|'.join(regexes)) for ecosystem, regexes in includes.items()}
+    exclude_res = {ecosystem: re.compile('|'.join(regexes)) for ecosystem, regexes in excludes.items()}
+    
+    result = []
+    for rel_dir in sorted(packages):
+        package = packages[rel_dir]
+        kept = False
+        for ecosystem in package['ecosystems']:
+            if ecosystem not in include_res:
+                kept = True
+            elif include_res[ecosystem].fullmatch(rel_dir) and not (
+                    ecosystem in exclude_res and exclude_res[ecosystem].fullmatch(rel_dir)):
+                kept = True
+                package['declared'] = True
+        if kept:
+            package['name'] = package['name'] or posixpath.basename(rel_dir)
+            result.append(package)
+    
+    return result, bool(include_res)
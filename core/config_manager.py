@@ -124,6 +124,60 @@ class ConfigManager:
                     "footer": "\n_Generated on {timestamp}_"
                 }
             },
+            "analysis_settings": {
+                "excluded_dirs": ["node_modules", "dist", "build", "__pycache__", "target"],
+                "use_ignore_files": True,
+                "follow_symlinks": False,
+                "one_filesystem": False,
+                "use_index_cache": True,
+                "index_cache_dir": "",
+                "index_cache_max_mb": 64,
+                "parallel_workers": 8,
+                "parallel_min_dirs": 64,
+                "sample_size": 200,
+                "max_seconds": 30,
+                "max_files": 0,
+                "live_index": True,
+                "watch_rescan_interval": 60,
+                "count_lines": True,
+                "max_line_count_mb": 16,
+                "use_process_pool": False,
+                "package_concurrency": 4,
+                "structure_max_depth": 4,
+                "structure_max_children": 8,
+                "structure_max_chars": 2000,
+                "use_git_index": True,
+                "extract_symbols": True,
+                "symbol_max_files": 400,
+                "symbol_workers": 4
+            },
+            "ai_settings": {
+                "api_key": "",
+                "model": "gemini-1.5-flash",
+                "temperature": 0.7,
+                "max_tokens": 2048,
+                "enable_rules": True,
+                "enable_workflows": True,
+                "auto_analyze": True,
+                "response_cache": True,
+                "response_cache_dir": "",
+                "response_cache_max_mb": 32,
+                "response_cache_ttl_hours": 168,
+                "stream_responses": True,
+                "model_backend": "gemini",
+                "local_backend_url": "http://127.0.0.1:8765",
+                "local_backend_timeout": 120,
+                "fake_latency_seconds": 0.5,
+                "fake_chunk_latency_seconds": 0.02,
+                "fake_failure_rate": 0.0,
+                "fake_seed": 0,
+                "requests_per_minute": 10,
+                "tokens_per_minute": 1000000,
+                "max_retries": 4,
+                "retry_base_delay_seconds": 1.0,
+                "retry_max_delay_seconds": 30.0,
+                "retry_budget_ratio": 0.2
+            },
             "recent_files": [],
             "shortcuts": {
                 "generate_rule": "Ctrl+R",
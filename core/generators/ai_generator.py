@@ -1,134 +1,202 @@
 """
 AI Generator Module - Gemini Flash 2.5 Integration
-Generates rules and workflows using Google's Gemini AI model
+Generates rules and workflows using Google's Gemini AI model or another model backend
 """
 
 import os
 import json
 import asyncio
-from typing import Dict, List, Optional, Tuple
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except (ImportError, TypeError, Exception) as e:
-    # Handle various import errors including the metaclass issue
-    print(f"Warning: Google Generative AI not available - {type(e).__name__}: {e}")
-    genai = None
-    GEMINI_AVAILABLE = False
+from core.analysis import ProjectAnalyzer, ProjectWatcher, DATA_LANGUAGES, split_glob
+from core.utils import CancellationToken, OperationCancelled, run_cancellable
+from .response_cache import ResponseCache
+from .stream_parser import JsonItemStream
+from .backends import ModelBackend, create_backend
+from .rate_limiter import RetryBudget, RetryPolicy, estimate_tokens, shared_rate_limiter
+
 
 class AIGenerator:
-    """AI-powered generator using Gemini Flash 2.5"""
+    """AI-powered generator using Gemini Flash 2.5 (or another model backend)"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, analysis_settings: Optional[Dict] = None,
+                 backend: Optional[ModelBackend] = None, ai_settings: Optional[Dict] = None):
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
-        self.model = None
-        self.is_configured = False
+        # Mirror the 'analysis_settings' and 'ai_settings' sections of the configuration
+        self.analysis_settings = dict(analysis_settings or {})
+        self.ai_settings = dict(ai_settings or {})
+        # Selected by the 'model_backend' setting unless given
+        self.backend = backend or create_backend(self.ai_settings, self.api_key)
+        # Owns the analysis caches, live watchers and the optional worker process
+        self.analyzer = ProjectAnalyzer(self.analysis_settings)
+        # Async requests share one long-lived loop, the client's async channel stays bound to it
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
         
-        if GEMINI_AVAILABLE and self.api_key:
-            self.configure_gemini()
-    
-    def configure_gemini(self):
-        """Configure Gemini AI model"""
-        global GEMINI_AVAILABLE
+        # Responses keyed by (model, prompt, generation config); bypass skips reading it for one run
+        self.response_cache = None
+        self.bypass_response_cache = False
+        if self.ai_settings.get('response_cache', True):
+            self.response_cache = ResponseCache(
+                cache_dir=self.ai_settings.get('response_cache_dir') or None,
+                max_bytes=int(self.ai_settings.get('response_cache_max_mb', 32)) * 1024 * 1024,
+                ttl_seconds=float(self.ai_settings.get('response_cache_ttl_hours', 168)) * 3600
+            )
+        
+        # Quota shared with every generator using the same model; 0 disables a limit
+        self.rate_limiter = shared_rate_limiter(
+            self.backend.cache_name,
+            float(self.ai_settings.get('requests_per_minute', 10)),
+            float(self.ai_settings.get('tokens_per_minute', 1000000))
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=int(self.ai_settings.get('max_retries', 4)),
+            base_delay=float(self.ai_settings.get('retry_base_delay_seconds', 1.0)),
+            max_delay=float(self.ai_settings.get('retry_max_delay_seconds', 30.0)),
+            budget=RetryBudget(float(self.ai_settings.get('retry_budget_ratio', 0.2)))
+        )
         
-        if not GEMINI_AVAILABLE or genai is None:
-            print("Gemini AI not available - skipping configuration")
-            self.is_configured = False
-            return
-            
-        try:
-            # Test if genai is actually working
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-            self.is_configured = True
-            print("✅ Gemini AI configured successfully!")
-        except (TypeError, ImportError, AttributeError) as e:
-            print(f"❌ Gemini AI library issue: {e}")
-            self.is_configured = False
-            # Mark as unavailable globally
-            GEMINI_AVAILABLE = False
-        except Exception as e:
-            print(f"❌ Error configuring Gemini: {e}")
-            self.is_configured = False
-    
     def set_api_key(self, api_key: str) -> bool:
         """Set API key and reconfigure model"""
         self.api_key = api_key
-        if GEMINI_AVAILABLE and genai is not None:
-            self.configure_gemini()
-            return self.is_configured
-        return False
+        self.backend.set_api_key(api_key)
+        return self.backend.is_available()
     
     def is_available(self) -> bool:
         """Check if AI generator is available and configured"""
-        return GEMINI_AVAILABLE and self.is_configured
-    
-    def analyze_project(self, project_path: str) -> Dict[str, any]:
-        """Analyze project structure and files"""
-        project_info = {
-            'path': project_path,
-            'files': [],
-            'structure': {},
-            'languages': set(),
-            'frameworks': set(),
-            'file_count': 0
-        }
+        return self.backend.is_available()
+    
+    def analyze_project(self, project_path: str, excluded_dirs: Optional[List[str]] = None,
+                        include_files: bool = False, max_seconds: Optional[float] = None,
+                        max_files: Optional[int] = None,
+                        cancel_token: Optional[CancellationToken] = None,
+                        package_path: str = '') -> Dict[str, any]:
+        """
+        Analyze project structure and files (see ProjectAnalyzer.analyze_project)
         
-        try:
-            project_path = Path(project_path)
-            if not project_path.exists():
-                return project_info
-            
-            # Common file extensions and their languages
-            language_map = {
-                '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-                '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.cs': 'C#',
-                '.php': 'PHP', '.rb': 'Ruby', '.go': 'Go', '.rs': 'Rust',
-                '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS',
-                '.json': 'JSON', '.xml': 'XML', '.yaml': 'YAML', '.yml': 'YAML'
-            }
-            
-            # Framework indicators
-            framework_indicators = {
-                'package.json': ['Node.js'],
-                'requirements.txt': ['Python'],
-                'Gemfile': ['Ruby'],
-                'pom.xml': ['Java/Maven'],
-                'build.gradle': ['Java/Gradle'],
-                'Cargo.toml': ['Rust'],
-                'go.mod': ['Go'],
-                'composer.json': ['PHP']
-            }
-            
-            for file_path in project_path.rglob('*'):
-                if file_path.is_file() and not any(part.startswith('.') for part in file_path.parts):
-                    relative_path = file_path.relative_to(project_path)
-                    project_info['files'].append(str(relative_path))
-                    project_info['file_count'] += 1
-                    
-                    # Detect language
-                    suffix = file_path.suffix.lower()
-                    if suffix in language_map:
-                        project_info['languages'].add(language_map[suffix])
-                    
-                    # Detect frameworks
-                    filename = file_path.name.lower()
-                    if filename in framework_indicators:
-                        project_info['frameworks'].update(framework_indicators[filename])
-            
-            project_info['languages'] = list(project_info['languages'])
-            project_info['frameworks'] = list(project_info['frameworks'])
-            
-        except Exception as e:
-            print(f"Error analyzing project: {e}")
+        Raises:
+            OperationCancelled: If cancel_token is cancelled during the walk
+        """
+        return self.analyzer.analyze_project(
+            project_path, excluded_dirs, include_files, max_seconds, max_files, cancel_token, package_path
+        )
+    
+    def get_project_analysis(self, project_path: str,
+                             cancel_token: Optional[CancellationToken] = None,
+                             package_path: str = '') -> Dict[str, any]:
+        """Get the analysis of a project or one of its packages, reused while its files are unchanged"""
+        return self.analyzer.get_project_analysis(project_path, cancel_token, package_path)
+    
+    def project_fingerprint(self, project_path: str,
+                            cancel_token: Optional[CancellationToken] = None,
+                            package_path: str = '') -> Optional[str]:
+        """Merkle hash of the analyzed files, equal as long as nothing relevant changed"""
+        return self.analyzer.project_fingerprint(project_path, cancel_token, package_path)
+    
+    def watch_project(self, project_path: str) -> ProjectWatcher:
+        """Keep a live index of a project so later analyses skip the walk"""
+        return self.analyzer.watch_project(project_path)
+    
+    def stop_watching(self, project_path: Optional[str] = None):
+        """Stop the watcher of a project, or all watchers when no path is given"""
+        self.analyzer.stop_watching(project_path)
+    
+    def invalidate_project_index(self, project_path: Optional[str] = None):
+        """Drop the cached index of a project, or of all projects when no path is given"""
+        self.analyzer.invalidate_project_index(project_path)
+    
+    def shutdown(self):
+        """Release watchers, the analysis worker process and the event loop thread"""
+        self.analyzer.shutdown()
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not thread.is_alive():
+                loop.close()
+    
+    def run_async(self, coroutine):
+        """Run a coroutine on the generator's event loop thread and wait for its result"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name='windforge-ai-loop', daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+    
+    def format_file_count(self, project_info: Dict) -> str:
+        """File count for prompts, marked as approximate for truncated analyses"""
+        if project_info.get('truncated'):
+            return f"~{project_info.get('estimated_file_count', project_info.get('file_count', 0))} (تقديري)"
+        return str(project_info.get('file_count', 0))
+    
+    def format_languages(self, project_info: Dict, max_languages: int = 6) -> str:
+        """Languages for prompts, with their share of the code by size when known"""
+        languages = project_info.get('languages', [])
+        share = project_info.get('language_share', {})
+        if not share:
+            return ', '.join(languages)
+        
+        parts = [f"{language} {share[language]:g}%" for language in languages if language in share][:max_languages]
+        rest = 100.0 - sum(share[language] for language in list(share)[:max_languages])
+        if len(share) > max_languages and rest >= 0.5:
+            parts.append(f"أخرى {rest:.0f}%")
         
-        return project_info
+        data_formats = [language for language in languages if language in DATA_LANGUAGES]
+        if data_formats:
+            parts.append(f"({', '.join(data_formats)})")
+        return ', '.join(parts)
+    
+    def format_packages(self, project_info: Dict, max_packages: int = 12) -> str:
+        """Monorepo line for prompts, empty for single-package projects"""
+        if project_info.get('package_path'):
+            return f"\n- الحزمة: {project_info['package_path']} (ضمن مستودع متعدد الحزم، اكتب أنماط الملفات نسبية إلى مجلد الحزمة)"
+        
+        packages = project_info.get('packages', [])
+        if not project_info.get('monorepo') or not packages:
+            return ''
+        names = [package['name'] for package in packages[:max_packages]]
+        more = f"، و{len(packages) - max_packages} أخرى" if len(packages) > max_packages else ''
+        return f"\n- مستودع متعدد الحزم (monorepo): {len(packages)} حزمة ({', '.join(names)}{more})"
+    
+    def format_structure(self, project_info: Dict) -> str:
+        """Directory outline block for prompts, empty when the analysis has none"""
+        summary = (project_info.get('structure') or {}).get('summary')
+        if not summary:
+            return ''
+        return f"\n- بنية المشروع (أعداد الملفات حسب المجلد والنوع):\n```\n{summary}\n```"
+    
+    def format_symbols(self, project_info: Dict, max_modules: int = 8, max_imports: int = 12) -> str:
+        """Modules and dependencies found in the code, for the rules prompt"""
+        symbols = project_info.get('symbols') or {}
+        lines = []
+        modules = symbols.get('modules', [])[:max_modules]
+        if modules:
+            described = [f"{module['path']} ({', '.join(module['definitions'][:4])})" for module in modules]
+            lines.append(f"- الوحدات الرئيسية في الكود: {'; '.join(described)}")
+        internal = symbols.get('internal_imports', [])[:max_imports]
+        if internal:
+            lines.append(f"- أكثر الوحدات الداخلية استيراداً: {', '.join(f'{name} ×{count}' for name, count in internal)}")
+        external = symbols.get('external_imports', [])[:max_imports]
+        if external:
+            lines.append(f"- المكتبات المستوردة فعلياً في الكود: {', '.join(f'{name} ×{count}' for name, count in external)}")
+        if not lines:
+            return ''
+        return '\n' + '\n'.join(lines) + '\n(استند إلى هذه الوحدات والمكتبات الفعلية عند تحديد أنماط الملفات ومحتوى القواعد)'
     
     def generate_rules_prompt(self, project_idea: str, project_info: Dict) -> str:
         """Generate prompt for rules generation"""
-        languages = ', '.join(project_info.get('languages', []))
+        languages = self.format_languages(project_info)
         frameworks = ', '.join(project_info.get('frameworks', []))
         
         prompt = f"""
@@ -138,7 +206,7 @@ class AIGenerator:
 - الفكرة: {project_idea}
 - اللغات المستخدمة: {languages or 'غير محدد'}
 - الأطر المستخدمة: {frameworks or 'غير محدد'}
-- عدد الملفات: {project_info.get('file_count', 0)}
+- عدد الملفات: {self.format_file_count(project_info)}{self.format_packages(project_info)}{self.format_structure(project_info)}{self.format_symbols(project_info)}
 
 يرجى إنشاء قواعد تطوير شاملة تغطي:
 1. قواعد الكود (Code Rules)
@@ -173,7 +241,7 @@ class AIGenerator:
     
     def generate_workflows_prompt(self, project_idea: str, project_info: Dict) -> str:
         """Generate prompt for workflows generation"""
-        languages = ', '.join(project_info.get('languages', []))
+        languages = self.format_languages(project_info)
         frameworks = ', '.join(project_info.get('frameworks', []))
         
         prompt = f"""
@@ -183,7 +251,7 @@ class AIGenerator:
 - الفكرة: {project_idea}
 - اللغات المستخدمة: {languages or 'غير محدد'}
 - الأطر المستخدمة: {frameworks or 'غير محدد'}
-- عدد الملفات: {project_info.get('file_count', 0)}
+- عدد الملفات: {self.format_file_count(project_info)}{self.format_packages(project_info)}{self.format_structure(project_info)}
 
 يرجى إنشاء سير عمل شامل يغطي:
 1. سير عمل التطوير (Development Workflow)
@@ -210,26 +278,172 @@ class AIGenerator:
 """
         return prompt.strip()
     
+    def _cached_response(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """(cache key, cached response) for a prompt; the key is None when caching is off"""
+        if self.response_cache is None:
+            return None, None
+        key = ResponseCache.make_key(self.backend.cache_name, prompt, self.backend.generation_config)
+        if self.bypass_response_cache:
+            return key, None
+        return key, self.response_cache.get(key)
+    
+    def _store_response(self, key: Optional[str], text: Optional[str]):
+        if key is not None and text:
+            self.response_cache.put(key, text, self.backend.cache_name)
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Backoff before retrying a failed call, or None if it must not be retried"""
+        if not self.backend.is_retryable(error) or not self.retry_policy.should_retry(attempt):
+            return None
+        delay = self.retry_policy.delay(attempt, self.backend.retry_after(error))
+        print(f"Model call failed ({error}), retry {attempt + 1} in {delay:.1f}s")
+        return delay
+    
+    def _call_with_retries(self, call: Callable[[], str], prompt: str,
+                           cancel_token: Optional[CancellationToken] = None) -> str:
+        """
+        Run a blocking model call within the rate limits, retrying transient failures
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled while waiting
+            Exception: The call's error once it is not retryable or retries ran out
+        """
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            self._sleep(self.rate_limiter.reserve(estimate_tokens(prompt)), cancel_token)
+            try:
+                text = call()
+            except OperationCancelled:
+                raise
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                self._sleep(delay, cancel_token)
+                attempt += 1
+                continue
+            self.rate_limiter.charge_response(estimate_tokens(text or ''))
+            return text
+    
+    async def _call_with_retries_async(self, call: Callable, prompt: str,
+                                       can_retry: Optional[Callable[[], bool]] = None) -> str:
+        """Async _call_with_retries; call is a coroutine function, can_retry vetoes a retry"""
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            wait = self.rate_limiter.reserve(estimate_tokens(prompt))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                text = await call()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if can_retry is None or can_retry() else None
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.rate_limiter.charge_response(estimate_tokens(text or ''))
+            return text
+    
+    @staticmethod
+    def _sleep(seconds: float, cancel_token: Optional[CancellationToken]):
+        if seconds <= 0:
+            return
+        if cancel_token is None:
+            time.sleep(seconds)
+        elif cancel_token.wait(seconds):
+            raise OperationCancelled()
+    
+    async def _request_async(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Response to a prompt from the response cache or the backend (async)
+        
+        With on_chunk the backend's streaming API is used and each piece of text
+        is passed on as it arrives (a cached response arrives as a single piece).
+        
+        Raises:
+            Exception: The backend's error once it is not retryable or retries ran out
+        """
+        key, cached = self._cached_response(prompt)
+        if cached is not None:
+            if on_chunk is not None:
+                on_chunk(cached)
+            return cached
+        
+        if on_chunk is None:
+            text = await self._call_with_retries_async(lambda: self.backend.generate_async(prompt), prompt)
+        else:
+            chunks = []
+            
+            async def stream():
+                async for piece in self.backend.generate_stream_async(prompt):
+                    chunks.append(piece)
+                    on_chunk(piece)
+                return ''.join(chunks)
+            
+            # Once pieces were shown a retry would show them twice
+            text = await self._call_with_retries_async(stream, prompt, lambda: not chunks)
+        self._store_response(key, text)
+        return text
+    
+    def _request(self, prompt: str, cancel_token: Optional[CancellationToken] = None) -> str:
+        """
+        Response to a prompt from the response cache or the backend (sync)
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled
+            Exception: The backend's error once it is not retryable or retries ran out
+        """
+        key, cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+        text = self._call_with_retries(
+            lambda: run_cancellable(lambda: self.backend.generate(prompt), cancel_token), prompt, cancel_token
+        )
+        self._store_response(key, text)
+        return text
+    
     async def generate_content_async(self, prompt: str) -> Optional[str]:
-        """Generate content using Gemini AI (async)"""
+        """Generate content using the model backend (async, answered from the response cache when possible)"""
         if not self.is_available():
             return None
+        try:
+            return await self._request_async(prompt)
+        except Exception as e:
+            print(f"Error generating content: {e}")
+            return None
+    
+    async def generate_content_stream_async(self, prompt: str,
+                                            on_chunk: Callable[[str], None]) -> Optional[str]:
+        """
+        Generate content using the backend's streaming API (async)
+        
+        Args:
+            prompt (str): Prompt to send
+            on_chunk (callable): Called with each piece of text as it arrives
+                (a cached response arrives as a single piece)
         
+        Returns:
+            str: The full response, or None on error
+        """
+        if not self.is_available():
+            return None
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
+            return await self._request_async(prompt, on_chunk)
         except Exception as e:
             print(f"Error generating content: {e}")
             return None
     
-    def generate_content(self, prompt: str) -> Optional[str]:
-        """Generate content using Gemini AI (sync)"""
+    def generate_content(self, prompt: str, cancel_token: Optional[CancellationToken] = None) -> Optional[str]:
+        """Generate content using the model backend (sync, abandoned as soon as cancel_token is cancelled)"""
         if not self.is_available():
             return None
-        
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return self._request(prompt, cancel_token)
+        except OperationCancelled:
+            raise
         except Exception as e:
             print(f"Error generating content: {e}")
             return None
@@ -281,58 +495,216 @@ class AIGenerator:
         
         return items
     
-    def generate_rules(self, project_idea: str, project_path: str) -> List[Dict]:
-        """Generate rules for the project"""
+    def generate_rules(self, project_idea: str, project_path: str, project_info: Optional[Dict] = None,
+                       cancel_token: Optional[CancellationToken] = None) -> List[Dict]:
+        """Generate rules for the project (pass project_info to reuse an existing analysis)"""
         if not self.is_available():
             return []
         
-        project_info = self.analyze_project(project_path)
+        if project_info is None:
+            project_info = self.get_project_analysis(project_path, cancel_token)
         prompt = self.generate_rules_prompt(project_idea, project_info)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         
-        response = self.generate_content(prompt)
+        response = self.generate_content(prompt, cancel_token)
         if response:
             return self.parse_ai_response(response, 'rules')
         
         return []
     
-    def generate_workflows(self, project_idea: str, project_path: str) -> List[Dict]:
-        """Generate workflows for the project"""
+    def generate_workflows(self, project_idea: str, project_path: str, project_info: Optional[Dict] = None,
+                           cancel_token: Optional[CancellationToken] = None) -> List[Dict]:
+        """Generate workflows for the project (pass project_info to reuse an existing analysis)"""
         if not self.is_available():
             return []
         
-        project_info = self.analyze_project(project_path)
+        if project_info is None:
+            project_info = self.get_project_analysis(project_path, cancel_token)
         prompt = self.generate_workflows_prompt(project_idea, project_info)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         
-        response = self.generate_content(prompt)
+        response = self.generate_content(prompt, cancel_token)
         if response:
             return self.parse_ai_response(response, 'workflows')
         
         return []
     
+    async def generate_all_async(self, project_idea: str, project_path: str, project_info: Optional[Dict] = None,
+                                 generate_rules: bool = True, generate_workflows: bool = True,
+                                 cancel_token: Optional[CancellationToken] = None,
+                                 on_result: Optional[Callable[[str, List[Dict]], None]] = None,
+                                 on_item: Optional[Callable[[str, Dict], None]] = None
+                                 ) -> Tuple[Dict[str, List[Dict]], Dict[str, str]]:
+        """
+        Generate rules and workflows with both requests in flight at once
+        
+        A combined run takes as long as the slower request instead of both in turn.
+        With on_item, responses are streamed and each rule or workflow is
+        reported as soon as its JSON object is complete; on_result still gets
+        the list parsed from the full response.
+        
+        Args:
+            project_idea (str): Project description
+            project_path (str): Project root
+            project_info (dict): Existing analysis to reuse (analyzed off the loop otherwise)
+            generate_rules (bool): Request rules
+            generate_workflows (bool): Request workflows
+            cancel_token (CancellationToken): Abandons outstanding requests when cancelled
+            on_result (callable): Called with ('rules' or 'workflows', items) as each result lands
+            on_item (callable): Called with ('rules' or 'workflows', item) as each item is streamed
+        
+        Returns:
+            tuple: (results, errors) where results has 'rules' and/or 'workflows'
+                   lists for the kinds requested, and errors maps each kind whose
+                   request failed for good to its error message
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled
+        """
+        results: Dict[str, List[Dict]] = {}
+        errors: Dict[str, str] = {}
+        if not self.is_available() or not (generate_rules or generate_workflows):
+            return results, errors
+        
+        if project_info is None:
+            loop = asyncio.get_running_loop()
+            project_info = await loop.run_in_executor(None, self.get_project_analysis, project_path, cancel_token)
+        prompts = {}
+        if generate_rules:
+            prompts['rules'] = self.generate_rules_prompt(project_idea, project_info)
+        if generate_workflows:
+            prompts['workflows'] = self.generate_workflows_prompt(project_idea, project_info)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        
+        async def request(content_type, prompt):
+            on_chunk = None
+            if on_item is not None:
+                stream = JsonItemStream(content_type)
+                
+                def on_chunk(text):
+                    for item in stream.feed(text):
+                        on_item(content_type, item)
+            
+            try:
+                response = await self._request_async(prompt, on_chunk)
+            except Exception as e:
+                print(f"Error generating {content_type}: {e}")
+                return content_type, [], str(e)
+            return content_type, self.parse_ai_response(response, content_type) if response else [], None
+        
+        pending = {asyncio.ensure_future(request(content_type, prompt)) for content_type, prompt in prompts.items()}
+        try:
+            while pending:
+                # Wake up regularly to notice cancellation while both requests are out
+                done, pending = await asyncio.wait(pending, timeout=0.05, return_when=asyncio.FIRST_COMPLETED)
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                for task in done:
+                    content_type, items, error = task.result()
+                    results[content_type] = items
+                    if error is not None:
+                        errors[content_type] = error
+                    if on_result is not None:
+                        on_result(content_type, items)
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return results, errors
+    
+    def generate_package_rules(self, project_idea: str, project_path: str, packages: List[Dict],
+                               cancel_token: Optional[CancellationToken] = None,
+                               max_concurrency: Optional[int] = None,
+                               on_package_done: Optional[Callable[[Dict, List[Dict]], None]] = None
+                               ) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Generate rules for each package of a monorepo, several requests at a time
+        
+        Every package gets its own analysis and prompt. Analyses take turns, the
+        AI requests overlap up to max_concurrency (analysis setting
+        'package_concurrency' by default). Rules are scoped to their package:
+        globs are prefixed with the package path and titles with its name.
+        
+        Args:
+            project_idea (str): Project description
+            project_path (str): Repository root
+            packages (list): Entries of project_info['packages']
+            cancel_token (CancellationToken): Stops outstanding packages when cancelled
+            max_concurrency (int): Maximum number of packages in flight
+            on_package_done (callable): Called with (package, rules) as each package finishes
+        
+        Returns:
+            tuple: (rules, errors) where rules are the rules of all packages in
+                   package order, and errors maps the path of each package whose
+                   analysis or request failed to the error message
+        
+        Raises:
+            OperationCancelled: If cancel_token is cancelled
+        """
+        if not self.is_available() or not packages:
+            return [], {}
+        
+        if max_concurrency is None:
+            max_concurrency = int(self.analysis_settings.get('package_concurrency', 4))
+        
+        def generate_for(package):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            package_info = self.get_project_analysis(project_path, cancel_token, package['path'])
+            prompt = self.generate_rules_prompt(project_idea, package_info)
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            response = self._request(prompt, cancel_token)
+            rules = self.parse_ai_response(response, 'rules') if response else []
+            return [self._scope_rule(rule, package) for rule in rules if isinstance(rule, dict)]
+        
+        results: Dict[str, List[Dict]] = {}
+        errors: Dict[str, str] = {}
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency), thread_name_prefix='windforge-package'
+        )
+        futures = {executor.submit(generate_for, package): package for package in packages}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                package = futures[future]
+                try:
+                    rules = future.result()
+                except OperationCancelled:
+                    raise
+                except Exception as e:
+                    print(f"Error generating rules for package {package['path']}: {e}")
+                    errors[package['path']] = str(e)
+                    rules = []
+                results[package['path']] = rules
+                if on_package_done is not None:
+                    on_package_done(package, rules)
+        finally:
+            # Queued packages are dropped; running ones stop at their next cancellation check
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        return [rule for package in packages for rule in results.get(package['path'], [])], errors
+    
+    def _scope_rule(self, rule: Dict, package: Dict) -> Dict:
+        """Restrict a generated rule to the files of one package"""
+        prefix = package['path'].rstrip('/') + '/'
+        scoped = dict(rule)
+        globs = [glob.strip() for glob in split_glob(str(rule.get('glob') or '')) if glob.strip()]
+        scoped_globs = []
+        for glob in globs:
+            while glob.startswith('./'):
+                glob = glob[2:]
+            glob = glob.lstrip('/')
+            scoped_globs.append(glob if glob.startswith(prefix) else prefix + glob)
+        scoped['glob'] = ','.join(scoped_globs) or prefix + '**'
+        scoped['title'] = f"{package['name']}: {rule.get('title', 'Untitled')}"
+        scoped['package'] = package['path']
+        return scoped
+    
     def get_status_message(self) -> str:
         """Get current status message"""
-        if not GEMINI_AVAILABLE:
-            return ("❌ Gemini AI library not available.\n"
-                   "This is likely due to Python 3.14 compatibility issues.\n"
-                   "Solutions:\n"
-                   "• Use Python 3.11 or 3.12\n"
-                   "• Run: pip install google-generativeai\n"
-                   "• Use WindForge without AI features")
-        elif genai is None:
-            return ("❌ Gemini AI library failed to load.\n"
-                   "Library import error occurred.\n"
-                   "Try reinstalling: pip install --upgrade google-generativeai")
-        elif not self.api_key:
-            return ("⚠️ API key not configured.\n"
-                   "Please:\n"
-                   "• Get API key from Google AI Studio\n"
-                   "• Set GEMINI_API_KEY environment variable\n"
-                   "• Or configure directly in settings")
-        elif not self.is_configured:
-            return ("⚠️ Gemini model not configured properly.\n"
-                   "Please check:\n"
-                   "• API key is valid\n"
-                   "• Internet connection\n"
-                   "• Google AI service is accessible")
-        else:
-            return "✅ AI Generator ready!"
+        return self.backend.status_message()
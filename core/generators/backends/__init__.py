@@ -0,0 +1,58 @@
+"""
+Backends package - Model backends the AI generator can talk to
+"""
+
+from typing import Dict, Optional, Type
+
+from .base import BackendError, ModelBackend
+from .gemini import GEMINI_AVAILABLE, GeminiBackend
+from .local_http import LocalHTTPBackend, serve_local_backend
+from .fake import FakeBackend
+
+DEFAULT_BACKEND = 'gemini'
+
+# Backend classes by their 'model_backend' setting name
+BACKENDS: Dict[str, Type[ModelBackend]] = {
+    GeminiBackend.name: GeminiBackend,
+    LocalHTTPBackend.name: LocalHTTPBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def register_backend(backend_class: Type[ModelBackend]):
+    """Make a backend class selectable by its name"""
+    BACKENDS[backend_class.name] = backend_class
+
+
+def create_backend(settings: Optional[Dict] = None, api_key: Optional[str] = None) -> ModelBackend:
+    """
+    Create the backend selected by the 'model_backend' setting
+    
+    Args:
+        settings (dict): 'ai_settings' section of the configuration
+        api_key (str): API key for backends that need one
+    
+    Returns:
+        ModelBackend: The selected backend (Gemini if the name is unknown)
+    """
+    settings = settings or {}
+    name = settings.get('model_backend') or DEFAULT_BACKEND
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        print(f"Error: unknown model backend '{name}', using {DEFAULT_BACKEND}")
+        backend_class = BACKENDS[DEFAULT_BACKEND]
+    return backend_class.from_settings(settings, api_key)
+
+
+__all__ = [
+    'BackendError',
+    'ModelBackend',
+    'GeminiBackend',
+    'LocalHTTPBackend',
+    'FakeBackend',
+    'GEMINI_AVAILABLE',
+    'BACKENDS',
+    'register_backend',
+    'create_backend',
+    'serve_local_backend'
+]
@@ -0,0 +1,101 @@
+"""
+Model Backend Module - Interface shared by all AI model backends
+A backend turns a prompt into text, whole or as a stream of pieces
+"""
+
+import abc
+import asyncio
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+
+class BackendError(Exception):
+    """
+    Raised when a backend cannot produce a response
+    
+    retryable marks transient failures (rate limits, overload, lost
+    connections); retry_after is the wait the server asked for, in seconds.
+    """
+    
+    def __init__(self, message: str, retryable: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def generation_config_from_settings(settings: Dict) -> Dict:
+    """Generation parameters from the 'temperature' and 'max_tokens' settings"""
+    config = {}
+    if settings.get('temperature') is not None:
+        config['temperature'] = float(settings['temperature'])
+    if settings.get('max_tokens'):
+        config['max_output_tokens'] = int(settings['max_tokens'])
+    return config
+
+
+class ModelBackend(abc.ABC):
+    """
+    Base class of model backends
+    
+    Subclasses implement generate(); the async and streaming variants default
+    to running it in the loop's executor and yielding the whole text at once,
+    backends with native async or streaming APIs override them.
+    """
+    
+    # Name used in the 'model_backend' setting
+    name = ''
+    default_model_name = ''
+    
+    def __init__(self, model_name: Optional[str] = None, generation_config: Optional[Dict] = None):
+        self.model_name = model_name or self.default_model_name
+        # Passed to the model with every request, and part of the response cache key
+        self.generation_config: Dict = dict(generation_config or {})
+    
+    @classmethod
+    def from_settings(cls, settings: Dict, api_key: Optional[str] = None) -> 'ModelBackend':
+        """Create the backend from the 'ai_settings' section of the configuration"""
+        return cls(settings.get('model') or None, generation_config_from_settings(settings))
+    
+    @property
+    def cache_name(self) -> str:
+        """Identifies this backend's responses in the response cache"""
+        return f"{self.name}/{self.model_name}"
+    
+    def is_available(self) -> bool:
+        return True
+    
+    def set_api_key(self, api_key: Optional[str]):
+        """Backends that need no key ignore it"""
+        pass
+    
+    def status_message(self) -> str:
+        return "✅ AI Generator ready!"
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether a request that failed with error may succeed if sent again"""
+        if isinstance(error, BackendError):
+            return error.retryable
+        return isinstance(error, (TimeoutError, ConnectionError))
+    
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """Seconds the server asked to wait before retrying, if it said"""
+        return getattr(error, 'retry_after', None)
+    
+    @abc.abstractmethod
+    def generate(self, prompt: str) -> str:
+        """
+        Generate a response (blocking)
+        
+        Raises:
+            BackendError: If no response could be produced
+        """
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """Generate a response as pieces of text (blocking)"""
+        yield self.generate(prompt)
+    
+    async def generate_async(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate, prompt)
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        yield await self.generate_async(prompt)
@@ -0,0 +1,136 @@
+"""
+Fake Backend Module - Deterministic in-process model for offline runs
+Answers rules and workflows prompts with made-up items after a configurable
+delay, and fails on demand, for load tests and benchmarks without network
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from .base import BackendError, ModelBackend, generation_config_from_settings
+
+CATEGORIES = ['Logic', 'Security', 'Performance', 'Testing', 'Documentation']
+ACTIVATIONS = ['Always On', 'Glob', 'Manual']
+
+
+class FakeBackend(ModelBackend):
+    """
+    In-process stand-in for a model
+    
+    The response depends only on the prompt (and seed), so identical prompts
+    get identical answers. Each request waits latency seconds before its
+    first piece of text and chunk_latency seconds before every further piece.
+    Failures are drawn from a random generator seeded with seed, so a given
+    sequence of requests fails the same way on every run; they are marked
+    retryable, like a rate limit.
+    """
+    
+    name = 'fake'
+    default_model_name = 'fake-model'
+    
+    def __init__(self, model_name: Optional[str] = None, latency: float = 0.5,
+                 chunk_latency: float = 0.02, chunk_size: int = 64,
+                 failure_rate: float = 0.0, seed: int = 0,
+                 rule_count: int = 5, workflow_count: int = 3,
+                 generation_config: Optional[Dict] = None):
+        super().__init__(model_name, generation_config)
+        self.latency = latency
+        self.chunk_latency = chunk_latency
+        self.chunk_size = max(1, chunk_size)
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.rule_count = rule_count
+        self.workflow_count = workflow_count
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+    
+    @classmethod
+    def from_settings(cls, settings: Dict, api_key: Optional[str] = None) -> 'FakeBackend':
+        return cls(
+            settings.get('model') or None,
+            latency=float(settings.get('fake_latency_seconds', 0.5)),
+            chunk_latency=float(settings.get('fake_chunk_latency_seconds', 0.02)),
+            failure_rate=float(settings.get('fake_failure_rate', 0.0)),
+            seed=int(settings.get('fake_seed', 0)),
+            generation_config=generation_config_from_settings(settings)
+        )
+    
+    def status_message(self) -> str:
+        return (f"✅ AI Generator ready! (offline fake model, {self.latency:g}s latency, "
+                f"{self.failure_rate:.0%} failures)")
+    
+    def _start_request(self):
+        """Count the request and decide whether it fails"""
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        if failed:
+            raise BackendError("Injected failure from the fake model backend", retryable=True)
+    
+    def response_for(self, prompt: str) -> str:
+        """The full response to a prompt"""
+        digest = hashlib.sha256(f"{self.seed}\0{prompt}".encode('utf-8')).hexdigest()
+        if '"workflows"' in prompt:
+            data = {'workflows': self._workflows(digest)}
+        else:
+            data = {'rules': self._rules(digest)}
+        return "```json\n" + json.dumps(data, ensure_ascii=False, indent=2) + "\n```"
+    
+    def _rules(self, digest: str) -> List[Dict]:
+        rules = []
+        for i in range(self.rule_count):
+            tag = digest[i * 4:i * 4 + 6]
+            rules.append({
+                'title': f"Rule {i + 1} ({tag})",
+                'category': CATEGORIES[i % len(CATEGORIES)],
+                'activation': ACTIVATIONS[i % len(ACTIVATIONS)],
+                'glob': '**/*',
+                'description': f"Generated by the fake model backend for prompt {digest[:12]}",
+                'rules': [f"Guideline {j + 1} of rule {i + 1}" for j in range(3)]
+            })
+        return rules
+    
+    def _workflows(self, digest: str) -> List[Dict]:
+        workflows = []
+        for i in range(self.workflow_count):
+            tag = digest[i * 4:i * 4 + 6]
+            workflows.append({
+                'title': f"Workflow {i + 1} ({tag})",
+                'description': f"Generated by the fake model backend for prompt {digest[:12]}",
+                'steps': [f"Step {j + 1} of workflow {i + 1}" for j in range(4)]
+            })
+        return workflows
+    
+    def _chunks(self, prompt: str) -> List[str]:
+        text = self.response_for(prompt)
+        return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+    
+    def generate(self, prompt: str) -> str:
+        return ''.join(self.generate_stream(prompt))
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        self._start_request()
+        for i, chunk in enumerate(self._chunks(prompt)):
+            time.sleep(self.latency if i == 0 else self.chunk_latency)
+            yield chunk
+    
+    async def generate_async(self, prompt: str) -> str:
+        chunks = []
+        async for chunk in self.generate_stream_async(prompt):
+            chunks.append(chunk)
+        return ''.join(chunks)
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        self._start_request()
+        for i, chunk in enumerate(self._chunks(prompt)):
+            await asyncio.sleep(self.latency if i == 0 else self.chunk_latency)
+            yield chunk
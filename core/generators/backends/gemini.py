@@ -0,0 +1,136 @@
+"""
+Gemini Backend Module - Google Gemini models through google.generativeai
+"""
+
+import os
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from .base import BackendError, ModelBackend, generation_config_from_settings
+
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except (ImportError, TypeError, Exception) as e:
+    # Handle various import errors including the metaclass issue
+    print(f"Warning: Google Generative AI not available - {type(e).__name__}: {e}")
+    genai = None
+    GEMINI_AVAILABLE = False
+
+try:
+    from google.api_core import exceptions as api_exceptions
+    # Quota, overload and timeout errors of the Gemini API
+    RETRYABLE_ERRORS = (
+        api_exceptions.TooManyRequests, api_exceptions.ResourceExhausted,
+        api_exceptions.InternalServerError, api_exceptions.ServiceUnavailable,
+        api_exceptions.DeadlineExceeded
+    )
+except ImportError:
+    RETRYABLE_ERRORS = ()
+
+
+class GeminiBackend(ModelBackend):
+    """Gemini Flash through the google.generativeai client"""
+    
+    name = 'gemini'
+    default_model_name = 'gemini-2.0-flash-exp'
+    
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None,
+                 generation_config: Optional[Dict] = None):
+        super().__init__(model_name, generation_config)
+        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        self.model = None
+        self.is_configured = False
+        # Set when the library imported but fails to work
+        self.library_broken = False
+        
+        if GEMINI_AVAILABLE and self.api_key:
+            self.configure()
+    
+    @classmethod
+    def from_settings(cls, settings: Dict, api_key: Optional[str] = None) -> 'GeminiBackend':
+        return cls(api_key, settings.get('model') or None, generation_config_from_settings(settings))
+    
+    def configure(self):
+        """Configure Gemini AI model"""
+        if not GEMINI_AVAILABLE or genai is None or self.library_broken:
+            print("Gemini AI not available - skipping configuration")
+            self.is_configured = False
+            return
+        
+        try:
+            # Test if genai is actually working
+            genai.configure(api_key=self.api_key)
+            self.model = genai.GenerativeModel(self.model_name, generation_config=self.generation_config or None)
+            self.is_configured = True
+            print("✅ Gemini AI configured successfully!")
+        except (TypeError, ImportError, AttributeError) as e:
+            print(f"❌ Gemini AI library issue: {e}")
+            self.is_configured = False
+            self.library_broken = True
+        except Exception as e:
+            print(f"❌ Error configuring Gemini: {e}")
+            self.is_configured = False
+    
+    def set_api_key(self, api_key: Optional[str]):
+        self.api_key = api_key
+        if GEMINI_AVAILABLE and genai is not None:
+            self.configure()
+    
+    def is_available(self) -> bool:
+        return GEMINI_AVAILABLE and not self.library_broken and self.is_configured
+    
+    def status_message(self) -> str:
+        if not GEMINI_AVAILABLE or self.library_broken:
+            return ("❌ Gemini AI library not available.\n"
+                   "This is likely due to Python 3.14 compatibility issues.\n"
+                   "Solutions:\n"
+                   "• Use Python 3.11 or 3.12\n"
+                   "• Run: pip install google-generativeai\n"
+                   "• Use WindForge without AI features")
+        elif genai is None:
+            return ("❌ Gemini AI library failed to load.\n"
+                   "Library import error occurred.\n"
+                   "Try reinstalling: pip install --upgrade google-generativeai")
+        elif not self.api_key:
+            return ("⚠️ API key not configured.\n"
+                   "Please:\n"
+                   "• Get API key from Google AI Studio\n"
+                   "• Set GEMINI_API_KEY environment variable\n"
+                   "• Or configure directly in settings")
+        elif not self.is_configured:
+            return ("⚠️ Gemini model not configured properly.\n"
+                   "Please check:\n"
+                   "• API key is valid\n"
+                   "• Internet connection\n"
+                   "• Google AI service is accessible")
+        else:
+            return "✅ AI Generator ready!"
+    
+    def is_retryable(self, error: Exception) -> bool:
+        return isinstance(error, RETRYABLE_ERRORS) or super().is_retryable(error)
+    
+    def _require_model(self):
+        if self.model is None:
+            raise BackendError("Gemini model is not configured")
+    
+    def generate(self, prompt: str) -> str:
+        self._require_model()
+        return self.model.generate_content(prompt).text
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        self._require_model()
+        for chunk in self.model.generate_content(prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+    
+    async def generate_async(self, prompt: str) -> str:
+        self._require_model()
+        response = await self.model.generate_content_async(prompt)
+        return response.text
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        self._require_model()
+        response = await self.model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
@@ -0,0 +1,219 @@
+"""
+Local HTTP Backend Module - Model served over HTTP on this machine
+Talks to a localhost endpoint, and provides a stand-in server that answers
+with any other backend (the fake one by default)
+
+Protocol: POST {url}/generate with {"model", "prompt", "config", "stream"}.
+A plain request answers {"text": ...}; a streamed one answers one JSON
+object per line, {"text": ...} for each piece or {"error": ...}.
+
+Run the stand-in with: python -m core.generators.backends.local_http --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from .base import BackendError, ModelBackend, generation_config_from_settings
+from .fake import FakeBackend
+
+DEFAULT_LOCAL_URL = 'http://127.0.0.1:8765'
+
+# Statuses worth retrying: rate limited or temporarily unable to answer
+RETRYABLE_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+class LocalHTTPBackend(ModelBackend):
+    """Model behind a localhost HTTP endpoint"""
+    
+    name = 'local'
+    default_model_name = 'local-model'
+    
+    def __init__(self, url: str = DEFAULT_LOCAL_URL, model_name: Optional[str] = None,
+                 timeout: float = 120.0, generation_config: Optional[Dict] = None):
+        super().__init__(model_name, generation_config)
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+    
+    @classmethod
+    def from_settings(cls, settings: Dict, api_key: Optional[str] = None) -> 'LocalHTTPBackend':
+        return cls(
+            settings.get('local_backend_url') or DEFAULT_LOCAL_URL,
+            settings.get('model') or None,
+            float(settings.get('local_backend_timeout', 120.0)),
+            generation_config_from_settings(settings)
+        )
+    
+    def status_message(self) -> str:
+        return f"✅ AI Generator ready! (local model at {self.url})"
+    
+    def _open(self, prompt: str, stream: bool):
+        body = json.dumps({
+            'model': self.model_name, 'prompt': prompt,
+            'config': self.generation_config, 'stream': stream
+        }, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(
+            f"{self.url}/generate", data=body, headers={'Content-Type': 'application/json'}
+        )
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise BackendError(
+                f"Local model returned HTTP {e.code}: {e.read().decode('utf-8', 'replace')}",
+                retryable=e.code in RETRYABLE_STATUSES, retry_after=self._retry_after_header(e)
+            )
+        except (urllib.error.URLError, OSError) as e:
+            raise BackendError(f"Local model at {self.url} unreachable: {e}", retryable=True)
+    
+    @staticmethod
+    def _retry_after_header(error: urllib.error.HTTPError) -> Optional[float]:
+        try:
+            return float(error.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _piece(line: bytes) -> Optional[str]:
+        line = line.strip()
+        if not line:
+            return None
+        data = json.loads(line.decode('utf-8'))
+        if 'error' in data:
+            raise BackendError(f"Local model error: {data['error']}", retryable=bool(data.get('retryable')))
+        return data.get('text') or None
+    
+    def generate(self, prompt: str) -> str:
+        with self._open(prompt, False) as response:
+            data = json.loads(response.read().decode('utf-8'))
+        if 'error' in data:
+            raise BackendError(f"Local model error: {data['error']}")
+        return data.get('text', '')
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        with self._open(prompt, True) as response:
+            for line in response:
+                piece = self._piece(line)
+                if piece:
+                    yield piece
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        # urllib blocks, every read runs in the loop's executor
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, self._open, prompt, True)
+        try:
+            while True:
+                line = await loop.run_in_executor(None, response.readline)
+                if not line:
+                    break
+                piece = self._piece(line)
+                if piece:
+                    yield piece
+        finally:
+            response.close()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Answers with self.server.backend, set by serve_local_backend"""
+    
+    server_version = 'WindForgeStandIn/1.0'
+    
+    def do_GET(self):
+        if self.path.rstrip('/') != '/health':
+            self.send_error(404)
+            return
+        self._send_json({'status': 'ok', 'backend': self.server.backend.cache_name})
+    
+    def do_POST(self):
+        if self.path.rstrip('/') != '/generate':
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            prompt = request['prompt']
+        except (ValueError, KeyError) as e:
+            self._send_json({'error': f"Bad request: {e}"}, 400)
+            return
+        
+        backend = self.server.backend
+        if not request.get('stream'):
+            try:
+                self._send_json({'text': backend.generate(prompt)})
+            except Exception as e:
+                # Transient failures look like a rate limit to the client
+                self._send_json({'error': str(e)}, 429 if getattr(e, 'retryable', False) else 422)
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        try:
+            for piece in backend.generate_stream(prompt):
+                self._write_line({'text': piece})
+        except Exception as e:
+            self._write_line({'error': str(e), 'retryable': getattr(e, 'retryable', False)})
+        self.close_connection = True
+    
+    def _write_line(self, data: Dict):
+        self.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.wfile.flush()
+    
+    def _send_json(self, data: Dict, status: int = 200):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_local_backend(backend: Optional[ModelBackend] = None, host: str = '127.0.0.1',
+                        port: int = 8765) -> ThreadingHTTPServer:
+    """
+    Create a stand-in server answering LocalHTTPBackend requests
+    
+    Args:
+        backend (ModelBackend): Backend that produces the answers (FakeBackend by default)
+        host (str): Interface to listen on
+        port (int): Port to listen on, 0 picks a free one
+    
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() (or run it in a thread) and shutdown()
+    """
+    server = ThreadingHTTPServer((host, port), _StandInHandler)
+    server.daemon_threads = True
+    server.backend = backend or FakeBackend()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in model server backed by the fake model")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.5, help="Seconds before the first piece")
+    parser.add_argument('--chunk-latency', type=float, default=0.02, help="Seconds between pieces")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    backend = FakeBackend(latency=args.latency, chunk_latency=args.chunk_latency,
+                          failure_rate=args.failure_rate, seed=args.seed)
+    server = serve_local_backend(backend, args.host, args.port)
+    print(f"Stand-in model listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
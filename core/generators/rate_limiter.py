@@ -0,0 +1,193 @@
+"""
+Rate Limiter Module - Request and token quotas for model calls
+Token buckets keep concurrent requests under a per-minute quota, and a retry
+policy spaces out retries of failed requests with jittered exponential backoff
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+# Share of a per-minute quota that may be used in a single burst (at least one
+# unit), and the most of it a burst may take so the rest can refill
+BURST_SHARE = 0.25
+MAX_BURST_SHARE = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a text (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously
+    
+    reserve() takes what it needs right away, letting the balance go negative,
+    and returns how long the caller must wait before using it. Reservations
+    are served in the order they were made. The bucket starts full, holds at
+    most burst tokens (a quarter of the quota by default, at most half of it)
+    and refills at (per_minute - burst) per minute, so a full bucket plus a
+    minute of refill never grants more than per_minute in any 60 seconds.
+    """
+    
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        self._lock = threading.Lock()
+        self.per_minute = 0
+        self._balance = 0.0
+        self._updated = time.monotonic()
+        self.configure(per_minute, burst)
+    
+    def configure(self, per_minute: float, burst: Optional[float] = None):
+        """Change the quota; 0 or less means unlimited"""
+        with self._lock:
+            was_unlimited = self.per_minute <= 0
+            if not was_unlimited:
+                # Settle what accrued under the old rate
+                self._refill(time.monotonic())
+            self.per_minute = per_minute
+            if per_minute <= 0:
+                self.burst = 0.0
+                self._rate = 0.0
+                return
+            if burst is None:
+                burst = max(1.0, per_minute * BURST_SHARE)
+            self.burst = min(float(burst), per_minute * MAX_BURST_SHARE)
+            # A full bucket plus a minute of refill adds up to exactly one quota
+            self._rate = (per_minute - self.burst) / 60.0
+            self._balance = self.burst if was_unlimited else min(self._balance, self.burst)
+            self._updated = time.monotonic()
+    
+    @property
+    def unlimited(self) -> bool:
+        return self.per_minute <= 0
+    
+    def _refill(self, now: float):
+        self._balance = min(self.burst, self._balance + (now - self._updated) * self._rate)
+        self._updated = now
+    
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount tokens and return the seconds to wait before using them"""
+        if self.unlimited:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._balance -= amount
+            if self._balance >= 0:
+                return 0.0
+            return -self._balance / self._rate
+    
+    def charge(self, amount: float):
+        """Take tokens for something already done (delays later reservations)"""
+        if self.unlimited:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._balance -= amount
+
+
+class RateLimiter:
+    """Requests per minute and tokens per minute quota of one model"""
+    
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+    
+    def configure(self, requests_per_minute: float, tokens_per_minute: float):
+        if requests_per_minute != self.requests.per_minute:
+            self.requests.configure(requests_per_minute)
+        if tokens_per_minute != self.tokens.per_minute:
+            self.tokens.configure(tokens_per_minute)
+    
+    def reserve(self, prompt_tokens: int) -> float:
+        """Reserve one request with prompt_tokens and return the seconds to wait"""
+        return max(self.requests.reserve(1), self.tokens.reserve(prompt_tokens))
+    
+    def charge_response(self, response_tokens: int):
+        """Count the tokens of a response against the token quota"""
+        self.tokens.charge(response_tokens)
+
+
+# One limiter per model, shared by every generator using it
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter(name: str, requests_per_minute: float, tokens_per_minute: float) -> RateLimiter:
+    """
+    The rate limiter of a model, created on first use
+    
+    Generators for the same model share one quota; later calls update its limits.
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(name)
+        if limiter is None:
+            limiter = _shared_limiters[name] = RateLimiter(requests_per_minute, tokens_per_minute)
+        else:
+            limiter.configure(requests_per_minute, tokens_per_minute)
+        return limiter
+
+
+class RetryBudget:
+    """
+    Caps retries at a share of requests
+    
+    Every request deposits ratio, every retry withdraws one. Under a wide
+    outage retries stop once the balance is spent instead of multiplying the
+    load; capacity lets a quiet generator retry a few times from the start.
+    """
+    
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._balance = capacity
+        self._lock = threading.Lock()
+    
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+    
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and a retry budget"""
+    
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                 budget: Optional[RetryBudget] = None, seed: Optional[int] = None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number attempt (0 based)
+        
+        A random point between zero and the exponential ceiling, so that
+        requests failing together do not retry together. A server-supplied
+        retry_after is a lower bound.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        with self._lock:
+            delay = self._random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+    
+    def record_request(self):
+        """Count a new request towards the retry budget"""
+        self.budget.deposit()
+    
+    def should_retry(self, attempt: int) -> bool:
+        """Whether a failed request may be retried for the (attempt + 1)th time"""
+        return attempt < self.max_retries and self.budget.try_withdraw()
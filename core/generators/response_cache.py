@@ -0,0 +1,145 @@
+"""
+Response Cache Module - On-disk cache of AI responses
+Stores model responses keyed by (model, prompt, parameters) with TTL and size-bounded LRU eviction
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+CACHE_VERSION = 1
+
+# Temporary files older than this were left behind by an interrupted write
+STALE_TEMP_SECONDS = 3600
+
+# Default location of cached responses
+DEFAULT_RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.windforge', 'cache', 'responses')
+
+
+class ResponseCache:
+    """
+    AI responses stored one file per key
+    
+    Reading an entry touches its file, so eviction removes the least recently
+    used responses first once the directory outgrows max_bytes. Entries older
+    than ttl_seconds are treated as missing and deleted when read.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 32 * 1024 * 1024,
+                 ttl_seconds: float = 7 * 24 * 3600):
+        self.cache_dir = cache_dir or DEFAULT_RESPONSE_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, params: Optional[Dict] = None) -> str:
+        """Hash of everything that determines a response"""
+        payload = json.dumps(
+            {'model': model, 'prompt': prompt, 'params': params or {}},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for a key, or None if missing or expired"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_VERSION or data.get('key') != key:
+                self.misses += 1
+                return None
+            if self.ttl_seconds and time.time() - data.get('created', 0) > self.ttl_seconds:
+                os.remove(path)
+                self.misses += 1
+                return None
+            # Touch the file so eviction sees it as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return data.get('response')
+    
+    def put(self, key: str, response: str, model: str = '') -> bool:
+        """Store a response and evict the least recently used ones over the size limit"""
+        path = self._entry_path(key)
+        # Concurrent requests may write at the same time
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data = {'version': CACHE_VERSION, 'key': key, 'model': model, 'created': time.time(), 'response': response}
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error saving AI response to cache: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+        
+        self.evict(keep=path)
+        return True
+    
+    def clear(self):
+        """Delete every cached response (and leftover temporary files)"""
+        for path in self._cache_files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def evict(self, keep: Optional[str] = None):
+        """
+        Delete least recently used responses until the cache fits in max_bytes
+        
+        Stale temporary files are deleted first; ones still being written count
+        towards the size but are left alone.
+        """
+        files = []
+        total = 0
+        stale_before = time.time() - STALE_TEMP_SECONDS
+        for path in self._cache_files():
+            try:
+                stat = os.stat(path)
+                if path.endswith('.tmp'):
+                    if stat.st_mtime < stale_before:
+                        os.remove(path)
+                    else:
+                        total += stat.st_size
+                    continue
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def _cache_files(self) -> List[str]:
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names if name.endswith(('.json', '.tmp'))]
@@ -0,0 +1,86 @@
+"""
+Stream Parser Module - Incremental parsing of streamed AI responses
+Picks complete items out of a JSON array while the response is still arriving
+"""
+
+import json
+from typing import Dict, List, Optional
+
+
+class JsonItemStream:
+    """
+    Items of the array under one key of a streamed JSON object
+    
+    feed() scans only the text it has not seen before, tracking strings and
+    nesting depth, and returns every array item whose closing brace arrived.
+    Text around the object (markdown fences, prose) is ignored, like
+    parse_ai_response does with the full response.
+    """
+    
+    def __init__(self, key: str):
+        self.key = key
+        self._buffer = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = -1
+        # Last string seen directly inside the top-level object, a candidate key
+        self._last_string: Optional[str] = None
+        # Depth inside the target array, and where the current item began
+        self._array_depth = 0
+        self._item_start = -1
+        self._finished = False
+        self.items: List[Dict] = []
+    
+    def feed(self, text: str) -> List[Dict]:
+        """Add a chunk of the response and return the items it completed"""
+        self._buffer += text
+        completed = []
+        buffer = self._buffer
+        
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buffer[self._string_start + 1:pos]
+                continue
+            
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in '{[':
+                self._depth += 1
+                if char == '[' and self._depth == 2 and not self._array_depth and not self._finished \
+                        and self._last_string == self.key:
+                    self._array_depth = 2
+                elif char == '{' and self._array_depth and self._depth == self._array_depth + 1:
+                    self._item_start = pos
+            elif char in '}]':
+                if char == '}' and self._item_start != -1 and self._depth == self._array_depth + 1:
+                    item = self._parse_item(buffer[self._item_start:pos + 1])
+                    if item is not None:
+                        completed.append(item)
+                    self._item_start = -1
+                elif char == ']' and self._array_depth and self._depth == self._array_depth:
+                    self._array_depth = 0
+                    self._finished = True
+                self._depth = max(0, self._depth - 1)
+        
+        self._pos = len(buffer)
+        self.items.extend(completed)
+        return completed
+    
+    @staticmethod
+    def _parse_item(text: str) -> Optional[Dict]:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
@@ -11,6 +11,7 @@ from .validator import (
     is_valid_filename_part,
     validate_glob_pattern
 )
+from .cancellation import CancellationToken, OperationCancelled, run_cancellable
 
 __all__ = [
     'ensure_directory_exists',
@@ -22,5 +23,8 @@ __all__ = [
     'validate_workflow_input',
     'validate_directory_path',
     'is_valid_filename_part',
-    'validate_glob_pattern'
+    'validate_glob_pattern',
+    'CancellationToken',
+    'OperationCancelled',
+    'run_cancellable'
 ]
@@ -0,0 +1,78 @@
+"""
+Cancellation Module - Cooperative cancellation for long running jobs
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class OperationCancelled(Exception):
+    """Raised when a job notices that its cancellation token was triggered"""
+    pass
+
+
+class CancellationToken:
+    """
+    Thread-safe flag shared between the UI and a background job
+    
+    A multiprocessing Event may be passed in to share the flag with another process.
+    """
+    
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+    
+    def cancel(self):
+        """Request cancellation"""
+        self._event.set()
+    
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+    
+    def raise_if_cancelled(self):
+        """Raise OperationCancelled if cancellation was requested"""
+        if self._event.is_set():
+            raise OperationCancelled()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or the timeout passes; returns True if cancelled"""
+        return self._event.wait(timeout)
+
+
+def run_cancellable(func: Callable[[], Any], cancel_token: Optional[CancellationToken],
+                    poll_interval: float = 0.05) -> Any:
+    """
+    Run a blocking call so that the caller can give up on it
+    
+    The call runs on a daemon thread. If the token is cancelled first the caller
+    gets OperationCancelled right away and the call's eventual result is dropped.
+    
+    Args:
+        func (callable): Blocking call without arguments
+        cancel_token (CancellationToken): Token to watch (None calls func directly)
+        poll_interval (float): Seconds between checks of the token
+    
+    Returns:
+        Any: Whatever func returns (its exceptions are re-raised)
+    """
+    if cancel_token is None:
+        return func()
+    
+    cancel_token.raise_if_cancelled()
+    outcome = {}
+    
+    def target():
+        try:
+            outcome['value'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+    
+    thread = threading.Thread(target=target, name='windforge-blocking-call', daemon=True)
+    thread.start()
+    while thread.is_alive():
+        cancel_token.raise_if_cancelled()
+        thread.join(poll_interval)
+    
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('value')
@@ -1,19 +1,22 @@
 import sys
 import os
+from typing import List, Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
     QHBoxLayout, QFormLayout, QLineEdit, QTextEdit, QComboBox, 
     QPushButton, QFileDialog, QMessageBox, QTextBrowser, QLabel,
-    QSplitter, QGroupBox
+    QSplitter, QGroupBox, QCompleter
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QStringListModel
 from PyQt6.QtGui import QFont, QIcon
 
 # Import core modules
 from core.generators import generate_rule_md, save_rule_file, generate_workflow_md, save_workflow_file, AI_AVAILABLE
 from core.utils import validate_rule_input, validate_workflow_input, validate_directory_path
 from core.utils import get_default_windsurf_paths, get_default_config
+from core.utils import CancellationToken, OperationCancelled
 from core.config_manager import ConfigManager
+from core.analysis import ProjectAnalyzer
 # Import generator functions directly
 # from core.generators.rules_generator import RulesGenerator  # Not needed - using functions from __init__.py
 # from core.generators.workflows_generator import WorkflowsGenerator  # Not needed - using functions from __init__.py
@@ -28,12 +31,50 @@ if AI_AVAILABLE:
 else:
     AITab = None
 
+class GlobSuggesterWorker(QThread):
+    """Worker thread building glob suggestions, so analyzing the project never blocks typing"""
+    
+    # (project_root, GlobSuggester or None if the analysis failed)
+    suggester_ready = pyqtSignal(str, object)
+    
+    def __init__(self, analyzer: ProjectAnalyzer, project_root: str, categories: List[str], parent=None):
+        super().__init__(parent)
+        self.analyzer = analyzer
+        self.project_root = project_root
+        # Rule categories whose suggestions are worked out here rather than on the GUI thread
+        self.categories = categories
+        self.cancel_token = CancellationToken()
+    
+    def cancel(self):
+        """Ask the running analysis to stop as soon as possible"""
+        self.cancel_token.cancel()
+    
+    def run(self):
+        """Analyze the project (reusing the last analysis if its files did not change)"""
+        try:
+            suggester = self.analyzer.get_glob_suggester(self.project_root, self.cancel_token)
+            suggester.prepare(self.categories, self.cancel_token.is_cancelled)
+            self.cancel_token.raise_if_cancelled()
+        except OperationCancelled:
+            return
+        except Exception as e:
+            print(f"Error analyzing project for glob suggestions: {e}")
+            suggester = None
+        self.suggester_ready.emit(self.project_root, suggester)
+
 class WindsurfGeneratorApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
         self.config = self.config_manager.config
         self.default_paths = self.config_manager.get('default_paths')
+        self.glob_analyzer = None
+        self.glob_suggester = None
+        # Project the suggester was built for, the worker building the next one
+        # and whether to fill in a suggestion once it is ready
+        self.glob_suggester_root = None
+        self.glob_worker = None
+        self.suggest_glob_when_ready = False
         self.init_ui()
         self.setup_menu()
         
@@ -178,10 +219,28 @@ class WindsurfGeneratorApp(QMainWindow):
         self.rule_activation.addItems(self.config_manager.get('activation_modes', []))
         form_layout.addRow("Activation Mode:", self.rule_activation)
         
-        # Glob pattern
+        # Glob pattern, completed from the project's files
+        glob_layout = QHBoxLayout()
         self.rule_glob = QLineEdit()
         self.rule_glob.setPlaceholderText("e.g., **/*.py")
-        form_layout.addRow("Glob Pattern:", self.rule_glob)
+        self.glob_completions = QStringListModel()
+        glob_completer = QCompleter(self.glob_completions, self.rule_glob)
+        glob_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.rule_glob.setCompleter(glob_completer)
+        glob_completer.activated.connect(lambda _: self.update_rule_glob_hint())
+        self.rule_glob.textEdited.connect(self.on_rule_glob_edited)
+        
+        self.btn_suggest_glob = QPushButton("Suggest")
+        self.btn_suggest_glob.setToolTip("Suggest patterns covering the project's files for this category")
+        self.btn_suggest_glob.clicked.connect(self.suggest_rule_glob)
+        glob_layout.addWidget(self.rule_glob)
+        glob_layout.addWidget(self.btn_suggest_glob)
+        form_layout.addRow("Glob Pattern:", glob_layout)
+        
+        self.rule_glob_hint = QLabel("")
+        self.rule_glob_hint.setStyleSheet("color: #6e6e73; font-size: 11px;")
+        form_layout.addRow("", self.rule_glob_hint)
+        self.rule_category.currentTextChanged.connect(self.on_rule_category_changed)
         
         # Description
         self.rule_description = QTextEdit()
@@ -411,6 +470,109 @@ class WindsurfGeneratorApp(QMainWindow):
         if folder:
             self.workflow_output_path.setText(folder)
     
+    def get_rules_project_root(self) -> Optional[str]:
+        """Project the rules are written for: the AI tab's project, else the folder holding .windsurf"""
+        if self.ai_tab and self.ai_tab.project_path.text().strip():
+            return os.path.abspath(self.ai_tab.project_path.text().strip())
+        rules_parent = os.path.dirname(os.path.abspath(self.rule_output_path.text()))
+        if os.path.basename(rules_parent) == '.windsurf':
+            return os.path.dirname(rules_parent)
+        return None
+    
+    def refresh_glob_suggester(self, suggest: bool = False):
+        """
+        Rebuild the glob suggestions for the current project in a worker thread
+        
+        The project is only reanalyzed if its files changed. With suggest, the
+        glob field is filled with the suggested patterns once they are ready.
+        """
+        project_root = self.get_rules_project_root()
+        if project_root is None:
+            self.glob_suggester = None
+            self.glob_suggester_root = None
+            self.rule_glob_hint.setText("Choose a project in the AI Generator tab to get glob suggestions")
+            return
+        self.suggest_glob_when_ready = self.suggest_glob_when_ready or suggest
+        
+        if self.glob_worker is not None:
+            if self.glob_worker.project_root == project_root:
+                return
+            self.glob_worker.cancel()
+        
+        if self.glob_analyzer is None:
+            if self.ai_tab:
+                self.glob_analyzer = self.ai_tab.ai_generator.analyzer
+            else:
+                self.glob_analyzer = ProjectAnalyzer(self.config_manager.get('analysis_settings', {}))
+        self.glob_worker = GlobSuggesterWorker(
+            self.glob_analyzer, project_root, self.config_manager.get_categories(), self
+        )
+        self.glob_worker.suggester_ready.connect(self.on_glob_suggester_ready)
+        self.glob_worker.finished.connect(self.glob_worker.deleteLater)
+        self.rule_glob_hint.setText("Indexing project files...")
+        self.glob_worker.start()
+    
+    def on_glob_suggester_ready(self, project_root: str, suggester):
+        """Use the suggestions a worker built, unless a newer worker replaced it"""
+        if self.sender() is not self.glob_worker:
+            return
+        self.glob_worker = None
+        self.glob_suggester = suggester
+        self.glob_suggester_root = project_root
+        suggest, self.suggest_glob_when_ready = self.suggest_glob_when_ready, False
+        if suggester is None:
+            self.rule_glob_hint.setText("Could not analyze the project for glob suggestions")
+        elif suggest:
+            self.apply_glob_suggestion()
+        elif self.rule_glob.hasFocus():
+            self.update_glob_completions(self.rule_glob.text())
+            self.rule_glob.completer().complete()
+        else:
+            self.update_rule_glob_hint()
+    
+    def on_rule_glob_edited(self, text: str):
+        """Complete the glob being typed and show how many files it matches"""
+        if self.glob_suggester is None or self.glob_suggester_root != self.get_rules_project_root():
+            # Nothing to complete from until the worker is done
+            self.glob_completions.setStringList([])
+            self.refresh_glob_suggester()
+            return
+        self.update_glob_completions(text)
+    
+    def update_glob_completions(self, text: str):
+        """Offer completions of the glob field from the current suggester"""
+        category = self.rule_category.currentText()
+        self.glob_completions.setStringList(self.glob_suggester.complete(text, category=category))
+        self.update_rule_glob_hint()
+    
+    def suggest_rule_glob(self):
+        """Fill the glob field with the patterns covering the selected category"""
+        self.refresh_glob_suggester(suggest=True)
+    
+    def apply_glob_suggestion(self):
+        """Put the current suggester's patterns for the selected category into the glob field"""
+        suggestion = self.glob_suggester.suggest(category=self.rule_category.currentText())
+        if not suggestion['glob']:
+            self.rule_glob_hint.setText(f"No files match the {self.rule_category.currentText()} category")
+            return
+        self.rule_glob.setText(suggestion['glob'])
+        self.update_rule_glob_hint()
+    
+    def on_rule_category_changed(self, category: str):
+        """Recount the glob matches for the new category"""
+        if self.glob_suggester is not None:
+            self.update_rule_glob_hint()
+    
+    def update_rule_glob_hint(self):
+        """Show the number of files the glob matches, and how many belong to the category"""
+        glob = self.rule_glob.text().strip()
+        if not glob or self.glob_suggester is None:
+            self.rule_glob_hint.setText("")
+            return
+        category = self.rule_category.currentText()
+        matches, relevant = self.glob_suggester.count_matches(glob, category=category)
+        self.rule_glob_hint.setText(f"Matches {matches:,} files ({relevant:,} {category})")
+    
     def generate_rule(self):
         """Generate rule markdown file"""
         try:
@@ -657,6 +819,16 @@ class WindsurfGeneratorApp(QMainWindow):
                         
             except Exception as e:
                 print(f"Error updating API key from settings: {e}")
+    
+    def closeEvent(self, event):
+        """Release background analysis resources before closing"""
+        # Replaced workers may still be finishing their analysis too
+        for worker in self.findChildren(GlobSuggesterWorker):
+            worker.cancel()
+            worker.wait()
+        if self.ai_tab:
+            self.ai_tab.ai_generator.shutdown()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def make_tree():
+    """
+    Create files below a directory
+    
+    Called with (root, files) where files maps relative paths to contents,
+    or lists relative paths that are written with their own path as content.
+    """
+    def make(root, files):
+        if not isinstance(files, dict):
+            files = {rel_path: rel_path for rel_path in files}
+        for rel_path, content in files.items():
+            path = root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+    return make
+
+
+@pytest.fixture
+def entry_for():
+    """os.DirEntry of a file, as the walker yields it"""
+    def find(path):
+        with os.scandir(str(path.parent)) as entries:
+            return next(entry for entry in entries if entry.name == path.name)
+    return find
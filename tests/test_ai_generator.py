@@ -0,0 +1,112 @@
+"""
+Tests for the AI generator module, run against the fake model backend
+"""
+
+import pytest
+
+from core.generators.ai_generator import AIGenerator
+from core.generators.backends import FakeBackend
+from core.utils import CancellationToken, OperationCancelled
+
+
+@pytest.fixture
+def project(tmp_path, make_tree):
+    root = tmp_path / 'project'
+    make_tree(root, {'main.py': '', 'packages/api/pyproject.toml': '', 'packages/web/package.json': '{"name": "web"}'})
+    return root
+
+
+@pytest.fixture
+def make_generator(tmp_path):
+    generators = []
+    
+    def make(max_retries=0, **backend_options):
+        backend = FakeBackend(latency=0, chunk_latency=0, chunk_size=32, **backend_options)
+        generator = AIGenerator(
+            analysis_settings={'index_cache_dir': str(tmp_path / 'index')},
+            backend=backend,
+            ai_settings={
+                'response_cache_dir': str(tmp_path / 'responses'),
+                'requests_per_minute': 0,
+                'tokens_per_minute': 0,
+                'max_retries': max_retries,
+                'retry_base_delay_seconds': 0.001
+            }
+        )
+        generators.append(generator)
+        return generator
+    
+    yield make
+    for generator in generators:
+        generator.shutdown()
+
+
+def test_generate_all_streams_items_and_caches_responses(make_generator, project):
+    generator = make_generator()
+    streamed = []
+    results, errors = generator.run_async(generator.generate_all_async(
+        'A web app', str(project), on_item=lambda kind, item: streamed.append((kind, item['title']))
+    ))
+    assert errors == {}
+    assert len(results['rules']) == generator.backend.rule_count
+    assert len(results['workflows']) == generator.backend.workflow_count
+    assert sorted(streamed) == sorted(
+        [('rules', rule['title']) for rule in results['rules']] +
+        [('workflows', workflow['title']) for workflow in results['workflows']]
+    )
+    
+    calls = generator.backend.calls
+    again, _ = generator.run_async(generator.generate_all_async('A web app', str(project)))
+    assert again == results
+    assert generator.backend.calls == calls
+
+
+def test_failed_requests_are_reported_per_kind(make_generator, project):
+    generator = make_generator(failure_rate=1.0)
+    results, errors = generator.run_async(generator.generate_all_async('A web app', str(project)))
+    assert results == {'rules': [], 'workflows': []}
+    assert set(errors) == {'rules', 'workflows'}
+    assert 'Injected failure' in errors['rules']
+
+
+def test_transient_failures_are_retried(make_generator, project):
+    generator = make_generator(max_retries=10, failure_rate=0.5, seed=1)
+    rules = generator.generate_rules('A web app', str(project))
+    assert len(rules) == generator.backend.rule_count
+    assert generator.backend.failures > 0
+
+
+def test_package_rules_are_scoped_and_failures_reported(make_generator, project):
+    generator = make_generator()
+    packages = generator.get_project_analysis(str(project))['packages']
+    assert [package['path'] for package in packages] == ['packages/api', 'packages/web']
+    
+    rules, errors = generator.generate_package_rules('A web app', str(project), packages)
+    assert errors == {}
+    assert len(rules) == 2 * generator.backend.rule_count
+    assert rules[0]['package'] == 'packages/api'
+    assert rules[0]['glob'] == 'packages/api/**/*'
+    assert rules[-1]['title'].startswith('web: ')
+    
+    generator.backend.failure_rate = 1.0
+    generator.bypass_response_cache = True
+    rules, errors = generator.generate_package_rules('A web app', str(project), packages)
+    assert rules == []
+    assert set(errors) == {'packages/api', 'packages/web'}
+
+
+def test_scope_rule_splits_brace_globs(make_generator):
+    generator = make_generator()
+    package = {'path': 'apps/web', 'name': 'web'}
+    scoped = generator._scope_rule({'title': 'T', 'glob': './src/*.{ts,tsx}, apps/web/README.md'}, package)
+    assert scoped['glob'] == 'apps/web/src/*.{ts,tsx},apps/web/README.md'
+    assert generator._scope_rule({'title': 'T'}, package)['glob'] == 'apps/web/**'
+
+
+def test_cancelled_request_raises(make_generator, project):
+    generator = make_generator()
+    generator.backend.latency = 5
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(OperationCancelled):
+        generator.generate_content('prompt', token)
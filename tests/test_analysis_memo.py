@@ -0,0 +1,43 @@
+"""
+Tests for the analysis memo module
+"""
+
+from core.analysis.analysis_memo import AnalysisMemo
+
+
+def test_memo_reuses_while_the_fingerprint_matches():
+    memo = AnalysisMemo()
+    info = {'file_count': 1}
+    memo.put('key', info, 'f1')
+    assert memo.get('key', 'f1') is info
+    assert memo.get('other', 'f1') is None
+    
+    assert memo.get('key', 'f2') is None
+    # A mismatch drops the entry
+    assert memo.get('key', 'f1') is None
+
+
+def test_memo_without_a_fingerprint_is_a_miss():
+    memo = AnalysisMemo()
+    memo.put('key', {}, 'f1')
+    assert memo.get('key') is None
+    # The entry survives, a later call can still check it
+    assert memo.get('key', 'f1') == {}
+
+
+def test_matching_watcher_version_skips_the_check():
+    memo = AnalysisMemo()
+    info = {}
+    memo.put('key', info, 'f1', version=3)
+    assert memo.get('key', version=3) is info
+    assert memo.get('key', 'f2', version=4) is None
+
+
+def test_memo_keeps_the_most_recent_entries():
+    memo = AnalysisMemo(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        memo.put(key, {'key': key}, 'f')
+    assert memo.get('a', 'f') is None
+    assert memo.get('c', 'f') == {'key': 'c'}
+    memo.clear()
+    assert memo.get('c', 'f') is None
@@ -0,0 +1,167 @@
+"""
+Tests for the model backends
+"""
+
+import asyncio
+import json
+import socket
+import threading
+
+import pytest
+
+from core.generators.backends import (
+    BACKENDS, BackendError, FakeBackend, LocalHTTPBackend, ModelBackend, create_backend, serve_local_backend
+)
+from core.generators.response_cache import ResponseCache
+
+
+class EchoBackend(ModelBackend):
+    name = 'echo'
+    default_model_name = 'echo-1'
+    
+    def generate(self, prompt):
+        return prompt.upper()
+
+
+async def collect(iterator):
+    return [piece async for piece in iterator]
+
+
+def payload(response):
+    """JSON inside the ```json fence of a fake response"""
+    return json.loads(response[len('```json\n'):-len('\n```')])
+
+
+def instant_fake(**kwargs):
+    return FakeBackend(latency=0, chunk_latency=0, **kwargs)
+
+
+@pytest.fixture
+def stand_in():
+    """A stand-in server on a free port, with the backend it answers with"""
+    backend = instant_fake(chunk_size=16)
+    server = serve_local_backend(backend, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield backend, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_model_backend_requires_generate():
+    with pytest.raises(TypeError):
+        ModelBackend()
+
+
+def test_default_async_and_streaming_variants():
+    backend = EchoBackend()
+    assert backend.model_name == 'echo-1'
+    assert backend.cache_name == 'echo/echo-1'
+    assert list(backend.generate_stream('hi')) == ['HI']
+    assert asyncio.run(backend.generate_async('hi')) == 'HI'
+    assert asyncio.run(collect(backend.generate_stream_async('hi'))) == ['HI']
+
+
+def test_retryable_errors():
+    backend = EchoBackend()
+    assert backend.is_retryable(BackendError('busy', retryable=True))
+    assert not backend.is_retryable(BackendError('bad prompt'))
+    assert backend.is_retryable(ConnectionResetError())
+    assert not backend.is_retryable(ValueError())
+    assert backend.retry_after(BackendError('busy', retry_after=2.5)) == 2.5
+
+
+def test_create_backend_by_name():
+    fake = create_backend({'model_backend': 'fake', 'model': 'm', 'fake_latency_seconds': 0})
+    assert isinstance(fake, FakeBackend)
+    assert fake.cache_name == 'fake/m'
+    assert fake.latency == 0
+    
+    local = create_backend({'model_backend': 'local', 'local_backend_url': 'http://127.0.0.1:1/'})
+    assert isinstance(local, LocalHTTPBackend)
+    assert local.url == 'http://127.0.0.1:1'
+    
+    assert isinstance(create_backend({'model_backend': 'nope'}), BACKENDS['gemini'])
+
+
+@pytest.mark.parametrize('name', ['gemini', 'local', 'fake'])
+def test_generation_config_comes_from_the_settings(name):
+    settings = {'model_backend': name, 'model': 'm', 'temperature': 0.2, 'max_tokens': 512}
+    backend = create_backend(settings)
+    assert backend.model_name == 'm'
+    assert backend.generation_config == {'temperature': 0.2, 'max_output_tokens': 512}
+    # Responses generated at another temperature are cached apart
+    warmer = create_backend(dict(settings, temperature=0.9))
+    assert (ResponseCache.make_key(backend.cache_name, 'prompt', backend.generation_config)
+            != ResponseCache.make_key(warmer.cache_name, 'prompt', warmer.generation_config))
+
+
+def test_fake_backend_is_deterministic():
+    backend = instant_fake()
+    response = backend.generate('rules please')
+    assert response == instant_fake().generate('rules please')
+    assert response != backend.generate('other prompt')
+    assert response != instant_fake(seed=1).generate('rules please')
+    
+    assert len(payload(response)['rules']) == backend.rule_count
+    assert len(payload(backend.response_for('"workflows"'))['workflows']) == backend.workflow_count
+
+
+def test_fake_backend_streams_the_same_text():
+    backend = instant_fake(chunk_size=10)
+    pieces = list(backend.generate_stream('prompt'))
+    assert len(pieces) > 1
+    assert ''.join(pieces) == backend.response_for('prompt')
+    assert asyncio.run(backend.generate_async('prompt')) == backend.response_for('prompt')
+
+
+def test_fake_backend_failures_are_seeded_and_retryable():
+    def outcomes(seed):
+        backend = instant_fake(failure_rate=0.5, seed=seed)
+        results = []
+        for _ in range(20):
+            try:
+                backend.generate('p')
+                results.append(True)
+            except BackendError as e:
+                assert e.retryable
+                results.append(False)
+        return results, backend
+    
+    results, backend = outcomes(3)
+    assert results == outcomes(3)[0]
+    assert backend.calls == 20
+    assert backend.failures == results.count(False) > 0
+
+
+def test_local_backend_round_trip(stand_in):
+    fake, url = stand_in
+    backend = LocalHTTPBackend(url, timeout=5)
+    expected = fake.response_for('prompt')
+    assert backend.generate('prompt') == expected
+    
+    pieces = list(backend.generate_stream('prompt'))
+    assert len(pieces) > 1
+    assert ''.join(pieces) == expected
+    assert ''.join(asyncio.run(collect(backend.generate_stream_async('prompt')))) == expected
+
+
+def test_local_backend_reports_server_failures(stand_in):
+    fake, url = stand_in
+    fake.failure_rate = 1.0
+    backend = LocalHTTPBackend(url, timeout=5)
+    with pytest.raises(BackendError) as plain:
+        backend.generate('prompt')
+    assert plain.value.retryable
+    with pytest.raises(BackendError) as streamed:
+        list(backend.generate_stream('prompt'))
+    assert streamed.value.retryable
+
+
+def test_local_backend_unreachable():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    with pytest.raises(BackendError) as error:
+        LocalHTTPBackend(f"http://127.0.0.1:{port}", timeout=2).generate('prompt')
+    assert error.value.retryable
@@ -0,0 +1,55 @@
+"""
+Tests for the analysis budget module
+"""
+
+from core.analysis.budget import AnalysisBudget, extrapolate_file_count, mark_truncated
+
+
+def test_unlimited_budget_never_expires():
+    budget = AnalysisBudget(0, 0)
+    assert not budget.is_limited
+    assert all(budget.charge_file() for _ in range(1000))
+    assert budget.reason is None
+
+
+def test_file_limit_allows_exactly_max_files():
+    budget = AnalysisBudget(max_files=5)
+    assert all(budget.charge_file() for _ in range(5))
+    assert not budget.expired()
+    assert not budget.charge_file()
+    assert budget.reason == 'max_files'
+
+
+def test_time_limit_expires(monkeypatch):
+    budget = AnalysisBudget(max_seconds=10)
+    assert not budget.expired()
+    monkeypatch.setattr(budget, 'started', budget.started - 11)
+    assert budget.expired()
+    assert budget.reason == 'max_seconds'
+
+
+def test_reason_sticks_to_the_first_limit():
+    budget = AnalysisBudget(max_seconds=3600, max_files=1)
+    budget.charge_file()
+    budget.charge_file()
+    budget.started -= 7200
+    assert budget.expired()
+    assert budget.reason == 'max_files'
+
+
+def test_extrapolate_file_count():
+    assert extrapolate_file_count(100, 10, 10) == 200
+    assert extrapolate_file_count(100, 10, 0) == 100
+    assert extrapolate_file_count(7, 0, 5) == 7
+
+
+def test_mark_truncated():
+    budget = AnalysisBudget(max_files=1)
+    budget.charge_file()
+    budget.charge_file()
+    budget.expired()
+    project_info = {'file_count': 50}
+    mark_truncated(project_info, budget, 5, 5)
+    assert project_info['truncated']
+    assert project_info['truncated_reason'] == 'max_files'
+    assert project_info['estimated_file_count'] == 100
@@ -0,0 +1,53 @@
+"""
+Tests for the cancellation module
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.utils import CancellationToken, OperationCancelled, run_cancellable
+
+
+def test_token():
+    token = CancellationToken()
+    assert not token.is_cancelled
+    token.raise_if_cancelled()
+    assert not token.wait(0)
+    token.cancel()
+    assert token.is_cancelled
+    assert token.wait(0)
+    with pytest.raises(OperationCancelled):
+        token.raise_if_cancelled()
+
+
+def test_run_cancellable_returns_and_raises():
+    assert run_cancellable(lambda: 42, None) == 42
+    assert run_cancellable(lambda: 42, CancellationToken()) == 42
+    
+    def fail():
+        raise ValueError('boom')
+    
+    with pytest.raises(ValueError):
+        run_cancellable(fail, CancellationToken())
+
+
+def test_run_cancellable_gives_up_on_a_blocked_call():
+    token = CancellationToken()
+    release = threading.Event()
+    threading.Timer(0.1, token.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(OperationCancelled):
+        run_cancellable(lambda: release.wait(10), token)
+    assert time.monotonic() - started < 5
+    release.set()
+
+
+def test_run_cancellable_does_not_start_when_cancelled():
+    token = CancellationToken()
+    token.cancel()
+    calls = []
+    with pytest.raises(OperationCancelled):
+        run_cancellable(lambda: calls.append(1), token)
+    assert calls == []
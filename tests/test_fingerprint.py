@@ -0,0 +1,84 @@
+"""
+Tests for the fingerprint module
+"""
+
+import hashlib
+import os
+
+from core.analysis.fingerprint import FingerprintBuilder, FingerprintCache, project_fingerprint
+from core.analysis.walker import ProjectWalker
+
+
+def fingerprint(root, cache=None, **kwargs):
+    return project_fingerprint(ProjectWalker(str(root)), cache, **kwargs)
+
+
+def test_fingerprint_is_stable_and_tracks_changes(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/c/d.py'])
+    first = fingerprint(tmp_path)
+    assert first == fingerprint(tmp_path)
+    
+    os.utime(str(tmp_path / 'src' / 'b.py'), ns=(0, 12345))
+    touched = fingerprint(tmp_path)
+    assert touched != first
+    
+    make_tree(tmp_path, ['src/c/e.py'])
+    assert fingerprint(tmp_path) not in (first, touched)
+
+
+def test_unreported_files_do_not_count(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'debug.log'])
+    (tmp_path / '.gitignore').write_text("*.log\n")
+    first = fingerprint(tmp_path)
+    make_tree(tmp_path, ['other.log', 'node_modules/x/index.js', 'empty/.keep'])
+    (tmp_path / 'debug.log').write_text('changed')
+    assert fingerprint(tmp_path) == first
+
+
+def test_renaming_a_directory_changes_the_fingerprint(tmp_path, make_tree):
+    make_tree(tmp_path, ['one/a.py'])
+    first = fingerprint(tmp_path)
+    os.rename(str(tmp_path / 'one'), str(tmp_path / 'two'))
+    assert fingerprint(tmp_path) != first
+
+
+def test_cache_rehashes_only_changed_directories(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'docs/c.md'])
+    cache = FingerprintCache()
+    first = fingerprint(tmp_path, cache)
+    assert cache.rehashed == 3
+    assert set(cache.digests) == {'', 'src', 'docs'}
+    
+    make_tree(tmp_path, ['src/new.py'])
+    second = fingerprint(tmp_path, cache)
+    assert second != first
+    assert cache.rehashed == 4
+    assert cache.reused == 2
+    # Same result as without a cache
+    assert second == fingerprint(tmp_path)
+
+
+def test_subtree_fingerprint_matches_its_digest_in_the_whole_tree(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/c/d.py'])
+    cache = FingerprintCache()
+    fingerprint(tmp_path, cache)
+    assert fingerprint(tmp_path, start_dir='src') == cache.digests['src']
+
+
+def test_interrupted_and_empty_walks(tmp_path, make_tree):
+    make_tree(tmp_path, ['a/x.py', 'b/y.py'])
+    assert fingerprint(tmp_path, should_stop=lambda: True) is None
+    
+    empty = tmp_path / 'empty'
+    empty.mkdir()
+    assert fingerprint(empty) == hashlib.sha1(b'').hexdigest()
+
+
+def test_builder_skips_vanished_files(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'b.py'])
+    builder = FingerprintBuilder()
+    entries = list(ProjectWalker(str(tmp_path)).walk())
+    (tmp_path / 'b.py').unlink()
+    for rel_path, entry in entries:
+        builder.add_file(rel_path, entry)
+    assert [name for name, _, _ in builder.files_by_dir['']] == ['a.py']
@@ -0,0 +1,156 @@
+"""
+Tests for the git index module
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from core.analysis.git_index import GitIndexReader, find_git_dir, parse_git_index
+
+REGULAR = 0o100644
+SYMLINK = 0o120000
+GITLINK = 0o160000
+TREE = 0o040000
+
+
+def index_entry(path, size=0, mtime=(0, 0), inode=0, mode=REGULAR, stage=0, extended=0, version=2,
+                previous=b''):
+    """Bytes of one index entry"""
+    name = path.encode('utf-8')
+    flags = min(len(name), 0xFFF) | (stage << 12) | (0x4000 if extended else 0)
+    data = struct.pack('>10I', 0, 0, mtime[0], mtime[1], 0, inode, mode, 0, 0, size)
+    data += b'\0' * 20 + struct.pack('>H', flags)
+    if extended:
+        data += struct.pack('>H', extended)
+    if version == 4:
+        common = 0
+        while common < min(len(name), len(previous)) and name[common] == previous[common]:
+            common += 1
+        strip = len(previous) - common
+        assert strip < 0x80
+        return data + bytes([strip]) + name[common:] + b'\0'
+    data += name
+    return data + b'\0' * (8 - len(data) % 8)
+
+
+def index_file(entries, version=2):
+    data = b'DIRC' + struct.pack('>II', version, len(entries))
+    previous = b''
+    for entry in entries:
+        data += index_entry(version=version, previous=previous, **entry)
+        previous = entry['path'].encode('utf-8')
+    return data + b'\0' * 20
+
+
+def test_parse_regular_entries():
+    data = index_file([
+        {'path': 'README.md', 'size': 10, 'mtime': (5, 7), 'inode': 3},
+        {'path': 'src/app.py', 'size': 20, 'mtime': (6, 0), 'inode': 4}
+    ])
+    assert parse_git_index(data) == [
+        ('README.md', 10, 5 * 10**9 + 7, 3),
+        ('src/app.py', 20, 6 * 10**9, 4)
+    ]
+
+
+def test_parse_version_4_path_compression():
+    entries = [{'path': 'src/a.py'}, {'path': 'src/ab.py'}, {'path': 'tests/t.py'}]
+    assert [entry[0] for entry in parse_git_index(index_file(entries, version=4))] == [
+        'src/a.py', 'src/ab.py', 'tests/t.py'
+    ]
+
+
+def test_parse_skips_links_submodules_and_sparse_entries():
+    data = index_file([
+        {'path': 'a.py'},
+        {'path': 'link', 'mode': SYMLINK},
+        {'path': 'module', 'mode': GITLINK},
+        {'path': 'sparse.py', 'extended': 0x4000},
+        {'path': 'z.py'}
+    ], version=3)
+    assert [entry[0] for entry in parse_git_index(data)] == ['a.py', 'z.py']
+
+
+def test_parse_lists_conflicted_paths_once():
+    data = index_file([
+        {'path': 'conflict.py', 'stage': 1},
+        {'path': 'conflict.py', 'stage': 2},
+        {'path': 'conflict.py', 'stage': 3}
+    ])
+    assert [entry[0] for entry in parse_git_index(data)] == ['conflict.py']
+
+
+def test_parse_rejects_bad_input():
+    with pytest.raises(ValueError):
+        parse_git_index(b'nope')
+    with pytest.raises(ValueError):
+        parse_git_index(b'DIRC' + struct.pack('>II', 9, 0))
+    with pytest.raises(ValueError):
+        parse_git_index(index_file([{'path': 'a.py'}])[:30])
+    with pytest.raises(ValueError):
+        parse_git_index(index_file([{'path': 'dir', 'mode': TREE}]))
+
+
+def test_find_git_dir_climbs_and_follows_gitdir_files(tmp_path):
+    (tmp_path / 'repo' / '.git').mkdir(parents=True)
+    (tmp_path / 'repo' / 'src').mkdir()
+    assert find_git_dir(str(tmp_path / 'repo' / 'src')) == (
+        str(tmp_path / 'repo' / '.git'), str(tmp_path / 'repo')
+    )
+    
+    (tmp_path / 'linked').mkdir()
+    (tmp_path / 'linked' / '.git').write_text('gitdir: ../repo/.git/worktrees/linked\n')
+    assert find_git_dir(str(tmp_path / 'linked')) == (
+        os.path.normpath(str(tmp_path / 'repo' / '.git' / 'worktrees' / 'linked')), str(tmp_path / 'linked')
+    )
+
+
+def write_index(repo, entries):
+    git_dir = repo / '.git'
+    git_dir.mkdir(parents=True, exist_ok=True)
+    (git_dir / 'index').write_bytes(index_file(entries))
+
+
+def test_reader_returns_entries_and_prefix(tmp_path):
+    write_index(tmp_path, [{'path': 'a.py'}, {'path': 'pkg/b.py'}])
+    reader = GitIndexReader()
+    index_path, prefix, entries = reader.tracked_files(str(tmp_path))
+    assert index_path == str(tmp_path / '.git' / 'index')
+    assert prefix == ''
+    assert [entry[0] for entry in entries] == ['a.py', 'pkg/b.py']
+    
+    (tmp_path / 'pkg').mkdir()
+    assert reader.tracked_files(str(tmp_path / 'pkg'))[1] == 'pkg/'
+    assert reader.parsed == 1
+
+
+def test_reader_gives_up_on_untracked_folders(tmp_path):
+    write_index(tmp_path, [{'path': 'a.py'}, {'path': 'pkg/b.py'}])
+    (tmp_path / 'other').mkdir()
+    (tmp_path / 'pk').mkdir()
+    reader = GitIndexReader()
+    assert reader.tracked_files(str(tmp_path / 'other')) is None
+    assert reader.tracked_files(str(tmp_path / 'pk')) is None
+
+
+def test_reader_gives_up_on_unreadable_index(tmp_path):
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'index').write_bytes(b'garbage')
+    assert GitIndexReader().tracked_files(str(tmp_path)) is None
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+def test_reader_matches_git_ls_files(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/deep/c.txt', 'docs/d.md'])
+    subprocess.run(['git', 'init', '-q'], cwd=str(tmp_path), check=True)
+    subprocess.run(['git', 'add', '-A'], cwd=str(tmp_path), check=True)
+    
+    listed = subprocess.run(['git', 'ls-files'], cwd=str(tmp_path), check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+    _, _, entries = GitIndexReader().tracked_files(str(tmp_path))
+    assert [entry[0] for entry in entries] == listed
+    assert dict((entry[0], entry[1]) for entry in entries)['src/b.py'] == len('src/b.py')
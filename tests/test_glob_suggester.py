@@ -0,0 +1,96 @@
+"""
+Tests for the glob suggester module
+"""
+
+import re
+
+from core.analysis.glob_suggester import GlobSuggester, file_shapes, glob_to_regex, split_glob
+
+PATHS = [
+    'src/app.ts',
+    'src/components/Button.tsx',
+    'src/components/Button.test.tsx',
+    'src/utils/format.ts',
+    'tests/test_api.py',
+    'docs/index.md',
+    'README.md'
+]
+
+
+def matches(pattern, path):
+    return re.fullmatch(glob_to_regex(pattern), path) is not None
+
+
+def test_glob_to_regex_double_star_matches_any_depth():
+    assert matches('**/*.ts', 'app.ts')
+    assert matches('**/*.ts', 'src/utils/format.ts')
+    assert matches('src/**', 'src/a/b/c.txt')
+    assert not matches('src/**/*.ts', 'lib/app.ts')
+
+
+def test_glob_to_regex_single_star_stays_in_segment():
+    assert matches('src/*.ts', 'src/app.ts')
+    assert not matches('src/*.ts', 'src/utils/format.ts')
+    assert matches('src/?pp.ts', 'src/app.ts')
+
+
+def test_glob_to_regex_braces_and_classes():
+    assert matches('**/*.{ts,tsx}', 'src/components/Button.tsx')
+    assert matches('**/*.{ts,tsx}', 'src/app.ts')
+    assert not matches('**/*.{ts,tsx}', 'src/app.js')
+    assert matches('file[0-9].txt', 'file3.txt')
+    assert not matches('file[!0-9].txt', 'file3.txt')
+
+
+def test_glob_to_regex_strips_leading_dot_slash():
+    assert matches('./src/*.ts', 'src/app.ts')
+    assert matches('/src/*.ts', 'src/app.ts')
+
+
+def test_split_glob_keeps_brace_alternatives_together():
+    assert split_glob('src/*.{ts,tsx},docs/**') == ['src/*.{ts,tsx}', 'docs/**']
+    assert split_glob('a, b') == ['a', ' b']
+    assert split_glob('') == ['']
+    assert split_glob('src/{a,b') == ['src/{a,b']
+
+
+def test_file_shapes():
+    assert file_shapes('App.test.tsx') == ['*.tsx', '*.test.tsx']
+    assert file_shapes('test_api.py') == ['*.py', 'test_*.py', '*_api.py']
+    assert file_shapes('Dockerfile') == ['Dockerfile']
+
+
+def test_count_matches_with_braces():
+    suggester = GlobSuggester(PATHS)
+    assert suggester.count_matches('src/**/*.{ts,tsx}') == (4, 4)
+    assert suggester.count_matches('src/**/*.{ts,tsx},**/*.md') == (6, 6)
+    assert suggester.count_matches('') == (0, 0)
+
+
+def test_count_matches_relevant_share():
+    suggester = GlobSuggester(PATHS)
+    assert suggester.count_matches('**', language='Python') == (7, 1)
+    assert suggester.count_matches('src/**', category='Testing') == (4, 1)
+
+
+def test_suggest_covers_language_files():
+    suggester = GlobSuggester(PATHS)
+    result = suggester.suggest(language='Python')
+    assert result['relevant'] == 1
+    assert result['covered'] == 1
+    assert suggester.count_matches(result['glob'], language='Python')[1] == 1
+
+
+def test_complete_keeps_patterns_with_braces():
+    suggester = GlobSuggester(PATHS)
+    for completion in suggester.complete('src/**/*.{ts,tsx},do'):
+        assert completion.startswith('src/**/*.{ts,tsx},')
+    assert 'src/**/*.{ts,tsx},docs/**/*.md' in suggester.complete('src/**/*.{ts,tsx},do')
+
+
+def test_prepare_caches_category_queries():
+    suggester = GlobSuggester(PATHS)
+    suggester.prepare(['Testing', 'Documentation'])
+    assert set(suggester._queries) == {(None, 'Testing'), (None, 'Documentation')}
+    suggester.prepare(['Styling'], should_stop=lambda: True)
+    assert (None, 'Styling') not in suggester._queries
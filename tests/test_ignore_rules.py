@@ -0,0 +1,99 @@
+"""
+Tests for the ignore rules module
+"""
+
+import os
+import time
+
+from core.analysis import ignore_rules
+from core.analysis.ignore_rules import IgnoreFile, IgnoreRules, load_ignore_file, parse_ignore_line
+
+
+def ignored(lines, rel_path, is_dir=False, base=''):
+    return IgnoreRules().extend(IgnoreFile(base, lines)).is_ignored(rel_path, is_dir)
+
+
+def test_blank_lines_and_comments_are_skipped():
+    assert parse_ignore_line('') is None
+    assert parse_ignore_line('   ') is None
+    assert parse_ignore_line('# comment') is None
+    assert parse_ignore_line('/') is None
+
+
+def test_parse_flags():
+    _, negated, dir_only = parse_ignore_line('!build/')
+    assert negated and dir_only
+    _, negated, dir_only = parse_ignore_line('\\!important')
+    assert not negated and not dir_only
+
+
+def test_unanchored_pattern_matches_at_any_depth():
+    assert ignored(['*.log'], 'debug.log')
+    assert ignored(['*.log'], 'a/b/debug.log')
+    assert not ignored(['*.log'], 'debug.txt')
+
+
+def test_anchored_pattern_matches_from_the_base():
+    assert ignored(['/build'], 'build', True)
+    assert not ignored(['/build'], 'src/build', True)
+    assert ignored(['docs/*.md'], 'docs/a.md')
+    assert not ignored(['docs/*.md'], 'docs/sub/a.md')
+
+
+def test_double_star():
+    assert ignored(['**/temp'], 'a/b/temp', True)
+    assert ignored(['logs/**'], 'logs/a/b.txt')
+    assert ignored(['a/**/z'], 'a/z')
+    assert ignored(['a/**/z'], 'a/b/c/z')
+
+
+def test_directory_only_pattern():
+    assert ignored(['out/'], 'out', True)
+    assert not ignored(['out/'], 'out', False)
+
+
+def test_negation_reincludes():
+    assert not ignored(['*.log', '!keep.log'], 'keep.log')
+    assert ignored(['*.log', '!keep.log'], 'other.log')
+
+
+def test_character_classes_and_escapes():
+    assert ignored(['file[0-9].txt'], 'file3.txt')
+    assert not ignored(['file[!0-9].txt'], 'file3.txt')
+    assert ignored(['\\#notes'], '#notes')
+    assert ignored(['trailing\\ '], 'trailing ')
+
+
+def test_deeper_files_take_precedence():
+    rules = IgnoreRules().extend(IgnoreFile('', ['*.gen.ts'])).extend(IgnoreFile('src', ['!keep.gen.ts']))
+    assert rules.is_ignored('lib/a.gen.ts', False)
+    assert rules.is_ignored('src/a.gen.ts', False)
+    assert not rules.is_ignored('src/keep.gen.ts', False)
+
+
+def test_empty_rules_ignore_nothing():
+    assert not IgnoreRules()
+    assert not IgnoreRules().is_ignored('anything', False)
+
+
+def test_load_ignore_file_reloads_after_edit(tmp_path):
+    path = tmp_path / '.gitignore'
+    assert load_ignore_file(str(path), '') is None
+    path.write_text('*.log\n')
+    first = load_ignore_file(str(path), '')
+    assert first.match('a.log', False)
+    assert load_ignore_file(str(path), '') is first
+    
+    path.write_text('*.tmp\n')
+    later = time.time() + 10
+    os.utime(str(path), (later, later))
+    second = load_ignore_file(str(path), '')
+    assert second is not first
+    assert second.match('a.log', False) is None
+    assert second.match('a.tmp', False)
+    # The entry for the file is replaced rather than added to
+    assert ignore_rules._compiled_cache[str(path)][2] is second
+    
+    path.unlink()
+    assert load_ignore_file(str(path), '') is None
+    assert str(path) not in ignore_rules._compiled_cache
@@ -0,0 +1,67 @@
+"""
+Tests for the language detector module
+"""
+
+import pytest
+
+from core.analysis.language_detector import LanguageDetector
+
+
+@pytest.mark.parametrize('name, language', [
+    ('app.py', 'Python'),
+    ('Main.JAVA', 'Java'),
+    ('settings.py.j2', 'Python'),
+    ('index.tsx', 'TypeScript'),
+    ('Makefile', 'Makefile'),
+    ('Dockerfile', 'Dockerfile'),
+    ('Gemfile', 'Ruby'),
+    ('notes.unknown', None)
+])
+def test_detect_by_name(tmp_path, name, language, entry_for):
+    path = tmp_path / name
+    path.write_text('#!/bin/sh\n')
+    detector = LanguageDetector()
+    assert detector.detect(entry_for(path)) == language
+    # Names alone decide these, content is never read
+    assert detector.sniffed == 0
+
+
+@pytest.mark.parametrize('head, language', [
+    (b'#!/usr/bin/env python3\n', 'Python'),
+    (b'#!/usr/bin/python3.11 -u\n', 'Python'),
+    (b'#!/usr/bin/env -S node --experimental\n', 'JavaScript'),
+    (b'#!/bin/bash\n', 'Shell'),
+    (b'# -*- mode: ruby -*-\n', 'Ruby'),
+    (b'# -*- python -*-\n', 'Python'),
+    (b'x = 1\n# vim: set ft=python:\n', 'Python'),
+    (b'#!/usr/bin/env unknown\n', None),
+    (b'plain text\n', None)
+])
+def test_language_from_head(head, language):
+    assert LanguageDetector.language_from_head(head) == language
+
+
+def test_extensionless_scripts_are_sniffed_once(tmp_path, entry_for):
+    path = tmp_path / 'run'
+    path.write_bytes(b'#!/usr/bin/env python\nprint(1)\n')
+    detector = LanguageDetector()
+    assert detector.detect(entry_for(path)) == 'Python'
+    assert detector.detect(entry_for(path)) == 'Python'
+    assert detector.sniffed == 1
+
+
+def test_binary_files_are_not_sniffed_as_scripts(tmp_path, entry_for):
+    path = tmp_path / 'blob'
+    path.write_bytes(b'#!/bin/sh\0\1\2')
+    assert LanguageDetector().detect(entry_for(path)) is None
+
+
+@pytest.mark.parametrize('content, language', [
+    (b'int add(int a, int b);\n', 'C'),
+    (b'namespace app { class Widget; }\n', 'C++'),
+    (b'#import <Foundation/Foundation.h>\n@interface Widget\n@end\n', 'Objective-C')
+])
+def test_headers_are_resolved_from_content(tmp_path, content, language, entry_for):
+    path = tmp_path / 'widget.h'
+    path.write_bytes(content)
+    assert LanguageDetector().detect(entry_for(path)) == language
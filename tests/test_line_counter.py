@@ -0,0 +1,78 @@
+"""
+Tests for the line counter module
+"""
+
+import pytest
+
+from core.analysis import line_counter
+from core.analysis.line_counter import LineCountStore, LineCounter
+
+
+@pytest.mark.parametrize('content, lines', [
+    (b'', 0),
+    (b'one', 1),
+    (b'one\n', 1),
+    (b'one\ntwo', 2),
+    (b'one\ntwo\n\n', 3)
+])
+def test_counts_lines(tmp_path, content, lines, entry_for):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(content)
+    assert LineCounter().count(entry_for(path)) == lines
+
+
+def test_skips_binary_and_oversized_files(tmp_path, entry_for):
+    binary = tmp_path / 'blob.bin'
+    binary.write_bytes(b'\0\1\2\n')
+    large = tmp_path / 'large.txt'
+    large.write_bytes(b'x\n' * 100)
+    counter = LineCounter(max_bytes=50)
+    assert counter.count(entry_for(binary)) is None
+    assert counter.count(entry_for(large)) is None
+
+
+def test_large_files_are_counted_through_mmap(tmp_path, monkeypatch, entry_for):
+    monkeypatch.setattr(line_counter, 'SMALL_FILE_BYTES', 16)
+    monkeypatch.setattr(line_counter, 'MMAP_CHUNK_BYTES', 7)
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'line\n' * 20 + b'tail')
+    assert LineCounter().count(entry_for(path)) == 21
+
+
+def test_results_are_cached_until_the_file_changes(tmp_path, entry_for):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'a\nb\n')
+    counter = LineCounter()
+    assert counter.count(entry_for(path)) == 2
+    assert counter.count(entry_for(path)) == 2
+    assert counter.files_read == 1
+    
+    path.write_bytes(b'a\nb\nc\n')
+    assert counter.count(entry_for(path)) == 3
+    assert counter.files_read == 2
+
+
+def test_store_keeps_counts_across_counters(tmp_path, entry_for):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'a\nb\n')
+    store = LineCountStore()
+    assert LineCounter().count(entry_for(path), store, 'file.txt') == 2
+    assert store.changed == 1
+    
+    counter = LineCounter()
+    reloaded = LineCountStore(store.counts)
+    assert counter.count(entry_for(path), reloaded, 'file.txt') == 2
+    assert counter.files_read == 0
+    assert reloaded.changed == 0
+    assert reloaded.counts == store.counts
+    
+    path.write_bytes(b'a\nb\nc\n')
+    assert counter.count(entry_for(path), LineCountStore(store.counts), 'file.txt') == 3
+
+
+def test_missing_files_count_as_none(tmp_path, entry_for):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'a\n')
+    entry = entry_for(path)
+    path.unlink()
+    assert LineCounter().count(entry) is None
@@ -0,0 +1,138 @@
+"""
+Tests for the manifest parser module
+"""
+
+import json
+
+import pytest
+
+from core.analysis.manifest_parser import (
+    MAX_MANIFEST_BYTES, ManifestCache, _parse_toml_subset, manifest_kind, parse_manifest
+)
+
+PYPROJECT = '''
+[project]
+name = "demo"
+dependencies = [
+    "Django>=4.2",  # web
+    "requests",
+]
+
+[project.optional-dependencies]
+test = ["pytest>=7"]
+'''
+
+
+@pytest.mark.parametrize('filename, kind', [
+    ('package.json', 'package.json'),
+    ('Cargo.toml', 'cargo.toml'),
+    ('requirements-dev.txt', 'requirements.txt'),
+    ('Gemfile', 'gemfile'),
+    ('README.md', None),
+    ('requirements.in', None)
+])
+def test_manifest_kind(filename, kind):
+    assert manifest_kind(filename) == kind
+
+
+def test_package_json():
+    text = json.dumps({
+        'name': 'web', 'dependencies': {'react': '^18'}, 'devDependencies': {'vitest': '1'},
+        'workspaces': {'packages': ['packages/*']}
+    })
+    result = parse_manifest('package.json', text)
+    assert result['name'] == 'web'
+    assert result['dependencies'] == ['react', 'vitest']
+    assert result['workspaces'] == ['packages/*']
+    assert result['frameworks'] == ['Node.js', 'React', 'Vitest']
+
+
+def test_requirements_txt():
+    text = "# comment\n-r base.txt\nFlask==3.0\nnumpy>=1.26 ; python_version>'3.8'\n\n"
+    result = parse_manifest('requirements.txt', text)
+    assert result['dependencies'] == ['Flask', 'numpy']
+    assert result['frameworks'] == ['Flask', 'NumPy', 'Python']
+
+
+def test_pyproject():
+    result = parse_manifest('pyproject.toml', PYPROJECT)
+    assert result['name'] == 'demo'
+    assert result['dependencies'] == ['Django', 'requests', 'pytest']
+    assert 'Django' in result['frameworks']
+
+
+def test_toml_subset_matches_the_fields_we_read():
+    data = _parse_toml_subset(PYPROJECT)
+    assert data['project']['name'] == 'demo'
+    assert data['project']['dependencies'] == ['Django>=4.2', 'requests']
+    assert data['project']['optional-dependencies']['test'] == ['pytest>=7']
+
+
+def test_cargo_workspace():
+    text = '[workspace]\nmembers = ["crates/*"]\n\n[workspace.dependencies]\ntokio = "1"\n'
+    result = parse_manifest('cargo.toml', text)
+    assert result['workspaces'] == ['crates/*']
+    assert result['frameworks'] == ['Rust', 'Tokio']
+
+
+def test_go_mod_and_go_work():
+    go_mod = ("module example.com/app\n\ngo 1.22\n\nrequire (\n"
+              "\tgithub.com/gin-gonic/gin v1.9.1\n\tgolang.org/x/text v0.14.0 // indirect\n)\n")
+    result = parse_manifest('go.mod', go_mod)
+    assert result['name'] == 'example.com/app'
+    assert result['dependencies'] == ['github.com/gin-gonic/gin', 'golang.org/x/text']
+    assert 'Gin' in result['frameworks']
+    
+    go_work = "go 1.22\n\nuse (\n\t./api\n\t./tools/\n)\n"
+    assert parse_manifest('go.work', go_work)['workspaces'] == ['./api', './tools']
+
+
+def test_pnpm_workspace():
+    text = "packages:\n  - 'packages/*'\n  - \"!**/test/**\"\ncatalog:\n  - ignored\n"
+    assert parse_manifest('pnpm-workspace.yaml', text)['workspaces'] == ['packages/*', '!**/test/**']
+
+
+def test_pom_with_namespace():
+    text = '''<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <artifactId>service</artifactId>
+  <parent><groupId>org.springframework.boot</groupId><artifactId>spring-boot-starter-parent</artifactId></parent>
+  <modules><module>core</module><module>web</module></modules>
+</project>'''
+    result = parse_manifest('pom.xml', text)
+    assert result['name'] == 'service'
+    assert result['workspaces'] == ['core', 'web']
+    assert 'Spring Boot' in result['frameworks']
+
+
+def test_gradle_and_gemfile():
+    gradle = "dependencies { implementation 'org.springframework.boot:spring-boot-starter-web:3.2.0' }"
+    assert 'Spring Boot' in parse_manifest('build.gradle', gradle)['frameworks']
+    assert parse_manifest('gemfile', "source 'x'\ngem 'rails', '~> 7'\n")['dependencies'] == ['rails']
+
+
+def test_broken_manifests_keep_the_ecosystem():
+    result = parse_manifest('package.json', '{not json')
+    assert result['dependencies'] == []
+    assert result['frameworks'] == ['Node.js']
+
+
+def test_cache_reuses_identical_content(tmp_path, entry_for):
+    first = tmp_path / 'a' / 'package.json'
+    second = tmp_path / 'b' / 'package.json'
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_text('{"name": "same"}')
+    cache = ManifestCache()
+    assert cache.get(entry_for(first), 'package.json')['name'] == 'same'
+    assert cache.get(entry_for(second), 'package.json')['name'] == 'same'
+    assert cache.get(entry_for(first), 'package.json')['name'] == 'same'
+    assert cache.parsed == 1
+    
+    first.write_text('{"name": "changed"}')
+    assert cache.get(entry_for(first), 'package.json')['name'] == 'changed'
+
+
+def test_cache_skips_oversized_manifests(tmp_path, entry_for):
+    path = tmp_path / 'package.json'
+    path.write_bytes(b' ' * (MAX_MANIFEST_BYTES + 1))
+    assert ManifestCache().get(entry_for(path), 'package.json') is None
@@ -0,0 +1,148 @@
+"""
+Tests for the project analyzer module
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from core.analysis.project_analyzer import ProjectAnalyzer
+from core.utils.cancellation import CancellationToken, OperationCancelled
+
+
+@pytest.fixture
+def project(tmp_path, make_tree):
+    root = tmp_path / 'project'
+    make_tree(root, {
+        'main.py': "import flask\n\ndef run():\n    pass\n",
+        'requirements.txt': "flask\n",
+        'web/app.ts': "export function start() {}\n",
+        'web/package.json': '{"name": "web", "dependencies": {"react": "18"}}',
+        'build/out.js': "generated\n"
+    })
+    return root
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = ProjectAnalyzer({'index_cache_dir': str(tmp_path / 'cache')})
+    yield analyzer
+    analyzer.shutdown()
+
+
+def test_analysis_of_a_small_project(analyzer, project):
+    info = analyzer.analyze_project(str(project))
+    assert info['file_count'] == 4
+    assert info['source'] == 'walk'
+    assert set(info['languages']) == {'Python', 'TypeScript', 'JSON'}
+    assert {'Flask', 'React'} <= set(info['frameworks'])
+    assert info['symbols']['external_imports'] == [['flask', 1]]
+    assert not info['truncated']
+
+
+def test_analysis_is_reused_until_the_tree_changes(analyzer, project):
+    first = analyzer.get_project_analysis(str(project))
+    assert analyzer.get_project_analysis(str(project)) is first
+    fingerprint = analyzer.project_fingerprint(str(project))
+    assert fingerprint == first['fingerprint']
+    
+    (project / 'web' / 'extra.ts').write_text("export const x = 1\n")
+    second = analyzer.get_project_analysis(str(project))
+    assert second is not first
+    assert second['file_count'] == 5
+    assert analyzer.project_fingerprint(str(project)) != fingerprint
+    assert second['fingerprint'] != fingerprint
+
+
+def test_analysis_is_redone_after_in_place_edits(analyzer, project):
+    for directory in (project, project / 'web', project / 'build'):
+        os.utime(str(directory), (1_000_000_000, 1_000_000_000))
+    first = analyzer.get_project_analysis(str(project))
+    assert analyzer.get_project_analysis(str(project)) is first
+    
+    # Neither the directory nor the file list changes
+    (project / 'main.py').write_text("import flask\n\ndef run():\n    pass\n\ndef stop():\n    pass\n")
+    second = analyzer.get_project_analysis(str(project))
+    assert second is not first
+    assert second['language_lines']['Python'] == first['language_lines']['Python'] + 3
+    assert second['language_bytes']['Python'] > first['language_bytes']['Python']
+
+
+def test_budget_truncates_the_analysis(analyzer, project):
+    info = analyzer.analyze_project(str(project), max_files=1)
+    assert info['truncated']
+    assert info['file_count'] == 1
+    assert info['estimated_file_count'] >= 1
+
+
+def test_cancelled_analysis_raises(analyzer, project):
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(OperationCancelled):
+        analyzer.analyze_project(str(project), cancel_token=token)
+
+
+def test_package_analysis_keeps_root_relative_paths(analyzer, project):
+    info = analyzer.analyze_project(str(project), include_files=True, package_path='web/')
+    assert info['package_path'] == 'web'
+    assert sorted(info['files']) == ['web/app.ts', 'web/package.json']
+
+
+def test_fingerprint_sees_in_place_edits(analyzer, project):
+    # Old directory mtimes, so the index reuses its listings and their stale file sizes
+    for directory in (project, project / 'web', project / 'build'):
+        os.utime(str(directory), (1_000_000_000, 1_000_000_000))
+    first = analyzer.project_fingerprint(str(project))
+    assert analyzer.project_fingerprint(str(project)) == first
+    
+    (project / 'main.py').write_text("import flask\n")
+    second = analyzer.project_fingerprint(str(project))
+    assert second != first
+    assert analyzer.project_fingerprint(str(project), package_path='web') != second
+
+
+def test_line_counts_are_persisted_with_the_index(analyzer, project, tmp_path):
+    first = analyzer.analyze_project(str(project))
+    assert analyzer.line_counter.files_read > 0
+    
+    restarted = ProjectAnalyzer({'index_cache_dir': str(tmp_path / 'cache')})
+    try:
+        again = restarted.analyze_project(str(project))
+        assert restarted.line_counter.files_read == 0
+        assert again['languages'] == first['languages']
+    finally:
+        restarted.shutdown()
+
+
+def test_missing_project(analyzer, tmp_path):
+    assert analyzer.analyze_project(str(tmp_path / 'missing'))['file_count'] == 0
+    assert analyzer.project_fingerprint(str(tmp_path / 'missing')) is None
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+def test_git_index_analysis_matches_the_walk(analyzer, project):
+    subprocess.run(['git', 'init', '-q'], cwd=str(project), check=True)
+    subprocess.run(['git', 'add', 'main.py', 'web'], cwd=str(project), check=True)
+    
+    info = analyzer.analyze_project(str(project))
+    assert info['source'] == 'git-index'
+    walker = ProjectAnalyzer({'use_git_index': False, 'use_index_cache': False})
+    walked = walker.analyze_project(str(project))
+    assert walked['source'] == 'walk'
+    assert info['file_count'] == walked['file_count']
+    assert analyzer.project_fingerprint(str(project)) == walker.project_fingerprint(str(project))
+
+
+def test_worker_process_gives_the_same_analysis(project, tmp_path):
+    pooled = ProjectAnalyzer({'use_process_pool': True, 'index_cache_dir': str(tmp_path / 'pooled')})
+    try:
+        info = pooled.get_project_analysis(str(project))
+        # Still enabled, so the worker process answered
+        assert pooled.use_process_pool
+    finally:
+        pooled.shutdown()
+    local = ProjectAnalyzer({'use_index_cache': False}).get_project_analysis(str(project))
+    for key in ('file_count', 'languages', 'frameworks', 'fingerprint'):
+        assert info[key] == local[key]
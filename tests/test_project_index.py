@@ -0,0 +1,150 @@
+"""
+Tests for the project index module
+"""
+
+import json
+import os
+
+from core.analysis.project_index import (
+    INDEX_VERSION, IndexedEntry, IndexedStat, ProjectIndex, ProjectIndexCache, current_stat, entry_stat
+)
+from core.analysis.walker import ProjectWalker
+
+OLD_MTIME = 1_000_000_000
+
+
+def settle(path):
+    """Give a directory an old mtime so its record is outside the racy window"""
+    os.utime(str(path), (OLD_MTIME, OLD_MTIME))
+
+
+def names(entries):
+    return sorted((entry.name, entry.is_dir()) for entry in entries)
+
+
+def test_list_directory_reuses_unchanged_directories(tmp_path):
+    (tmp_path / 'a.txt').write_text('a')
+    (tmp_path / 'sub').mkdir()
+    settle(tmp_path)
+    index = ProjectIndex(str(tmp_path))
+    
+    assert names(index.list_directory(str(tmp_path), '')) == [('a.txt', False), ('sub', True)]
+    assert index.rescanned == 1
+    assert names(index.list_directory(str(tmp_path), '')) == [('a.txt', False), ('sub', True)]
+    assert index.reused == 1
+    
+    (tmp_path / 'b.txt').write_text('b')
+    settle(tmp_path)
+    os.utime(str(tmp_path), (OLD_MTIME + 1, OLD_MTIME + 1))
+    assert ('b.txt', False) in names(index.list_directory(str(tmp_path), ''))
+    assert index.rescanned == 2
+
+
+def test_recently_modified_directories_are_always_rescanned(tmp_path):
+    (tmp_path / 'a.txt').write_text('a')
+    index = ProjectIndex(str(tmp_path))
+    index.list_directory(str(tmp_path), '')
+    assert index.dirs['']['mtime'] == -1
+    index.list_directory(str(tmp_path), '')
+    assert index.rescanned == 2
+
+
+def test_trusted_index_skips_stat_unless_dirty(tmp_path):
+    (tmp_path / 'a.txt').write_text('a')
+    settle(tmp_path)
+    index = ProjectIndex(str(tmp_path))
+    index.list_directory(str(tmp_path), '')
+    index.trusted = True
+    
+    (tmp_path / 'b.txt').write_text('b')
+    assert names(index.list_directory(str(tmp_path), '')) == [('a.txt', False)]
+    index.mark_dirty([''])
+    assert names(index.list_directory(str(tmp_path), '')) == [('a.txt', False), ('b.txt', False)]
+
+
+def test_indexed_walk_matches_plain_walk_and_prunes(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/c/d.py', 'old/e.py'])
+    index = ProjectIndex(str(tmp_path))
+    plain = sorted(rel_path for rel_path, _ in ProjectWalker(str(tmp_path)).walk())
+    indexed = ProjectWalker(str(tmp_path), index=index)
+    assert sorted(rel_path for rel_path, _ in indexed.walk()) == plain
+    assert 'old' in index.dirs
+    
+    (tmp_path / 'old' / 'e.py').unlink()
+    (tmp_path / 'old').rmdir()
+    list(indexed.walk())
+    assert 'old' not in index.dirs
+
+
+def test_current_stat_reads_the_file_again(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('a')
+    entry = IndexedEntry('a.txt', str(path), False, IndexedStat(1, 0))
+    path.write_text('longer')
+    assert entry.stat().st_size == 1
+    assert current_stat(entry).st_size == len('longer')
+    with os.scandir(str(tmp_path)) as entries:
+        assert current_stat(next(entries)).st_size == len('longer')
+
+
+def test_entry_stat_trusts_only_trusted_entries(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('longer')
+    recorded = IndexedStat(1, 0)
+    assert entry_stat(IndexedEntry('a.txt', str(path), False, recorded, trusted=True)) is recorded
+    assert entry_stat(IndexedEntry('a.txt', str(path), False, recorded)).st_size == len('longer')
+
+
+def test_list_names_reuses_the_record(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.txt').write_text('a')
+    settle(tmp_path)
+    index = ProjectIndex(str(tmp_path))
+    assert index.list_names(str(tmp_path), '') == {'a.txt', 'sub'}
+    assert index.list_names(str(tmp_path), '') == {'a.txt', 'sub'}
+    assert (index.rescanned, index.reused) == (1, 1)
+
+
+def test_cache_round_trip_and_invalidate(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'a.txt').write_text('a')
+    cache_dir = str(tmp_path / 'cache')
+    
+    index = ProjectIndexCache(cache_dir).load(str(project))
+    index.list_directory(str(project), '')
+    index.line_counts['a.txt'] = [1, 2, 1]
+    assert ProjectIndexCache(cache_dir).save(index)
+    
+    loaded = ProjectIndexCache(cache_dir).load(str(project))
+    assert loaded.dirs == json.loads(json.dumps(index.dirs))
+    assert loaded.line_counts == {'a.txt': [1, 2, 1]}
+    
+    cache = ProjectIndexCache(cache_dir)
+    cache.invalidate(str(project))
+    assert cache.load(str(project)).dirs == {}
+
+
+def test_cache_ignores_other_versions(tmp_path):
+    cache = ProjectIndexCache(str(tmp_path))
+    index = ProjectIndex(str(tmp_path / 'project'), {'': {'mtime': 1, 'files': {}, 'subdirs': [], 'links': []}})
+    cache.save(index)
+    path = cache._index_path(index.root)
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['version'] = INDEX_VERSION - 1
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    assert ProjectIndexCache(str(tmp_path)).load(index.root).dirs == {}
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ProjectIndexCache(str(tmp_path), max_bytes=1)
+    first = ProjectIndex(str(tmp_path / 'first'))
+    second = ProjectIndex(str(tmp_path / 'second'))
+    cache.save(first)
+    os.utime(cache._index_path(first.root), (OLD_MTIME, OLD_MTIME))
+    cache.save(second)
+    # The index just saved is kept even over the limit
+    assert not os.path.exists(cache._index_path(first.root))
+    assert os.path.exists(cache._index_path(second.root))
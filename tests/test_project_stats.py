@@ -0,0 +1,109 @@
+"""
+Tests for the project stats module
+"""
+
+import json
+import os
+from collections import Counter
+
+from core.analysis.line_counter import LineCounter
+from core.analysis.project_stats import CompactPathList, ProjectStats
+from core.analysis.structure_summary import StructureSummary
+from core.analysis.walker import ProjectWalker
+
+
+def stats_of(root, **kwargs):
+    stats = ProjectStats(**kwargs)
+    for rel_path, entry in ProjectWalker(str(root)).walk():
+        stats.add_file(rel_path, entry)
+    return stats
+
+
+class NamedEntry:
+    """Walker entry stand-in for files that need not exist"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.path = os.path.join(os.sep, 'missing', name)
+    
+    def stat(self):
+        raise FileNotFoundError(self.path)
+
+
+def test_compact_path_list_round_trip():
+    paths = ['src/a.py', 'src/ab.py', 'src/b/c.py', 'zz', 'é/ü.txt', 'bad\udcff.txt', '']
+    compact = CompactPathList()
+    for path in paths:
+        compact.append(path)
+    assert len(compact) == len(paths)
+    assert compact.to_list() == paths
+    
+    long_paths = [f"project/very/long/shared/prefix/file{i}.py" for i in range(100)]
+    compact = CompactPathList()
+    for path in long_paths:
+        compact.append(path)
+    assert compact.to_list() == long_paths
+    assert compact.nbytes < sum(len(path) for path in long_paths) // 4
+
+
+def test_sample_is_bounded_and_reproducible():
+    def sample(seed):
+        stats = ProjectStats(sample_size=10, seed=seed)
+        for i in range(1000):
+            stats.add_file(f"f{i}.unknown", NamedEntry(f"f{i}.unknown"))
+        return stats.sample
+    
+    assert len(sample(1)) == 10
+    assert sample(1) == sample(1)
+
+
+def test_sample_covers_the_whole_walk():
+    # Every path has the same chance to be sampled, not just the first ones
+    hits = Counter()
+    for seed in range(200):
+        stats = ProjectStats(sample_size=5, seed=seed)
+        for i in range(50):
+            stats.add_file(f"f{i}", NamedEntry(f"f{i}"))
+        hits.update(int(path[1:]) // 10 for path in stats.sample)
+    assert min(hits.values()) > 100
+
+
+def test_symbol_sample_does_not_depend_on_walk_order(tmp_path, make_tree):
+    files = {f"m{i}.py": "x = 1\n" for i in range(30)}
+    make_tree(tmp_path, files)
+    entries = sorted(ProjectWalker(str(tmp_path)).walk())
+    
+    def symbol_paths(order):
+        stats = ProjectStats(symbol_sample_size=5)
+        for rel_path, entry in order:
+            stats.add_file(rel_path, entry)
+        return [rel_path for rel_path, _, _ in stats.symbol_files]
+    
+    assert len(symbol_paths(entries)) == 5
+    assert symbol_paths(entries) == symbol_paths(list(reversed(entries)))
+
+
+def test_update_project_info(tmp_path, make_tree):
+    make_tree(tmp_path, {
+        'app.py': "print(1)\n" * 30,
+        'web/index.js': "x\n" * 10,
+        'data.json': json.dumps({'x': 'y' * 1000}),
+        'requirements.txt': "flask\n",
+        'packages/a/package.json': '{"name": "a"}',
+        'packages/b/package.json': '{"name": "b"}'
+    })
+    stats = stats_of(tmp_path, keep_all_paths=True, line_counter=LineCounter(), structure=StructureSummary())
+    project_info = {}
+    stats.update_project_info(project_info)
+    
+    assert project_info['file_count'] == 6
+    assert project_info['languages'][0] == 'JSON'
+    assert 'JSON' not in project_info['language_share']
+    assert sum(project_info['language_share'].values()) == 100.0
+    assert project_info['language_lines']['Python'] == 30
+    assert project_info['frameworks'] == ['Flask', 'Node.js', 'Python']
+    assert [package['name'] for package in project_info['packages']] == ['a', 'b']
+    assert project_info['monorepo']
+    assert sorted(project_info['files']) == project_info['sample_files']
+    assert not project_info['files_sampled']
+    assert project_info['structure']['top_level'] == {'web': 1, 'packages': 2}
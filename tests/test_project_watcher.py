@@ -0,0 +1,122 @@
+"""
+Tests for the project watcher module
+"""
+
+import os
+import time
+
+import pytest
+
+from core.analysis import project_watcher
+from core.analysis.project_watcher import (
+    IN_CREATE, IN_IGNORED, IN_ISDIR, IN_MODIFY, IN_Q_OVERFLOW, ProjectWatcher, _EVENT_HEADER, _load_inotify
+)
+
+
+def event(wd, mask, name=b''):
+    """Bytes of one inotify_event, name padded like the kernel does"""
+    if name:
+        name += b'\0' * (16 - len(name) % 16)
+    return _EVENT_HEADER.pack(wd, mask, 0, len(name)) + name
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    (tmp_path / 'src').mkdir()
+    watcher = ProjectWatcher(str(tmp_path), coalesce_delay=0.05, max_coalesce_delay=0.2, rescan_interval=0.1)
+    yield watcher
+    watcher.stop()
+
+
+def feed(watcher, data):
+    """Make _read_events read data as if it came from the inotify descriptor"""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data)
+    os.close(write_fd)
+    watcher._fd = read_fd
+    try:
+        return watcher._read_events()
+    finally:
+        os.close(read_fd)
+        watcher._fd = -1
+
+
+def test_read_events_marks_watched_directories_dirty(watcher):
+    watcher._watches = {1: '', 2: 'src'}
+    assert feed(watcher, event(2, IN_MODIFY, b'app.py') + event(9, IN_MODIFY, b'x'))
+    assert watcher._pending == {'src'}
+    
+    watcher.flush()
+    assert watcher.index.dirty == {'src'}
+    assert watcher.version == 1
+    assert watcher._pending == set()
+
+
+def test_read_events_drops_ignored_watches(watcher):
+    watcher._watches = {1: '', 2: 'src'}
+    assert not feed(watcher, event(2, IN_IGNORED))
+    assert watcher._watches == {1: ''}
+
+
+def test_read_events_watches_new_directories(watcher, tmp_path):
+    (tmp_path / 'src' / 'new' / 'deep').mkdir(parents=True)
+    added = []
+    watcher._add_watch = added.append
+    watcher._watches = {2: 'src'}
+    feed(watcher, event(2, IN_CREATE | IN_ISDIR, b'new'))
+    assert sorted(added) == ['src/new', 'src/new/deep']
+    
+    added.clear()
+    feed(watcher, event(2, IN_CREATE | IN_ISDIR, b'node_modules'))
+    assert added == []
+
+
+def test_queue_overflow_marks_everything_dirty(watcher):
+    watcher.index.dirs = {'': {}, 'src': {}}
+    assert feed(watcher, event(-1, IN_Q_OVERFLOW))
+    assert watcher.index.dirty == {'', 'src'}
+
+
+def test_polling_fallback_notices_changes(watcher, tmp_path):
+    watcher._libc = None
+    watcher.start()
+    assert wait_for(lambda: watcher.mode == 'polling')
+    version = watcher.version
+    time.sleep(0.05)
+    (tmp_path / 'src' / 'added.py').write_text('x')
+    assert wait_for(lambda: watcher.version > version)
+    assert not watcher.index.trusted
+
+
+@pytest.mark.skipif(_load_inotify() is None, reason="inotify is not available")
+def test_inotify_marks_changed_directories(watcher, tmp_path):
+    watcher.start()
+    assert wait_for(lambda: watcher.is_live)
+    assert watcher.index.trusted
+    version = watcher.version
+    
+    (tmp_path / 'src' / 'added.py').write_text('x')
+    assert wait_for(lambda: watcher.version > version)
+    assert 'src' in watcher.index.dirty
+    
+    # Directories created after start are watched too
+    (tmp_path / 'src' / 'pkg').mkdir()
+    assert wait_for(lambda: 'src/pkg' in watcher._watches.values())
+    
+    watcher.stop()
+    assert watcher.mode == 'stopped'
+    assert not watcher.index.trusted
+
+
+def test_load_inotify_is_none_off_linux(monkeypatch):
+    monkeypatch.setattr(project_watcher.sys, 'platform', 'darwin')
+    assert _load_inotify() is None
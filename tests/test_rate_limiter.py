@@ -0,0 +1,106 @@
+"""
+Tests for the rate limiter module
+"""
+
+import threading
+from types import SimpleNamespace
+
+from core.generators import rate_limiter
+from core.generators.rate_limiter import RateLimiter, RetryBudget, RetryPolicy, TokenBucket, estimate_tokens
+
+
+def test_estimate_tokens():
+    assert estimate_tokens('') == 1
+    assert estimate_tokens('a' * 400) == 100
+
+
+def test_unlimited_bucket_never_waits():
+    bucket = TokenBucket(0)
+    assert bucket.unlimited
+    assert all(bucket.reserve() == 0 for _ in range(1000))
+
+
+def test_concurrent_requests_within_quota_do_not_wait():
+    limiter = RateLimiter(requests_per_minute=10)
+    waits = []
+    
+    def request():
+        waits.append(limiter.reserve(prompt_tokens=100))
+    
+    threads = [threading.Thread(target=request) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert waits == [0, 0]
+
+
+def test_requests_wait_once_the_burst_is_spent():
+    bucket = TokenBucket(10)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # The other 7.5 requests of the quota refill over the minute, one every
+    # 8 seconds, and reservations queue up behind each other
+    assert 3.9 < bucket.reserve() <= 4.0
+    assert 11.9 < bucket.reserve() <= 12.0
+
+
+def test_explicit_burst_is_capped_at_half_the_quota():
+    assert TokenBucket(10, burst=2).burst == 2
+    assert TokenBucket(10, burst=50).burst == 5
+
+
+def test_no_sliding_window_grants_more_than_the_quota(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(rate_limiter, 'time', SimpleNamespace(monotonic=lambda: clock[0]))
+    for per_minute, burst in ((10, None), (10, 5), (3, None), (600, None)):
+        bucket = TokenBucket(per_minute, burst)
+        # A greedy caller that always uses its reservation as soon as it may
+        grants = []
+        end = clock[0] + 300
+        while clock[0] < end:
+            clock[0] += bucket.reserve()
+            grants.append(clock[0])
+        for start in grants:
+            in_window = sum(1 for grant in grants if start <= grant <= start + 60)
+            assert in_window <= per_minute
+        # Past the first burst, requests are granted at the refill rate
+        assert len(grants) >= bucket.burst + (per_minute - bucket.burst) * 5
+
+
+def test_charge_delays_later_reservations():
+    bucket = TokenBucket(600)
+    bucket.charge(150)
+    # 450 tokens refill per minute once the burst of 150 is spent
+    assert 0.13 < bucket.reserve() <= 0.134
+
+
+def test_limited_after_unlimited_starts_full():
+    bucket = TokenBucket(0)
+    bucket.configure(10)
+    assert bucket.reserve() == 0
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, capacity=2)
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+
+def test_retry_delay_stays_within_bounds():
+    policy = RetryPolicy(base_delay=1.0, max_delay=8.0, seed=1)
+    for attempt in range(10):
+        assert 0 <= policy.delay(attempt) <= min(8.0, 2 ** attempt)
+    assert policy.delay(0, retry_after=5.0) >= 5.0
+    assert policy.delay(0, retry_after=100.0) <= 8.0
+
+
+def test_should_retry_stops_at_max_retries():
+    policy = RetryPolicy(max_retries=2, budget=RetryBudget(capacity=10))
+    assert policy.should_retry(0)
+    assert policy.should_retry(1)
+    assert not policy.should_retry(2)
@@ -0,0 +1,84 @@
+"""
+Tests for the response cache module
+"""
+
+import os
+import time
+
+from core.generators.response_cache import STALE_TEMP_SECONDS, ResponseCache
+
+
+def test_put_and_get(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = ResponseCache.make_key('model', 'prompt')
+    assert cache.get(key) is None
+    assert cache.put(key, 'response', 'model')
+    assert cache.get(key) == 'response'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_depends_on_model_prompt_and_params():
+    key = ResponseCache.make_key('model', 'prompt', {'temperature': 0.5})
+    assert key == ResponseCache.make_key('model', 'prompt', {'temperature': 0.5})
+    assert key != ResponseCache.make_key('model', 'prompt', {'temperature': 0.7})
+    assert key != ResponseCache.make_key('other', 'prompt', {'temperature': 0.5})
+    assert key != ResponseCache.make_key('model', 'other', {'temperature': 0.5})
+
+
+def test_expired_entries_are_missing(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60)
+    key = ResponseCache.make_key('model', 'prompt')
+    cache.put(key, 'response')
+    cache.ttl_seconds = -1
+    assert cache.get(key) is None
+    assert not os.listdir(tmp_path)
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=10 ** 6)
+    keys = [ResponseCache.make_key('model', str(i)) for i in range(3)]
+    for age, key in enumerate(keys):
+        cache.put(key, 'x' * 1000)
+        # Oldest first: keys[0] was used longest ago
+        past = time.time() - 100 + age
+        os.utime(os.path.join(str(tmp_path), f"{key}.json"), (past, past))
+    
+    cache.max_bytes = 2500
+    cache.evict()
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == 'x' * 1000
+    assert cache.get(keys[2]) == 'x' * 1000
+
+
+def test_eviction_removes_stale_temp_files(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    stale = tmp_path / 'abc.json.1.2.tmp'
+    fresh = tmp_path / 'def.json.1.3.tmp'
+    stale.write_text('x' * 100)
+    fresh.write_text('x' * 100)
+    past = time.time() - STALE_TEMP_SECONDS - 10
+    os.utime(str(stale), (past, past))
+    
+    cache.put(ResponseCache.make_key('model', 'prompt'), 'response')
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_temp_files_count_towards_the_size_limit(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=2000)
+    key = ResponseCache.make_key('model', 'old')
+    cache.put(key, 'x' * 500)
+    past = time.time() - 100
+    os.utime(os.path.join(str(tmp_path), f"{key}.json"), (past, past))
+    (tmp_path / 'def.json.1.3.tmp').write_text('x' * 1500)
+    
+    cache.put(ResponseCache.make_key('model', 'new'), 'y' * 100)
+    assert cache.get(key) is None
+
+
+def test_clear_removes_everything(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(ResponseCache.make_key('model', 'prompt'), 'response')
+    (tmp_path / 'def.json.1.3.tmp').write_text('x')
+    cache.clear()
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,61 @@
+"""
+Tests for the stream parser module
+"""
+
+import json
+
+from core.generators.stream_parser import JsonItemStream
+
+RULES = [
+    {'title': 'Braces {in} strings', 'rules': ['a "quoted" ] bracket', 'b']},
+    {'title': 'Nested', 'meta': {'depth': [1, {'two': 2}]}},
+    {'title': 'Escapes \\ and é'}
+]
+
+
+def response(data):
+    return "Here you go:\n```json\n" + json.dumps(data, ensure_ascii=False, indent=2) + "\n```\nDone."
+
+
+def feed_in_chunks(stream, text, size):
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(stream.feed(text[start:start + size]))
+    return items
+
+
+def test_whole_response_at_once():
+    stream = JsonItemStream('rules')
+    assert stream.feed(response({'rules': RULES})) == RULES
+    assert stream.items == RULES
+
+
+def test_items_arrive_as_they_complete():
+    text = response({'rules': RULES})
+    for size in (1, 2, 7, 64):
+        assert feed_in_chunks(JsonItemStream('rules'), text, size) == RULES
+
+
+def test_item_is_reported_once_its_brace_arrives():
+    text = response({'rules': RULES})
+    # Items are indented by four spaces, their closing brace too
+    first_end = text.index('\n    }') + len('\n    }')
+    stream = JsonItemStream('rules')
+    assert stream.feed(text[:first_end - 1]) == []
+    assert stream.feed(text[first_end - 1:first_end]) == [RULES[0]]
+
+
+def test_only_the_array_under_the_key_is_read():
+    data = {'notes': [{'title': 'not a rule'}], 'rules': RULES[:1], 'workflows': [{'title': 'w'}]}
+    assert JsonItemStream('rules').feed(response(data)) == RULES[:1]
+    assert JsonItemStream('workflows').feed(response(data)) == [{'title': 'w'}]
+
+
+def test_key_inside_a_nested_object_is_not_the_array():
+    data = {'meta': {'rules': [{'title': 'nested'}]}, 'rules': [{'title': 'top'}]}
+    assert JsonItemStream('rules').feed(json.dumps(data)) == [{'title': 'top'}]
+
+
+def test_non_object_items_and_missing_key():
+    assert JsonItemStream('rules').feed(json.dumps({'rules': ['text', 1, {'title': 'ok'}]})) == [{'title': 'ok'}]
+    assert JsonItemStream('rules').feed('no json here') == []
@@ -0,0 +1,55 @@
+"""
+Tests for the structure summary module
+"""
+
+from core.analysis.structure_summary import StructureSummary, file_kind
+
+
+def summary_of(paths, **kwargs):
+    summary = StructureSummary(**kwargs)
+    for rel_path in paths:
+        summary.add_file(rel_path)
+    return summary
+
+
+def test_file_kind():
+    assert file_kind('App.TSX') == '*.tsx'
+    assert file_kind('Makefile') == 'Makefile'
+    assert file_kind('.gitignore') == '.gitignore'
+
+
+def test_render_lists_directories_and_root_files():
+    summary = summary_of(['README.md', 'setup.py', 'src/a.py', 'src/b.py', 'docs/index.md'])
+    assert summary.render() == (
+        "src/ (2 files: *.py ×2)\n"
+        "docs/ (1 file: *.md ×1)\n"
+        "README.md, setup.py"
+    )
+
+
+def test_single_child_chains_are_joined():
+    summary = summary_of(['src/main/java/com/example/App.java', 'src/main/java/com/example/Util.java'])
+    assert summary.render() == "src/main/java/com/example/ (2 files: *.java ×2)"
+
+
+def test_repetitive_subtrees_collapse_to_a_pattern():
+    paths = [f"components/c{i}/View.tsx" for i in range(20)] + ['components/c0/notes.md']
+    assert summary_of(paths).render() == "components/**/*.tsx ×20 (+1 other)"
+
+
+def test_fan_out_and_character_budgets():
+    paths = [f"dir{i}/f.txt" for i in range(12)]
+    text = summary_of(paths, max_children=3).render()
+    assert text.splitlines()[-1] == "… +9 dirs (9 files)"
+    
+    text = summary_of(paths, max_chars=40).render()
+    assert len(text) <= 40
+    assert text.endswith('…')
+
+
+def test_node_limit_counts_deeper_files_on_the_ancestor():
+    summary = summary_of(['a/x.py', 'b/y.py', 'c/z.py'], max_nodes=2)
+    data = summary.to_dict()
+    assert data['directories'] == 1
+    assert data['top_level'] == {'a': 1}
+    assert summary.root.total == 3
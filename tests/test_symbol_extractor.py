@@ -0,0 +1,139 @@
+"""
+Tests for the symbol extractor module
+"""
+
+import os
+import sys
+
+import pytest
+
+from core.analysis.symbol_extractor import (
+    SymbolExtractor, classify_import, extract_go, extract_javascript, extract_python, summarize_symbols
+)
+
+needs_stdlib_names = pytest.mark.skipif(not hasattr(sys, 'stdlib_module_names'),
+                                        reason="standard library names need Python 3.10")
+
+
+def test_extract_python():
+    text = (
+        "import os, json\n"
+        "from . import utils\n"
+        "from ..core.models import User\n"
+        "class Service:\n"
+        "    def method(self):\n"
+        "        import requests\n"
+        "def run(): pass\n"
+        "async def fetch(): pass\n"
+        "def _helper(): pass\n"
+    )
+    result = extract_python(text)
+    assert result['definitions'] == ['Service', 'run', 'fetch']
+    assert sorted(result['imports']) == ['.', '..core.models', 'json', 'os', 'requests']
+
+
+def test_extract_python_ignores_syntax_errors():
+    assert extract_python("def broken(:\n") == {'definitions': [], 'imports': []}
+
+
+def test_extract_javascript():
+    text = (
+        "import React, { useState } from 'react';\n"
+        "import './styles.css';\n"
+        "export { helper } from \"./helper\";\n"
+        "const lodash = require('lodash');\n"
+        "const page = await import('./page');\n"
+        "export default function App() {}\n"
+        "export interface Props {}\n"
+        "const _private = 1;\n"
+        "  function nested() {}\n"
+    )
+    result = extract_javascript(text)
+    assert result['definitions'] == ['lodash', 'page', 'App', 'Props']
+    assert result['imports'] == ['react', './styles.css', './helper', 'lodash', './page']
+
+
+def test_extract_go():
+    text = (
+        'package main\n\n'
+        'import "fmt"\n'
+        'import (\n\tlog "github.com/sirupsen/logrus"\n\t"example.com/app/internal/db"\n)\n\n'
+        'type Server struct{}\n'
+        'func (s *Server) Start() {}\n'
+        'func main() {}\n'
+    )
+    result = extract_go(text)
+    assert result['definitions'] == ['Server', 'Start', 'main']
+    assert result['imports'] == ['fmt', 'github.com/sirupsen/logrus', 'example.com/app/internal/db']
+
+
+@needs_stdlib_names
+def test_classify_python_imports():
+    assert classify_import('Python', 'os.path', 'app/main.py') is None
+    assert classify_import('Python', 'django.db', 'app/main.py') == ('django', False)
+    assert classify_import('Python', 'app.models', 'app/main.py', frozenset({'app'})) == ('app/models', True)
+    assert classify_import('Python', '.models', 'app/views/main.py') == ('app/views/models', True)
+    assert classify_import('Python', '..models', 'app/views/main.py') == ('app/models', True)
+
+
+def test_classify_javascript_and_go_imports():
+    assert classify_import('TypeScript', './Button.tsx', 'src/ui/index.ts') == ('src/ui/Button', True)
+    assert classify_import('JavaScript', '../lib/index.js', 'src/ui/a.js') == ('src/lib', True)
+    assert classify_import('JavaScript', '@scope/pkg/sub', 'a.js') == ('@scope/pkg', False)
+    assert classify_import('JavaScript', 'node:fs', 'a.js') is None
+    assert classify_import('Go', 'fmt', 'main.go') is None
+    assert classify_import('Go', 'example.com/app/db', 'main.go', go_modules=('example.com/app',)) == ('db', True)
+    assert classify_import('Go', 'github.com/x/y', 'main.go') == ('github.com/x/y', False)
+
+
+def test_extractor_caches_by_content(tmp_path, entry_for):
+    first = tmp_path / 'a.py'
+    second = tmp_path / 'b.py'
+    first.write_text("def run(): pass\n")
+    second.write_text("def run(): pass\n")
+    extractor = SymbolExtractor(workers=2)
+    results = extractor.extract_many([
+        ('a.py', entry_for(first), 'Python'),
+        ('b.py', entry_for(second), 'Python'),
+        ('c.rb', entry_for(first), 'Ruby')
+    ])
+    assert sorted(results) == ['a.py', 'b.py']
+    assert results['a.py']['definitions'] == ['run']
+    assert extractor.parsed == 1
+
+
+def test_extract_many_stays_consistent_while_the_cache_is_cleared(tmp_path, entry_for):
+    files = []
+    for i in range(200):
+        path = tmp_path / f"m{i}.py"
+        path.write_text(f"def f{i}(): pass\n")
+        files.append((path.name, entry_for(path), 'Python'))
+    extractor = SymbolExtractor(workers=8, max_entries=7)
+    for _ in range(3):
+        results = extractor.extract_many(files)
+        assert {rel_path: result['definitions'] for rel_path, result in results.items()} == {
+            f"m{i}.py": [f"f{i}"] for i in range(200)
+        }
+        assert len(extractor._by_hash) <= 7
+
+
+def test_extract_many_honours_should_stop(tmp_path, entry_for):
+    path = tmp_path / 'a.py'
+    path.write_text("def run(): pass\n")
+    files = [('a.py', entry_for(path), 'Python')]
+    assert SymbolExtractor(workers=1).extract_many(files, should_stop=lambda: True) == {}
+
+
+@needs_stdlib_names
+def test_summarize_symbols():
+    files = [('src/app/main.py', 'Python'), ('src/app/models.py', 'Python'), ('web/a.ts', 'TypeScript')]
+    results = {
+        'src/app/main.py': {'definitions': ['main'], 'imports': ['os', 'flask', 'app.models']},
+        'src/app/models.py': {'definitions': ['User', 'Group'], 'imports': ['flask', 'sqlalchemy']},
+        'web/a.ts': {'definitions': [], 'imports': ['react', './b']}
+    }
+    summary = summarize_symbols(files, results)
+    assert summary['files_parsed'] == 3
+    assert [module['path'] for module in summary['modules']] == ['src/app/models.py', 'src/app/main.py']
+    assert summary['external_imports'] == [['flask', 2], ['react', 1], ['sqlalchemy', 1]]
+    assert summary['internal_imports'] == [['app/models', 1], ['web/b', 1]]
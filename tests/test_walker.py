@@ -0,0 +1,165 @@
+"""
+Tests for the project walker module
+"""
+
+import os
+
+import pytest
+
+from core.analysis.project_index import ProjectIndex, entry_stat
+from core.analysis.walker import SKIP_SYMLINK, ProjectWalker
+
+OLD_MTIME = 1_000_000_000
+
+
+def walked(walker, **kwargs):
+    return sorted(rel_path for rel_path, _ in walker.walk(**kwargs))
+
+
+def tracked_tuple(root, paths):
+    """What GitIndexReader.tracked_files returns for a repository tracking paths"""
+    entries = []
+    for rel_path in sorted(paths):
+        stat = os.stat(os.path.join(str(root), *rel_path.split('/')))
+        entries.append((rel_path, stat.st_size, stat.st_mtime_ns, stat.st_ino))
+    return str(root / '.git' / 'index'), '', entries
+
+
+def test_walk_skips_hidden_excluded_and_ignored(tmp_path, make_tree):
+    make_tree(tmp_path, [
+        'README.md', 'src/app.py', 'src/app.log', '.hidden/x.py', 'node_modules/pkg/index.js',
+        'out/bundle.js', '.gitignore'
+    ])
+    (tmp_path / '.gitignore').write_text("*.log\nout/\n")
+    walker = ProjectWalker(str(tmp_path))
+    assert walked(walker) == ['README.md', 'src/app.py']
+    assert walker.completed
+    assert sorted(walker.visited_dirs) == ['', 'src']
+
+
+def test_walk_options_include_hidden_and_ignored(tmp_path, make_tree):
+    make_tree(tmp_path, ['.env', 'build/out.txt', 'a.log'])
+    (tmp_path / '.gitignore').write_text("*.log\n")
+    walker = ProjectWalker(str(tmp_path), excluded_dirs=(), include_hidden=True, use_ignore_files=False)
+    assert walked(walker) == ['.env', '.gitignore', 'a.log', 'build/out.txt']
+
+
+def test_walk_start_dir_keeps_ancestor_ignore_rules(tmp_path, make_tree):
+    make_tree(tmp_path, ['src/a.py', 'src/a.tmp', 'src/sub/b.py', 'docs/c.md'])
+    (tmp_path / '.gitignore').write_text("*.tmp\n")
+    walker = ProjectWalker(str(tmp_path))
+    assert walked(walker, start_dir='src') == ['src/a.py', 'src/sub/b.py']
+    assert walked(walker, start_dir='missing') == []
+
+
+def test_parallel_walk_finds_the_same_files(tmp_path, make_tree):
+    paths = [f"d{i}/e{j}/f.txt" for i in range(6) for j in range(5)]
+    make_tree(tmp_path, paths)
+    walker = ProjectWalker(str(tmp_path))
+    assert walked(walker, workers=4, parallel_min_dirs=2) == sorted(paths)
+    assert walker.completed
+
+
+def test_should_stop_ends_the_walk_early(tmp_path, make_tree):
+    make_tree(tmp_path, [f"d{i}/f.txt" for i in range(5)])
+    walker = ProjectWalker(str(tmp_path))
+    calls = []
+    
+    def should_stop():
+        calls.append(1)
+        return len(calls) > 2
+    
+    assert len(walked(walker, should_stop=should_stop)) < 5
+    assert not walker.completed
+    assert walker.progress()[1] > 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="symlinks are not supported")
+def test_symlinked_directories_are_reported_or_followed_once(tmp_path, make_tree):
+    make_tree(tmp_path, ['real/f.txt'])
+    try:
+        os.symlink(str(tmp_path / 'real'), str(tmp_path / 'link'))
+        os.symlink(str(tmp_path), str(tmp_path / 'real' / 'loop'))
+    except OSError:
+        pytest.skip("cannot create symlinks")
+    
+    walker = ProjectWalker(str(tmp_path))
+    assert walked(walker) == ['real/f.txt']
+    assert {'path': 'link', 'reason': SKIP_SYMLINK} in walker.skip_report()['paths']
+    
+    # Every directory is entered once, so neither the alias nor the loop lists anything twice
+    walker = ProjectWalker(str(tmp_path), follow_symlinks=True)
+    assert len(walked(walker)) == 1
+
+
+def test_walk_tracked_lists_index_entries_without_statting(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py'])
+    tracked = tracked_tuple(tmp_path, ['a.py', 'src/b.py'])
+    walker = ProjectWalker(str(tmp_path))
+    files = dict(walker.walk_tracked(tracked))
+    assert sorted(files) == ['a.py', 'src/b.py']
+    assert files['a.py'].stat().st_size == len('a.py')
+    assert walker.completed
+    assert walker.state_files == [tracked[0]]
+
+
+def test_walk_tracked_drops_deleted_and_finds_untracked_files(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'gone.py', 'src/b.py', 'src/gone.py'])
+    tracked = tracked_tuple(tmp_path, ['a.py', 'gone.py', 'src/b.py', 'src/gone.py'])
+    os.remove(str(tmp_path / 'gone.py'))
+    os.remove(str(tmp_path / 'src' / 'gone.py'))
+    make_tree(tmp_path, ['new.py', 'src/new.py', 'fresh/deep/c.py', 'fresh/skip.log'])
+    (tmp_path / '.gitignore').write_text("*.log\n")
+    
+    walker = ProjectWalker(str(tmp_path))
+    assert sorted(rel_path for rel_path, _ in walker.walk_tracked(tracked)) == [
+        'a.py', 'fresh/deep/c.py', 'new.py', 'src/b.py', 'src/new.py'
+    ]
+    assert 'fresh/deep' in walker.visited_dirs
+
+
+def test_walk_tracked_filters_like_walk(tmp_path, make_tree):
+    paths = ['keep.py', 'gen/out.py', 'node_modules/x.js', '.hidden/y.py']
+    make_tree(tmp_path, paths)
+    (tmp_path / '.gitignore').write_text("gen/\n")
+    tracked = tracked_tuple(tmp_path, paths + ['.gitignore'])
+    walker = ProjectWalker(str(tmp_path))
+    assert sorted(rel_path for rel_path, _ in walker.walk_tracked(tracked)) == walked(ProjectWalker(str(tmp_path)))
+
+
+def test_walk_tracked_trusts_entries_older_than_the_index(tmp_path, make_tree):
+    make_tree(tmp_path, ['old.py', 'racy.py', '.git/index'])
+    os.utime(str(tmp_path / 'old.py'), ns=(10**18, 10**18))
+    os.utime(str(tmp_path / '.git' / 'index'), ns=(2 * 10**18, 2 * 10**18))
+    os.utime(str(tmp_path / 'racy.py'), ns=(2 * 10**18, 2 * 10**18))
+    tracked = tracked_tuple(tmp_path, ['old.py', 'racy.py'])
+    # Edited in place after the index was written
+    (tmp_path / 'old.py').write_text('edited')
+    (tmp_path / 'racy.py').write_text('edited')
+    
+    files = dict(ProjectWalker(str(tmp_path)).walk_tracked(tracked))
+    assert entry_stat(files['old.py']).st_size == len('old.py')
+    assert entry_stat(files['racy.py']).st_size == len('edited')
+
+
+def test_walk_tracked_lists_directories_from_the_index(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/new.py'])
+    os.utime(str(tmp_path / 'src'), (OLD_MTIME, OLD_MTIME))
+    os.utime(str(tmp_path), (OLD_MTIME, OLD_MTIME))
+    tracked = tracked_tuple(tmp_path, ['a.py', 'src/b.py'])
+    index = ProjectIndex(str(tmp_path))
+    walker = ProjectWalker(str(tmp_path), index=index)
+    assert sorted(rel_path for rel_path, _ in walker.walk_tracked(tracked)) == ['a.py', 'src/b.py', 'src/new.py']
+    
+    index.begin_walk()
+    assert sorted(rel_path for rel_path, _ in walker.walk_tracked(tracked)) == ['a.py', 'src/b.py', 'src/new.py']
+    assert index.rescanned == 0
+
+
+def test_walk_tracked_start_dir(tmp_path, make_tree):
+    make_tree(tmp_path, ['a.py', 'src/b.py', 'src/c/d.py'])
+    tracked = tracked_tuple(tmp_path, ['a.py', 'src/b.py', 'src/c/d.py'])
+    walker = ProjectWalker(str(tmp_path))
+    assert sorted(rel_path for rel_path, _ in walker.walk_tracked(tracked, start_dir='src')) == [
+        'src/b.py', 'src/c/d.py'
+    ]
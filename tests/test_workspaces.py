@@ -0,0 +1,58 @@
+"""
+Tests for the workspaces module
+"""
+
+from core.analysis.workspaces import _member_regex, detect_packages
+
+
+def manifest(ecosystem, name=None, workspaces=()):
+    return {'ecosystem': ecosystem, 'name': name, 'dependencies': [], 'workspaces': list(workspaces),
+            'frameworks': [ecosystem]}
+
+
+def paths(packages):
+    return [package['path'] for package in packages]
+
+
+def test_member_regex():
+    assert _member_regex('./packages/*/', '') == r'packages/[^/]*'
+    assert _member_regex('apps/**', 'web') == r'web/apps/.*'
+    assert _member_regex('../outside', '') is None
+    assert _member_regex('.', '') is None
+
+
+def test_every_manifest_directory_is_a_package_without_declarations():
+    packages, declared = detect_packages([
+        ('package.json', manifest('Node.js', 'root')),
+        ('api/pyproject.toml', manifest('Python', 'api')),
+        ('web/package.json', manifest('Node.js')),
+        ('web/requirements.txt', manifest('Python'))
+    ])
+    assert not declared
+    assert paths(packages) == ['api', 'web']
+    assert packages[1]['name'] == 'web'
+    assert packages[1]['ecosystems'] == ['Node.js']
+
+
+def test_declared_members_drop_other_packages_of_the_ecosystem():
+    packages, declared = detect_packages([
+        ('package.json', manifest('Node.js', workspaces=['packages/*', '!packages/legacy'])),
+        ('packages/ui/package.json', manifest('Node.js', 'ui')),
+        ('packages/legacy/package.json', manifest('Node.js', 'legacy')),
+        ('fixtures/demo/package.json', manifest('Node.js', 'demo')),
+        ('tools/go.mod', manifest('Go', 'tools'))
+    ])
+    assert declared
+    assert paths(packages) == ['packages/ui', 'tools']
+    assert packages[0]['declared']
+    assert not packages[1]['declared']
+
+
+def test_base_dir_limits_declarations_to_the_analysed_directory():
+    packages, declared = detect_packages([
+        ('web/package.json', manifest('Node.js', workspaces=['apps/*'])),
+        ('web/apps/site/package.json', manifest('Node.js', 'site')),
+        ('web/examples/x/package.json', manifest('Node.js', 'x'))
+    ], base_dir='web')
+    assert declared
+    assert paths(packages) == ['web/apps/site']
@@ -5,7 +5,7 @@ Provides UI for generating rules and workflows using AI
 
 import os
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, 
     QTextEdit, QPushButton, QFileDialog, QMessageBox, QTextBrowser, 
@@ -16,6 +16,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QIcon, QFont
 
 from core.generators import AIGenerator, generate_rule_md, save_rule_file, generate_workflow_md, save_workflow_file
+from core.utils import CancellationToken, OperationCancelled
 
 class AIGenerationWorker(QThread):
     """Worker thread for AI generation to prevent UI freezing"""
@@ -23,15 +24,32 @@ class AIGenerationWorker(QThread):
     progress_updated = pyqtSignal(str)
     rules_generated = pyqtSignal(list)
     workflows_generated = pyqtSignal(list)
+    # ('rules' or 'workflows', item) for each item completed in a streamed response
+    item_streamed = pyqtSignal(str, dict)
     generation_finished = pyqtSignal(bool, str)
+    # Emitted instead of generating when the project matches previous_fingerprint
+    project_unchanged = pyqtSignal()
     
-    def __init__(self, ai_generator: AIGenerator, project_idea: str, project_path: str, generate_rules: bool, generate_workflows: bool):
+    def __init__(self, ai_generator: AIGenerator, project_idea: str, project_path: str, generate_rules: bool, generate_workflows: bool,
+                 per_package_rules: bool = False, package_concurrency: int = 4, stream_results: bool = False,
+                 previous_fingerprint: Optional[str] = None):
         super().__init__()
         self.ai_generator = ai_generator
         self.project_idea = project_idea
         self.project_path = project_path
         self.generate_rules = generate_rules
         self.generate_workflows = generate_workflows
+        self.per_package_rules = per_package_rules
+        self.package_concurrency = package_concurrency
+        self.stream_results = stream_results
+        self.previous_fingerprint = previous_fingerprint
+        self.cancel_token = CancellationToken()
+        # State of the project the generation was based on
+        self.fingerprint = None
+    
+    def cancel(self):
+        """Ask the running generation to stop as soon as possible"""
+        self.cancel_token.cancel()
     
     def run(self):
         """Run AI generation in background thread"""
@@ -39,18 +57,70 @@ class AIGenerationWorker(QThread):
             success = True
             message = "Generation completed successfully!"
             
-            if self.generate_rules:
-                self.progress_updated.emit("Analyzing project for rules generation...")
-                rules = self.ai_generator.generate_rules(self.project_idea, self.project_path)
+            # Analyze once and share the result between both generators
+            self.progress_updated.emit("Analyzing project...")
+            project_info = self.ai_generator.get_project_analysis(self.project_path, self.cancel_token)
+            self.fingerprint = project_info.get('fingerprint')
+            # Skip an API call that would only repeat the last generation, unless the user insists
+            if self.previous_fingerprint is not None and self.fingerprint == self.previous_fingerprint:
+                self.project_unchanged.emit()
+                return
+            if project_info.get('truncated'):
+                self.progress_updated.emit(
+                    f"Analysis budget reached - using partial results "
+                    f"(~{project_info.get('estimated_file_count', 0)} files estimated)"
+                )
+            
+            # Rules and workflows are requested together, each is shown as soon as it lands
+            if self.generate_rules and self.generate_workflows:
+                self.progress_updated.emit("Generating rules and workflows...")
+            else:
+                self.progress_updated.emit("Generating rules..." if self.generate_rules else "Generating workflows...")
+            
+            def result_landed(content_type, items):
+                if content_type == 'rules':
+                    self.rules_generated.emit(items)
+                else:
+                    self.workflows_generated.emit(items)
+                self.progress_updated.emit(f"Generated {len(items)} {content_type}")
+            
+            results, errors = self.ai_generator.run_async(self.ai_generator.generate_all_async(
+                self.project_idea, self.project_path, project_info,
+                self.generate_rules, self.generate_workflows, self.cancel_token, result_landed,
+                self.item_streamed.emit if self.stream_results else None
+            ))
+            
+            packages = project_info.get('packages', [])
+            if self.generate_rules and self.per_package_rules and project_info.get('monorepo') and packages:
+                self.progress_updated.emit(f"Generating rules for {len(packages)} packages...")
+                finished = []
+                
+                def package_done(package, package_rules):
+                    finished.append(package)
+                    self.progress_updated.emit(
+                        f"Rules for {package['name']}: {len(package_rules)} "
+                        f"({len(finished)}/{len(packages)} packages)"
+                    )
+                
+                package_rules, package_errors = self.ai_generator.generate_package_rules(
+                    self.project_idea, self.project_path, packages, self.cancel_token,
+                    self.package_concurrency, package_done
+                )
+                for path, error in package_errors.items():
+                    errors[f"rules for {path}"] = error
+                rules = results.get('rules', []) + package_rules
                 self.rules_generated.emit(rules)
                 self.progress_updated.emit(f"Generated {len(rules)} rules")
             
-            if self.generate_workflows:
-                self.progress_updated.emit("Analyzing project for workflow generation...")
-                workflows = self.ai_generator.generate_workflows(self.project_idea, self.project_path)
-                self.workflows_generated.emit(workflows)
-                self.progress_updated.emit(f"Generated {len(workflows)} workflows")
+            # Model calls that still failed after their retries leave empty results behind
+            if errors:
+                success = False
+                failures = '\n'.join(f"• {what}: {error}" for what, error in errors.items())
+                message = f"Generation incomplete - {len(errors)} model request(s) failed:\n{failures}"
             
+        except OperationCancelled:
+            success = False
+            message = "Generation cancelled."
         except Exception as e:
             success = False
             message = f"Generation failed: {str(e)}"
@@ -63,10 +133,17 @@ class AITab(QWidget):
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
-        self.ai_generator = AIGenerator()
+        self.ai_generator = AIGenerator(
+            analysis_settings=self.config_manager.get('analysis_settings', {}),
+            ai_settings=self.config_manager.get('ai_settings', {})
+        )
         self.generated_rules = []
         self.generated_workflows = []
+        # Items of the running generation's streamed responses, replaced by the final lists
+        self.streamed_items = {'rules': [], 'workflows': []}
         self.generation_worker = None
+        # (project path, idea, options, fingerprint) of the last successful generation
+        self.last_generation = None
         
         self.init_ui()
         self.check_ai_status()
@@ -152,6 +229,35 @@ class AITab(QWidget):
         self.generate_workflows_cb.setChecked(True)
         options_layout.addRow("", self.generate_workflows_cb)
         
+        self.per_package_rules_cb = QCheckBox("Per-package rules (monorepos)")
+        self.per_package_rules_cb.setToolTip(
+            "Also generate rules for each detected workspace package, scoped to its folder"
+        )
+        options_layout.addRow("", self.per_package_rules_cb)
+        
+        self.package_concurrency_spin = QSpinBox()
+        self.package_concurrency_spin.setRange(1, 16)
+        self.package_concurrency_spin.setValue(
+            int(self.config_manager.get('analysis_settings.package_concurrency', 4))
+        )
+        options_layout.addRow("Parallel Packages:", self.package_concurrency_spin)
+        
+        self.use_cached_responses_cb = QCheckBox("Reuse cached AI responses")
+        self.use_cached_responses_cb.setChecked(True)
+        self.use_cached_responses_cb.setToolTip(
+            "Answer repeated prompts from the local response cache instead of calling the API"
+        )
+        options_layout.addRow("", self.use_cached_responses_cb)
+        
+        self.stream_results_cb = QCheckBox("Stream results as they arrive")
+        self.stream_results_cb.setChecked(
+            bool(self.config_manager.get('ai_settings.stream_responses', True))
+        )
+        self.stream_results_cb.setToolTip(
+            "Show each rule and workflow as soon as the model has written it"
+        )
+        options_layout.addRow("", self.stream_results_cb)
+        
         self.max_rules_spin = QSpinBox()
         self.max_rules_spin.setRange(1, 20)
         self.max_rules_spin.setValue(5)
@@ -207,10 +313,16 @@ class AITab(QWidget):
         generate_icon_path = os.path.join("resources", "icons", "generate_button.svg")
         if os.path.exists(generate_icon_path):
             self.btn_generate.setIcon(QIcon(generate_icon_path))
-        self.btn_generate.clicked.connect(self.start_generation)
+        self.btn_generate.clicked.connect(lambda: self.start_generation())
         self.btn_generate.setEnabled(False)
         layout.addWidget(self.btn_generate)
         
+        # Cancel button (only visible while generating)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.cancel_generation)
+        self.btn_cancel.setVisible(False)
+        layout.addWidget(self.btn_cancel)
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -415,6 +527,11 @@ class AITab(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Select Project Folder")
         if folder:
             self.project_path.setText(folder)
+            if self.config_manager.get('analysis_settings.live_index', True):
+                try:
+                    self.ai_generator.watch_project(folder)
+                except Exception as e:
+                    print(f"Error starting project watcher: {e}")
             try:
                 self.check_ai_status()
             except Exception as e:
@@ -438,8 +555,13 @@ class AITab(QWidget):
         if folder:
             self.workflows_output_path.setText(folder)
     
-    def start_generation(self):
-        """Start AI generation process"""
+    def start_generation(self, regenerate_unchanged: bool = False):
+        """
+        Start AI generation process
+        
+        Args:
+            regenerate_unchanged (bool): Generate even if nothing changed since the last generation
+        """
         if not self.ai_generator.is_available():
             QMessageBox.warning(self, "AI Not Available", self.ai_generator.get_status_message())
             return
@@ -466,20 +588,36 @@ class AITab(QWidget):
             QMessageBox.warning(self, "No Options Selected", "Please select at least one generation option.")
             return
         
+        # The worker compares it with the analysis and asks before repeating the last generation
+        previous_fingerprint = None
+        options = (generate_rules, generate_workflows, self.per_package_rules_cb.isChecked())
+        if (not regenerate_unchanged and self.last_generation is not None
+                and self.last_generation[:3] == (project_path, project_idea, options)):
+            previous_fingerprint = self.last_generation[3]
+        
+        self.ai_generator.bypass_response_cache = not self.use_cached_responses_cb.isChecked()
+        
         # Start generation in background thread
         self.generation_worker = AIGenerationWorker(
             self.ai_generator, project_idea, project_path, 
-            generate_rules, generate_workflows
+            generate_rules, generate_workflows,
+            self.per_package_rules_cb.isChecked(), self.package_concurrency_spin.value(),
+            self.stream_results_cb.isChecked(), previous_fingerprint
         )
+        self.streamed_items = {'rules': [], 'workflows': []}
         
         # Connect signals
         self.generation_worker.progress_updated.connect(self.update_progress)
         self.generation_worker.rules_generated.connect(self.display_rules)
         self.generation_worker.workflows_generated.connect(self.display_workflows)
+        self.generation_worker.item_streamed.connect(self.display_streamed_item)
         self.generation_worker.generation_finished.connect(self.generation_completed)
+        self.generation_worker.project_unchanged.connect(self.confirm_unchanged_generation)
         
         # Update UI for generation state
         self.btn_generate.setEnabled(False)
+        self.btn_cancel.setVisible(True)
+        self.btn_cancel.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.progress_label.setVisible(True)
@@ -488,6 +626,29 @@ class AITab(QWidget):
         # Start the worker
         self.generation_worker.start()
     
+    def confirm_unchanged_generation(self):
+        """The worker found the project unchanged since the last generation: ask whether to repeat it"""
+        self.reset_generation_ui()
+        if self.generation_worker:
+            self.generation_worker.deleteLater()
+            self.generation_worker = None
+        
+        reply = QMessageBox.question(
+            self, "Project Unchanged",
+            "No relevant files changed since the last generation for this project and idea.\n"
+            "Generate again anyway?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.start_generation(regenerate_unchanged=True)
+    
+    def cancel_generation(self):
+        """Cancel the running generation"""
+        if self.generation_worker:
+            self.generation_worker.cancel()
+            self.btn_cancel.setEnabled(False)
+            self.progress_label.setText("Cancelling...")
+    
     def update_progress(self, message: str):
         """Update progress message"""
         self.progress_label.setText(message)
@@ -523,6 +684,15 @@ class AITab(QWidget):
         self.btn_save_all_rules.setEnabled(True)
         self.btn_clear_rules.setEnabled(True)
     
+    def display_streamed_item(self, content_type: str, item: Dict):
+        """Show a rule or workflow that was just completed in a streamed response"""
+        items = self.streamed_items[content_type]
+        items.append(item)
+        if content_type == 'rules':
+            self.display_rules(list(items))
+        else:
+            self.display_workflows(list(items))
+    
     def display_workflows(self, workflows: List[Dict]):
         """Display generated workflows"""
         self.generated_workflows = workflows
@@ -550,15 +720,19 @@ class AITab(QWidget):
     
     def generation_completed(self, success: bool, message: str):
         """Handle generation completion"""
-        # Update UI
-        self.btn_generate.setEnabled(True)
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
+        self.reset_generation_ui()
+        
+        cancelled = bool(self.generation_worker and self.generation_worker.cancel_token.is_cancelled)
+        
+        if success and not cancelled and self.generation_worker:
+            worker = self.generation_worker
+            options = (worker.generate_rules, worker.generate_workflows, worker.per_package_rules)
+            self.last_generation = (worker.project_path, worker.project_idea, options, worker.fingerprint)
         
-        # Show result message
-        if success:
+        # Show result message (a cancelled run needs no dialog)
+        if success and not cancelled:
             QMessageBox.information(self, "Generation Complete", message)
-        else:
+        elif not cancelled:
             QMessageBox.critical(self, "Generation Failed", message)
         
         # Clean up worker
@@ -566,6 +740,13 @@ class AITab(QWidget):
             self.generation_worker.deleteLater()
             self.generation_worker = None
     
+    def reset_generation_ui(self):
+        """Leave the generation state of the controls"""
+        self.btn_generate.setEnabled(True)
+        self.btn_cancel.setVisible(False)
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+    
     def save_all_rules(self):
         """Save all generated rules"""
         if not self.generated_rules:
@@ -753,7 +753,7 @@ class SettingsDialog(QDialog):
                 return
             
             from core.generators.ai_generator import AIGenerator
-            ai_generator = AIGenerator()
+            ai_generator = AIGenerator(ai_settings=self.config_manager.get('ai_settings', {}))
             
             # Test the API key
             success = ai_generator.set_api_key(api_key)